@@ -1,15 +1,18 @@
 import logging
-from typing import List, Tuple, Optional, Any
+import threading
+from contextlib import contextmanager
+from typing import List, Tuple, Optional, Any, Iterator
 from dataclasses import dataclass
+from itertools import starmap
 from core.crawler_utils.utils import get_database
 from log.logger import logger
 
+import numpy as np
 import pandas as pd
-import pytz
 from datetime import datetime, timezone, timedelta
-from core.data_management import MarketDataFetcher
+from core.data_management import MarketDataFetcher, OhlcvArrays
 
-@dataclass
+@dataclass(slots=True)
 class SignalTweetUpstream:
     author_username: str
     winrate: float
@@ -20,7 +23,7 @@ class SignalTweetUpstream:
     action: Optional[str]
     message: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class SignalTweetDownstream:
     symbol: str
     side: str
@@ -30,52 +33,183 @@ class SignalTweetDownstream:
     sl_price: float | None 
     
 
+# PostgreSQL type OIDs of the two timestamp types, as reported in cursor.description
+_TIMESTAMP_OID: int = 1114  # timestamp without time zone
+_TIMESTAMPTZ_OID: int = 1184  # timestamp with time zone
+
+# Upstream tweet action -> order side
+_ACTION_MAP: dict[str, str] = {
+    "long": "buy",
+    "short": "sell",
+}
+
+
+class _ConnectionPool:
+    """
+    Small thread-safe pool around get_database().
+
+    Connections are handed back to the pool instead of being closed, so repeated signal polls
+    skip the TCP/TLS/auth handshake. A connection that raised is discarded rather than reused.
+    """
+
+    def __init__(self, max_idle: int = 4) -> None:
+        self._idle: list[Any] = []
+        self._max_idle: int = max_idle
+        self._lock: threading.Lock = threading.Lock()
+
+    def _checkout(self) -> Any:
+        with self._lock:
+            while self._idle:
+                db: Any = self._idle.pop()
+                # Skip connections the server or network closed while they sat in the pool
+                if not getattr(db, 'closed', False):
+                    return db
+        return get_database()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        db: Any = self._checkout()
+
+        try:
+            yield db
+        except Exception:
+            try:
+                db.rollback()
+            finally:
+                db.close()
+            raise
+
+        try:
+            # End the read transaction so the pooled connection does not sit idle in transaction
+            db.rollback()
+        except Exception as e:
+            logger.warning("Discarding database connection that failed to reset: %s", e)
+            db.close()
+            return
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(db)
+                return
+        db.close()
+
+    def close_all(self) -> None:
+        """
+        Closes every idle connection. The pool stays usable: connections checked out now, and ones
+        opened later, are pooled again on release.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for db in idle:
+            try:
+                db.close()
+            except Exception as e:
+                logger.warning("Error closing pooled database connection: %s", e)
+
+
+_db_pool: _ConnectionPool = _ConnectionPool()
+
+
+def _atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """
+    Computes the last ATR value from contiguous float64 high/low/close buffers.
+
+    True Range and Wilder smoothing (ewm with adjust=False, min_periods=period) are fused:
+    the first candle has no previous close, so TR starts at index 1 and seeds the smoothing.
+    Only the last value is needed, so the recursion is evaluated in closed form:
+    s_n = (1-a)^(n-1) * tr_0 + sum_k a * (1-a)^(n-1-k) * tr_k
+
+    Returns NaN if fewer than `period` True Range values are available.
+    """
+    prev_close: np.ndarray = close[:-1]
+    high_tail: np.ndarray = high[1:]
+    low_tail: np.ndarray = low[1:]
+    tr: np.ndarray = np.maximum(high_tail - low_tail,
+                                np.maximum(np.abs(high_tail - prev_close), np.abs(low_tail - prev_close)))
+    n: int = tr.shape[0]
+    if n < period:
+        return float('nan')
+    alpha: float = 1.0 / period
+    weights: np.ndarray = alpha * np.power(1.0 - alpha, np.arange(n - 1, -1, -1, dtype=np.float64))
+    weights[0] = (1.0 - alpha) ** (n - 1)
+    return float(np.dot(weights, tr))
+
+
 class SignalTweetAdapter:
 
     def __init__(self) -> None:
         self.author: list[str] = [
             "DELETED (internal query)",  
         ]
+        # The query text never changes between calls; the author list and the time window are bound
+        # parameters, so the server can reuse the parsed/planned statement.
+        # The author list is bound inside the inner query, as = ANY(%(authors)s) where its values used to be
+        # formatted in, so any LIMIT, ranking or aggregation in there still only sees these authors' tweets.
+        inner_query: str = """
+               "DELETED (internal query)"
+        """
+        # Time zone contract of tweet_created_at: the column is either timestamptz, or a naive timestamp holding
+        # Asia/Bangkok wall-clock time (the convention the Python filter this replaced applied to naive values).
+        # The hour bounds are always bound as aware UTC datetimes; a naive column is first read as Bangkok time
+        # with AT TIME ZONE, so the session TimeZone never shifts the window. Which case applies is read from
+        # the column's type on the first query (see _created_at_is_naive).
+        window_query: str = """
+            SELECT * FROM ({inner}) AS upstream
+            WHERE {created_at} >= %(hour_start)s AND {created_at} < %(hour_end)s
+            ORDER BY upstream.winrate DESC
+        """
+        self._upstream_query_naive: str = window_query.format(
+            inner=inner_query, created_at="(upstream.tweet_created_at AT TIME ZONE 'Asia/Bangkok')")
+        self._upstream_query_aware: str = window_query.format(inner=inner_query, created_at="upstream.tweet_created_at")
+        self._created_at_probe_query: str = f"SELECT upstream.tweet_created_at FROM ({inner_query}) AS upstream LIMIT 0"
+        self._created_at_naive: bool | None = None  # Set by _created_at_is_naive on first use
+        # MarketDataFetcher is a singleton; keep a reference instead of re-constructing it per batch
+        self._market_data_fetcher: MarketDataFetcher = MarketDataFetcher()
 
-    def _query_signal_upstream(self) -> List[SignalTweetUpstream] | None:
-        query: str = f"""
-           "DELETED (internal query)"
+    def close(self) -> None:
+        """
+        Closes the idle pooled database connections. Connections are otherwise
+        kept open between get_signal() calls.
         """
+        _db_pool.close_all()
+
+    def _created_at_is_naive(self, cur: Any) -> bool:
+        """
+        Whether tweet_created_at is a naive timestamp (read as Asia/Bangkok time) rather than timestamptz.
+        Looked up once from the column type of a LIMIT 0 query; an unrecognized type is treated as naive,
+        like the Python filter this replaced did with naive values.
+        """
+        if self._created_at_naive is None:
+            cur.execute(self._created_at_probe_query, {'authors': self.author})
+            type_code: Any = cur.description[0][1]
+            if type_code not in (_TIMESTAMP_OID, _TIMESTAMPTZ_OID):
+                logger.warning("Unexpected type %s for tweet_created_at, reading it as naive Asia/Bangkok time.", type_code)
+            self._created_at_naive = type_code != _TIMESTAMPTZ_OID
+        return self._created_at_naive
+
+    def _query_signal_upstream(self) -> List[SignalTweetUpstream] | None:
+        # ---- Keep only tweets created within the current UTC hour ----
+        # The window is applied in SQL so the database can use its index on created_at and only
+        # in-window rows are transferred. The bounds are aware UTC datetimes; see the time zone
+        # contract in __init__ for how tweet_created_at is compared with them.
+        now_utc: datetime = datetime.now(timezone.utc)
+        hour_start_utc: datetime = now_utc.replace(minute=0, second=0, microsecond=0)
+        hour_end_utc: datetime = hour_start_utc + timedelta(hours=1)
 
-        db: Any = get_database()
         try:
-            with db.cursor() as cur:
-                cur.execute(query)
-                rows: List[Tuple[Any, ...]] = cur.fetchall()
-                # ---- Filter by UTC hour in Python ----
-                bangkok: Any = pytz.timezone('Asia/Bangkok')
-                now_utc: datetime = datetime.now(timezone.utc)
-                hour_start_utc: datetime = now_utc.replace(minute=0, second=0, microsecond=0)
-                hour_end_utc: datetime = hour_start_utc + timedelta(hours=1)
-                filtered_rows: list[tuple[Any, ...]] = []
-                for row in rows:
-                    tweet_created_at = row[4]  # Index 4 is tweet_created_at
-                    
-                    if tweet_created_at is None:
-                        continue
-                    
-                    # Ensure tweet_created_at is timezone-aware in Bangkok
-                    if tweet_created_at.tzinfo is None:
-                        
-                        tweet_created_at = bangkok.localize(tweet_created_at)
-                    tweet_created_at_utc: datetime = tweet_created_at.astimezone(timezone.utc)
-                    
-                    if hour_start_utc <= tweet_created_at_utc < hour_end_utc:
-                        filtered_rows.append(row)
-                return [SignalTweetUpstream(*row) for row in filtered_rows]
+            with _db_pool.connection() as db, db.cursor() as cur:
+                query: str = self._upstream_query_naive if self._created_at_is_naive(cur) else self._upstream_query_aware
+                cur.execute(query, {
+                    'authors': self.author,
+                    'hour_start': hour_start_utc,
+                    'hour_end': hour_end_utc,
+                })
+                # Rows are already filtered by SQL; build the dataclasses straight from the cursor
+                # instead of materializing an intermediate list of tuples with fetchall().
+                # The SELECT column order matches the SignalTweetUpstream field order.
+                return list(starmap(SignalTweetUpstream, cur))
         except Exception as e:
             logger.error(f"ERROR::_query_signal_upstream(): {e}") 
-            if db:
-                db.rollback()
             return []
-        finally:
-            if db:
-                db.close()
 
     @staticmethod
     def calculate_atr(df: pd.DataFrame, period: int = 20) -> float | None:
@@ -98,18 +232,41 @@ class SignalTweetAdapter:
         if not all(col in df.columns for col in ['high', 'low', 'close']):
             logger.error("Error: DataFrame must contain 'high', 'low', and 'close' columns.")
             return None
+
+        try:
+            high: np.ndarray = np.ascontiguousarray(df['high'].to_numpy(), dtype=np.float64)
+            low: np.ndarray = np.ascontiguousarray(df['low'].to_numpy(), dtype=np.float64)
+            close: np.ndarray = np.ascontiguousarray(df['close'].to_numpy(), dtype=np.float64)
+        except Exception as e:
+            logger.error(f"ERROR::calculate_atr(): {e}")
+            return None
+        return SignalTweetAdapter.calculate_atr_from_arrays(high, low, close, period)
+
+    @staticmethod
+    def calculate_atr_from_arrays(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 20) -> float | None:
+        """
+        Calculates the Average True Range (ATR) from contiguous float64 high/low/close arrays.
+
+        Args:
+            high (np.ndarray): High prices, oldest first.
+            low (np.ndarray): Low prices, oldest first.
+            close (np.ndarray): Close prices, oldest first.
+            period (int): The period (window) for ATR calculation. Defaults to 20.
+
+        Returns:
+            float: The last ATR value.
+                    Returns None if input is invalid or calculation fails.
+        """
         if not isinstance(period, int) or period <= 0:
             logger.error("Error: 'period' must be a positive integer.")
             return None
+        if close.shape[0] == 0:
+            logger.error("Error: OHLCV data is empty. Cannot calculate ATR.")
+            return None
 
         try:
-            high_low: pd.Series = df['high'] - df['low']
-            high_prev_close: pd.Series = abs(df['high'] - df['close'].shift(1))
-            low_prev_close: pd.Series = abs(df['low'] - df['close'].shift(1))
-            tr_components: pd.DataFrame = pd.concat([high_low, high_prev_close, low_prev_close], axis=1)
-            true_range: pd.Series = tr_components.max(axis=1, skipna=False)
-            atr: pd.Series = true_range.ewm(alpha=1/period, adjust=False, min_periods=period).mean()
-            return round(atr.iloc[-1], 2)
+            atr: float = _atr_kernel(high, low, close, period)
+            return round(atr, 2)
 
         except Exception as e:
             logger.error(f"ERROR::calculate_atr(): {e}")
@@ -128,8 +285,8 @@ class SignalTweetAdapter:
         Returns:
             List[SignalTweetDownstream]: List of downstream signals.
         """
-        market_data_fetcher = MarketDataFetcher()
         downstream_signals: List[SignalTweetDownstream] = []
+        tp_sl_candidates: List[Tuple[str, str]] = []  # (cleaned_ticker, action) pairs that still need OHLCV
 
         if not signal_tweets:
             logger.warning("No upstream signals provided. Returning empty downstream signals list.")
@@ -137,25 +294,21 @@ class SignalTweetAdapter:
         
         for signal_tweet in signal_tweets:
             if not signal_tweet.action:
-                logger.warning(f"Skipping signal due to missing or invalid action: {signal_tweet}")
+                logger.warning("Skipping signal due to missing or invalid action: %s", signal_tweet)
                 continue
-            
-            
-            action_map = {
-                "long": "buy",
-                "short": "sell",
-            }
-            normalized_action_input = signal_tweet.action.lower()
-            action = action_map.get(normalized_action_input)
+
+            action = _ACTION_MAP.get(signal_tweet.action.lower())
 
             if action is None:
                 # logger.warning(f"Unknown action '{signal_tweet.action}'. Skipping signal.")
                 continue  # Skip this signal_tweet and proceed with the next one
             if not signal_tweet.ticker:
-                logger.warning(f"Skipping signal due to missing ticker: {signal_tweet}")
+                logger.warning("Skipping signal due to missing ticker: %s", signal_tweet)
                 continue
-            logger.info(f"===========created_at: {signal_tweet.tweet_created_at}===============")
-            logger.info(f"signal_tweet: {signal_tweet}")
+            # %-style args are only formatted when INFO is enabled; the guard also skips the dataclass repr
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("===========created_at: %s===============", signal_tweet.tweet_created_at)
+                logger.info("signal_tweet: %s", signal_tweet)
             # Clean ticker format: BTCUSDT -> BTC/USDC:USDC
             cleaned_ticker = signal_tweet.ticker.replace('USDT', '/USDC:USDC')
 
@@ -172,10 +325,23 @@ class SignalTweetAdapter:
                 )
                 continue
 
-            ohlcv_df = market_data_fetcher.get_ohlcv_df(symbol=cleaned_ticker, timeframe=timeframe, limit=100)
+            tp_sl_candidates.append((cleaned_ticker, action))
+
+        if not tp_sl_candidates:
+            return downstream_signals
+
+        # Fetch OHLCV once per unique symbol (several authors often call the same coin in the same hour),
+        # and fetch all of them concurrently instead of one round-trip per signal
+        unique_tickers: List[str] = list(dict.fromkeys(cleaned_ticker for cleaned_ticker, _ in tp_sl_candidates))
+        ohlcv_by_ticker: dict[str, OhlcvArrays | None] = dict(zip(
+            unique_tickers,
+            self._market_data_fetcher.get_ohlcv_arrays(unique_tickers, timeframe=timeframe, limit=100)
+        ))
 
-            if ohlcv_df is None or ohlcv_df.empty:
-                logger.warning(f"Could not fetch OHLCV data for {cleaned_ticker}. Skipping TP/SL calculation.")
+        for cleaned_ticker, action in tp_sl_candidates:
+            ohlcv_arrays: OhlcvArrays | None = ohlcv_by_ticker.get(cleaned_ticker)
+            if ohlcv_arrays is None:
+                logger.warning("Could not fetch OHLCV data for %s. Skipping TP/SL calculation.", cleaned_ticker)
                 downstream_signals.append(
                     SignalTweetDownstream(
                         symbol=cleaned_ticker,
@@ -188,8 +354,8 @@ class SignalTweetAdapter:
                 )
                 continue
 
-            latest_close_price = ohlcv_df['close'].iloc[-1]
-            atr_value = self.calculate_atr(ohlcv_df)
+            high, low, close, latest_close_price = ohlcv_arrays
+            atr_value = self.calculate_atr_from_arrays(high, low, close)
 
             tp_price: float | None = None
             sl_price: float | None = None
@@ -1,8 +1,58 @@
+import asyncio
 import ccxt
-from typing import Dict, Any, Optional
+import hashlib
+import json
+import os
+import requests
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Awaitable, Coroutine, Dict, Iterable, List, Optional, TypeVar
 from .log.logger import logger
 from config import get_config
 
+T = TypeVar('T')
+
+class FileCache:
+    """
+    A small JSON file cache with a TTL. Each key is stored in its own file, named by the key's MD5,
+    together with the time it was written. Writes go through a temporary file and os.replace, so a
+    crash mid-write never leaves a corrupt cache file behind.
+    """
+
+    def __init__(self, directory: str, ttl: float) -> None:
+        self.directory: str = directory
+        self.ttl: float = ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.md5(key.encode('utf-8')).hexdigest()}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value for key, or None if it is missing, unreadable or older than the TTL."""
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                entry: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('timestamp', 0) > self.ttl:
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        """Stores a JSON-serializable value under key."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.time(), 'value': value}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
 class CcxtBase:
     """
     Base class for CCXT integration with Hyperliquid, implementing the Singleton pattern.
@@ -12,11 +62,66 @@ class CcxtBase:
     _instance: Optional['CcxtBase'] = None
     _exchange: Optional[ccxt.Exchange] = None
     _markets: Optional[Dict[str, Any]] = None
+    _initialized: bool = False
+    # Bumped by every operation that changes the account (orders, withdrawals, transfers), on CcxtBase itself so
+    # all managers share it; cached account reads made under an older epoch are stale
+    _mutation_epoch: int = 0
+    # Most requests one concurrent fan-out keeps in flight; ccxt's rate limiter additionally spaces them per client
+    MAX_CONCURRENT_REQUESTS: int = 8
+    # The markets list rarely changes, so it is kept on disk for a day to speed up cold starts. The cache lives next
+    # to this package rather than in the working directory, unless MARKETS_CACHE_DIR points elsewhere.
+    _markets_cache: FileCache = FileCache(
+        os.environ.get("MARKETS_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'markets'),
+        ttl=86400,
+    )
+    # Shortest gap between two reloads of the markets list, so lookups of an unknown symbol cannot hammer the API
+    MARKETS_RELOAD_INTERVAL_SECONDS: float = 60.0
+    _markets_reloaded_at: Optional[float] = None
+    # Held across the interval check, the download and the timestamp update, so concurrent misses reload once
+    _markets_reload_lock: threading.Lock = threading.Lock()
+    # Explicitly declare these attributes to avoid implicit definition; set by _initialize()
+    wallet_address: Optional[str] = None
+    private_key: Optional[str] = None
 
     def __init__(self) -> None:
-        # Explicitly declare these attributes to avoid implicit definition
-        self.wallet_address: Optional[str] = None
-        self.private_key: Optional[str] = None
+        # Python calls __init__ on every construction of the singleton; only the first call sets it up.
+        # Subclasses check _initialized before doing their own one-time setup.
+        if self._initialized:
+            return
+        self._initialized = True
+
+    @staticmethod
+    def _bump_mutation_epoch() -> None:
+        """Marks account data cached by any manager as stale."""
+        CcxtBase._mutation_epoch += 1
+
+    @staticmethod
+    def _run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Runs a coroutine to completion from synchronous code. asyncio.run is not allowed on a thread whose event
+        loop is running (e.g. a sync method called from a coroutine next to AsyncFutureExecution), so there the
+        coroutine gets its own loop on a worker thread, and this call blocks until it finishes.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coroutine).result()
+
+    @classmethod
+    async def _gather_limited(cls, aws: Iterable[Awaitable[Any]], return_exceptions: bool = True) -> List[Any]:
+        """
+        asyncio.gather over aws that runs at most MAX_CONCURRENT_REQUESTS of them at a time, so a large
+        fan-out queues on the client instead of flooding the exchange. Results are in input order.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_REQUESTS)
+
+        async def limited(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*[limited(aw) for aw in aws], return_exceptions=return_exceptions)
 
     def __new__(cls, *args, **kwargs) -> 'CcxtBase':
         """
@@ -24,7 +129,8 @@ class CcxtBase:
         Initializes the exchange connection if it's the first time.
         """
         if not cls._instance:
-            cls._instance = super(CcxtBase, cls).__new__(cls, *args, **kwargs)
+            # object.__new__ takes no extra arguments, so they are not forwarded
+            cls._instance = super(CcxtBase, cls).__new__(cls)
             cls._instance._initialize()
         return cls._instance
 
@@ -57,12 +163,12 @@ class CcxtBase:
                 'walletAddress': self.wallet_address,
                 'privateKey': self.private_key, 
                 'enableRateLimit': True,  # Always enable CCXT's built-in rate limiter for safe API usage
+                'session': self._create_http_session(),
             })
             
-            # Load all available markets from the exchange
+            # Load all available markets, from the disk cache when it is fresh, otherwise from the exchange
             if CcxtBase._markets is None:
-                CcxtBase._markets = CcxtBase._exchange.load_markets()
-                logger.info("Hyperliquid API Connected: Markets loaded successfully.")
+                self._load_markets()
                 
         except ccxt.NetworkError as e:
             self._handle_initialization_error("network connectivity", e)
@@ -79,6 +185,76 @@ class CcxtBase:
             if CcxtBase._markets is None: # If markets failed to load, assume exchange is also not fully ready
                 CcxtBase._exchange = None
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        Creates the requests session used by the sync exchange, with a connection pool large enough
+        for the concurrent callers so every request reuses an open TLS connection.
+        Only connection failures are retried: Hyperliquid requests are POSTs, which urllib3 does not
+        retry once they have been sent, so an order is never submitted twice.
+        """
+        session: requests.Session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        session.mount('https://', adapter)
+        return session
+
+    def _load_markets(self) -> None:
+        """
+        Loads markets into the exchange instance, reusing the on-disk copy if it is still within its TTL
+        and writing a fresh download back to disk.
+        """
+        cache_key: str = f"{CcxtBase._exchange.id}:markets"
+        cached: Optional[Dict[str, Any]] = self._markets_cache.get(cache_key)
+        if cached:
+            CcxtBase._exchange.set_markets(cached['markets'], cached.get('currencies'))
+            CcxtBase._markets = CcxtBase._exchange.markets
+            logger.info("Hyperliquid API Connected: Markets loaded from disk cache.")
+            return
+
+        CcxtBase._markets = CcxtBase._exchange.load_markets()
+        CcxtBase._markets_reloaded_at = time.monotonic()
+        logger.info("Hyperliquid API Connected: Markets loaded successfully.")
+        self._write_markets_cache()
+
+    def _write_markets_cache(self) -> None:
+        """Writes the currently loaded markets to the disk cache."""
+        cache_key: str = f"{CcxtBase._exchange.id}:markets"
+        try:
+            self._markets_cache.set(cache_key, {'markets': CcxtBase._markets, 'currencies': CcxtBase._exchange.currencies})
+        except (OSError, TypeError, ValueError) as e:
+            # The cache only speeds up the next start; failing to write it is not fatal
+            logger.warning("Could not write markets cache: %s", e)
+
+    def reload_markets(self) -> bool:
+        """
+        Downloads the markets list again and rewrites the disk cache, e.g. when a symbol is missing from the
+        loaded markets or the exchange rejected one as unknown. A reload within MARKETS_RELOAD_INTERVAL_SECONDS
+        of the previous download is skipped; a caller that waited for another thread's reload gets False, with
+        the reloaded markets already in place.
+
+        Returns:
+            bool: True if the markets were reloaded, False if the reload was skipped or failed.
+        """
+        if not self.exchange:
+            return False
+        with self._markets_reload_lock:
+            now: float = time.monotonic()
+            if CcxtBase._markets_reloaded_at is not None and now - CcxtBase._markets_reloaded_at < self.MARKETS_RELOAD_INTERVAL_SECONDS:
+                return False
+            CcxtBase._markets_reloaded_at = now
+            try:
+                CcxtBase._markets = CcxtBase._exchange.load_markets(reload=True)
+            except Exception as e:
+                self._handle_operation_error("reloading markets", e)
+                return False
+            logger.info("Markets reloaded: %d markets.", len(CcxtBase._markets))
+            self._write_markets_cache()
+            return True
+
     def _handle_initialization_error(self, error_type: str, error: Exception) -> None:
         """
         A dedicated error handler for issues encountered during the initial setup (_initialize method).
@@ -123,6 +299,7 @@ class CcxtBase:
     def get_market_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Retrieves detailed ticker information for a given trading symbol.
+        The markets are reloaded once if the symbol is not among them, e.g. a listing newer than the disk cache.
         
         Args:
             symbol (str): The trading pair symbol (e.g., "ETH/USD").
@@ -135,7 +312,12 @@ class CcxtBase:
             logger.error("Error: Markets not loaded. Cannot retrieve market information.")
             return None
         try: 
-            return self.markets.get(symbol)
+            market_info: Optional[Dict[str, Any]] = self.markets.get(symbol)
+            if market_info is None:
+                # Read again even if this call skipped the reload: another thread may just have reloaded
+                self.reload_markets()
+                market_info = self.markets.get(symbol)
+            return market_info
         except Exception as e:
             self._handle_operation_error(f"retrieving market info for {symbol}", e)
             return None
@@ -157,6 +339,26 @@ class CcxtBase:
             self._handle_operation_error(f"fetching ticker for {symbol}", e)
             return None
 
+    def get_tickers_info(self, symbols: list[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetches the current tickers for several trading symbols in a single request.
+
+        Args:
+            symbols (list[str]): The trading pair symbols (e.g., ["BTC/USDC:USDC", "ETH/USDC:USDC"]).
+
+        Returns:
+            Optional[Dict[str, Dict[str, Any]]]: Ticker data keyed by symbol,
+                                                 or None if an error occurs during the fetch operation.
+        """
+        if not self.exchange:
+            logger.error("Error: Exchange not initialized. Cannot fetch tickers.")
+            return None
+        try:
+            return self.exchange.fetch_tickers(symbols)
+        except Exception as e:
+            self._handle_operation_error(f"fetching tickers for {len(symbols)} symbols", e)
+            return None
+
     def is_market_active(self, symbol: str) -> bool:
         """
         Checks if a specific trading market is currently active and available for operations.
@@ -1,11 +1,12 @@
 
-from .order_management import CcxtOrderManagement
+from .order_management import CcxtOrderManagement, Position
 from .wallet_management import CcxtWalletManagement
 from .data_management import MarketDataFetcher
 from .portfolio_management import CcxtPortfolioManagement
-from .executor import FutureExecution
+from .executor import FutureExecution, AsyncFutureExecution
+from .mark_price_cache import MarkPriceCache
 
-__all__: list[str] = ['CcxtOrderManagement', 'CcxtWalletManagement','CcxtPortfolioManagement', 'MarketDataFetcher', 'FutureExecution']
+__all__: list[str] = ['CcxtOrderManagement', 'CcxtWalletManagement','CcxtPortfolioManagement', 'MarketDataFetcher', 'FutureExecution', 'AsyncFutureExecution', 'MarkPriceCache', 'Position']
 
 # example
 # from core.ccxt_hyperliquid.core import CcxtOrderManagement,CcxtWalletManagement,FutureExecution
@@ -1,10 +1,14 @@
 import ccxt
-import asyncio
-from typing import Optional, List, Any
+import ccxt.async_support as ccxt_async
+from typing import Optional, List, Dict, Any, Tuple
 from core.ccxt_hyperliquid.ccxt_base import CcxtBase
 from core.ccxt_hyperliquid.log.logger import logger
+import numpy as np
 import pandas as pd
 
+# (high, low, close, last_close) as contiguous float64 arrays
+OhlcvArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, float]
+
 class MarketDataFetcher(CcxtBase):
     """A class to fetch market data using the CCXT library."""
     def __init__(self) -> None:
@@ -12,11 +16,31 @@ class MarketDataFetcher(CcxtBase):
         Initializes the MarketDataFetcher by calling the parent CcxtBase
         constructor, which ensures the CCXT Hyperliquid exchange is initialized.
         """
+        if self._initialized:  # Singleton already set up by an earlier construction
+            return
         super().__init__()
         # Ensure the exchange is available before proceeding with order operations
         if not self.exchange:
             logger.warning("Hyperliquid exchange not initialized. Order operations may fail.") 
             
+    def _can_fetch_ohlcv(self, timeframe: str) -> bool:
+        """
+        Checks that the exchange is initialized, supports fetchOHLCV and knows the timeframe.
+        """
+        if not self.exchange:
+            logger.error("Exchange not initialized.")
+            return False
+
+        if not self.exchange.has['fetchOHLCV']:
+            logger.error(f"{self.exchange.id} does not support fetchOHLCV.")
+            return False
+
+        if timeframe not in self.exchange.timeframes:
+            logger.error(f"Timeframe '{timeframe}' not supported by {self.exchange.id}.")
+            logger.warning("Supported timeframes: %s", list(self.exchange.timeframes.keys()))
+            return False
+        return True
+
     def _fetch_ohlcv_timeseries(self,
                                  symbol: str,
                                  timeframe: str = '1m',
@@ -25,24 +49,48 @@ class MarketDataFetcher(CcxtBase):
         """
         Fetches historical OHLCV data.
         """
-        if not self.exchange:
-            logger.error("Exchange not initialized.")
+        if not self._can_fetch_ohlcv(timeframe):
             return None
 
-        if not self.exchange.has['fetchOHLCV']:
-            logger.error(f"{self.exchange.id} does not support fetchOHLCV.")
+        try:
+            logger.info("Fetching OHLCV for %s (Timeframe: %s)...", symbol, timeframe)
+            ohlcv_data: List[List] = self.exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+            logger.info("Successfully fetched %s candles.", len(ohlcv_data))
+            return ohlcv_data
+
+        except Exception as e:
+            logger.error(f"Error fetching OHLCV for {symbol}: {e}")
             return None
 
-        try:
-            logger.info(f"Fetching OHLCV for {symbol} (Timeframe: {timeframe})...")
-            
-            if timeframe not in self.exchange.timeframes:
-                logger.error(f"Timeframe '{timeframe}' not supported by {self.exchange.id}.")
-                logger.warning(f"Supported timeframes: {list(self.exchange.timeframes.keys())}")
-                return None
+    def _create_async_exchange(self) -> ccxt_async.Exchange:
+        """
+        Creates a ccxt.async_support Hyperliquid client for public market data.
+        The already loaded markets are reused so the client does not download them again.
+        The caller owns the client and must close it.
+        """
+        async_exchange: ccxt_async.Exchange = ccxt_async.hyperliquid({
+            'enableRateLimit': True,  # Keep CCXT's rate limiter on, requests are spaced even when gathered
+        })
+        if self.markets:
+            async_exchange.set_markets(self.markets)
+        return async_exchange
 
-            ohlcv_data: List[List] = self.exchange.fetch_ohlcv(symbol, timeframe, since, limit)
-            logger.info(f"Successfully fetched {len(ohlcv_data)} candles.")
+    async def _fetch_ohlcv_timeseries_async(self,
+                                            async_exchange: ccxt_async.Exchange,
+                                            symbol: str,
+                                            timeframe: str = '1m',
+                                            since: Optional[int] = None,
+                                            limit: Optional[int] = None) -> List[List] | None:
+        """
+        Fetches historical OHLCV data with the given async client.
+        """
+        if not self._can_fetch_ohlcv(timeframe):
+            return None
+
+        try:
+            logger.info("Fetching OHLCV for %s (Timeframe: %s)...", symbol, timeframe)
+            ohlcv_data: List[List] = await async_exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+            logger.info("Successfully fetched %s candles for %s.", len(ohlcv_data), symbol)
             return ohlcv_data
 
         except Exception as e:
@@ -56,6 +104,32 @@ class MarketDataFetcher(CcxtBase):
         df.set_index('datetime', inplace=True)
         return df
 
+    def _format_ohlcv_arrays(self, ohlcv_data: List[List]) -> Optional[OhlcvArrays]:
+        """
+        Converts raw OHLCV rows into (high, low, close, last_close) without building a DataFrame.
+        Returns None if there are no candles.
+        """
+        if not ohlcv_data:
+            return None
+        arr: np.ndarray = np.asarray(ohlcv_data, dtype=np.float64)
+        high: np.ndarray = np.ascontiguousarray(arr[:, 2])
+        low: np.ndarray = np.ascontiguousarray(arr[:, 3])
+        close: np.ndarray = np.ascontiguousarray(arr[:, 4])
+        return high, low, close, float(close[-1])
+
+    def _fetch_ohlcv_arrays(self,
+                            symbol: str,
+                            timeframe: str = '1m',
+                            since: Optional[int] = None,
+                            limit: Optional[int] = None) -> Optional[OhlcvArrays]:
+        """
+        Fetches OHLCV data as NumPy arrays for indicator calculations that don't need a DataFrame.
+        """
+        ohlcv_data: Optional[List[List]] = self._fetch_ohlcv_timeseries(symbol, timeframe, since, limit)
+        if ohlcv_data is None:
+            return None
+        return self._format_ohlcv_arrays(ohlcv_data)
+
     def get_ohlcv_df(self,
                     symbol: str,
                     timeframe: str = '1m',
@@ -78,4 +152,77 @@ class MarketDataFetcher(CcxtBase):
             return None
         return self._format_ohlcv_data(ohlcv_data)
 
- 
\ No newline at end of file
+    async def get_ohlcv_df_async(self,
+                                 async_exchange: ccxt_async.Exchange,
+                                 symbol: str,
+                                 timeframe: str = '1m',
+                                 since: Optional[int] = None,
+                                 limit: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """
+        Async counterpart of get_ohlcv_df using the given ccxt.async_support client.
+        """
+        ohlcv_data: Optional[List[List]] = await self._fetch_ohlcv_timeseries_async(async_exchange, symbol, timeframe, since, limit)
+        if ohlcv_data is None:
+            return None
+        return self._format_ohlcv_data(ohlcv_data)
+
+    async def _gather_ohlcv_timeseries(self,
+                                       symbols: List[str],
+                                       timeframe: str,
+                                       since: Optional[int],
+                                       limit: Optional[int]) -> List[Optional[List[List]]]:
+        async_exchange: ccxt_async.Exchange = self._create_async_exchange()
+        try:
+            results: List[Any] = await self._gather_limited(
+                self._fetch_ohlcv_timeseries_async(async_exchange, symbol, timeframe, since, limit) for symbol in symbols
+            )
+        finally:
+            await async_exchange.close()
+
+        ohlcv_data: List[Optional[List[List]]] = []
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching OHLCV for {symbol}: {result}")
+                ohlcv_data.append(None)
+            else:
+                ohlcv_data.append(result)
+        return ohlcv_data
+
+    def get_ohlcv_dfs(self,
+                      symbols: List[str],
+                      timeframe: str = '1m',
+                      since: Optional[int] = None,
+                      limit: Optional[int] = None) -> List[Optional[pd.DataFrame]]:
+        """
+        Fetches OHLCV DataFrames for several symbols concurrently.
+
+        The requests are issued together through ccxt.async_support, so the wall-clock time is
+        close to the slowest request (plus CCXT's rate-limit spacing) instead of the sum of all of them.
+
+        Args:
+            symbols: The trading pair symbols (e.g., ['BTC/USDC:USDC', 'ETH/USDC:USDC'])
+            timeframe: The timeframe for the OHLCV data (default: '1m')
+            since: Timestamp in milliseconds for the start time (optional)
+            limit: Maximum number of candles to return per symbol (optional)
+
+        Returns:
+            List[Optional[pd.DataFrame]]: One DataFrame per symbol, in the same order, or None where the fetch failed
+        """
+        if not symbols:
+            return []
+        ohlcv_data = self._run_sync(self._gather_ohlcv_timeseries(symbols, timeframe, since, limit))
+        return [self._format_ohlcv_data(data) if data is not None else None for data in ohlcv_data]
+
+    def get_ohlcv_arrays(self,
+                         symbols: List[str],
+                         timeframe: str = '1m',
+                         since: Optional[int] = None,
+                         limit: Optional[int] = None) -> List[Optional[OhlcvArrays]]:
+        """
+        Same as get_ohlcv_dfs, but returns (high, low, close, last_close) NumPy arrays per symbol
+        and skips DataFrame/DatetimeIndex construction. None where the fetch failed or returned no candles.
+        """
+        if not symbols:
+            return []
+        ohlcv_data = self._run_sync(self._gather_ohlcv_timeseries(symbols, timeframe, since, limit))
+        return [self._format_ohlcv_arrays(data) if data is not None else None for data in ohlcv_data]
@@ -1,7 +1,19 @@
 from log.logger import logger
 from core import CcxtOrderManagement, CcxtWalletManagement
+import aiohttp
+import asyncio
+import ccxt
+import ccxt.async_support as ccxt_async
+import functools
+import logging
 import math
-from typing import Any, Literal
+import operator
+import numpy as np
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from types import MappingProxyType
+from typing import Any, Callable, Literal, NamedTuple
 # Custom Exceptions
 class MarketNotActiveError(Exception): pass
 class MarketInfoError(Exception): pass
@@ -9,40 +21,140 @@ class TickerFetchError(Exception): pass
 class WalletBalanceError(Exception): pass
 class DependentOrderError(Exception): pass # New custom exception
 
+# Powers of ten for the decimal places markets use, looked up instead of computed with **
+_POW10: tuple[int, ...] = tuple(10 ** i for i in range(13))
+# Decimal places for the usual power-of-ten steps (1e-1 ... 1e-12), so these skip the Decimal parse
+_DP_BY_PRECISION: dict[float, int] = {float(f"1e-{i}"): i for i in range(1, len(_POW10))}
+
+# Per side: (relation that makes a TP invalid, relation that makes an SL invalid, TP direction, SL direction)
+_SIDE_RULES: dict[str, tuple[Any, Any, str, str]] = {
+    'buy': (operator.le, operator.ge, 'greater', 'less'),
+    'sell': (operator.ge, operator.le, 'less', 'greater'),
+}
+
+# Order fields included in _log_order_summary, in log order
+_SUMMARY_KEYS: tuple[str, ...] = ('id', 'status', 'type', 'side', 'amount', 'price', 'average', 'triggerPrice')
+_STATUS_INDEX: int = _SUMMARY_KEYS.index('status')
+# Hyperliquid status flags in the raw 'info' payload, checked in order: (flag, status label)
+_INFO_STATUS_FLAGS: tuple[tuple[str, str], ...] = (('filled', 'filled'), ('resting', 'resting'))
+
+# Fixed parameters of the protective orders; per-call fields are added to a fresh copy,
+# since ccxt writes into the params dict it is given
+_SL_PARAMS_TEMPLATE: MappingProxyType = MappingProxyType({'reduceOnly': True})
+_TP_PARAMS_TEMPLATE: MappingProxyType = MappingProxyType({'reduceOnly': True})
+
+class PrecisionSpec(NamedTuple):
+    """Rounding parameters derived from a market's amount precision."""
+    decimal_places: int
+    scale: float
+    inv_scale: float
+    quantum: Decimal # The amount step as an exact Decimal; rounded values are multiples of it
+    mode: Literal['decimal', 'step', 'integer', 'fallback']
+
+@functools.lru_cache(maxsize=256)
+def _precision_spec(amount_precision: Any) -> PrecisionSpec:
+    """
+    Derives the rounding parameters for an amount precision once; a market's precision never changes.
+    'decimal' is a power-of-ten step below 1 (e.g. 0.01), 'step' any other step below 1 (e.g. 0.25 or 5e-05),
+    'integer' a step of 1 or more (e.g. 10, used as-is), 'fallback' an invalid precision rounded to 2 decimal places.
+    """
+    if isinstance(amount_precision, (int, float)) and amount_precision > 0:
+        if amount_precision < 1:
+            decimal_places: int | None = _DP_BY_PRECISION.get(amount_precision)
+            if decimal_places is not None:
+                scale: float = _POW10[decimal_places]
+                return PrecisionSpec(decimal_places, scale, 1.0 / scale, Decimal(1).scaleb(-decimal_places), 'decimal')
+            # The step itself is the quantum, e.g. 0.25 rounds to multiples of 0.25 rather than of 0.01
+            quantum: Decimal = Decimal(repr(amount_precision))
+            decimal_places = -quantum.as_tuple().exponent
+            scale = _POW10[decimal_places] if decimal_places < len(_POW10) else 10 ** decimal_places
+            mode: Literal['decimal', 'step'] = 'decimal' if quantum.as_tuple().digits == (1,) else 'step'
+            return PrecisionSpec(decimal_places, scale, 1.0 / scale, quantum, mode)
+        return PrecisionSpec(0, 1.0, 1.0, Decimal(1), 'integer')
+    return PrecisionSpec(2, _POW10[2], 0.01, Decimal('0.01'), 'fallback')
+
+def _quantize(value: float, quantum: Decimal, rounding: str) -> float:
+    """
+    Rounds value to a multiple of quantum in decimal arithmetic. Float multiply-floor-divide can land
+    one tick off (e.g. 0.29 * 100 == 28.999999999999996), which the exchange then rejects.
+    """
+    return float((Decimal(str(value)) / quantum).to_integral_value(rounding=rounding) * quantum)
+
+# Scalar kernels for the order-size math: no logging and no dict access, so a backtester can call them
+# per simulated trade. FutureExecution wraps them with validation and logging for live trading.
+
+def _floor_to_precision(value: float, amount_precision: Any) -> float:
+    """Rounds value down to the amount step. A positive value that would round to zero becomes one step."""
+    spec: PrecisionSpec = _precision_spec(amount_precision)
+    if spec.mode == 'integer':  # Integer precision (e.g., 1, 10)
+        rounded: float = math.floor(value / amount_precision) * amount_precision
+        step: float = amount_precision
+    else:  # Decimal precision (e.g., 0.01 or 0.25), or 2 decimal places as fallback
+        rounded = _quantize(value, spec.quantum, ROUND_FLOOR)
+        step = float(spec.quantum)
+    if rounded == 0 and value > 0:
+        return step
+    return rounded
+
+def _ceil_to_precision(value: float, amount_precision: Any) -> float:
+    """Rounds value up to the amount step."""
+    spec: PrecisionSpec = _precision_spec(amount_precision)
+    if spec.mode == 'integer':  # Integer precision (e.g., 1, 10)
+        return math.ceil(value / amount_precision) * amount_precision
+    return _quantize(value, spec.quantum, ROUND_CEILING)
+
+def _min_amount_kernel(min_cost: float, price: float, amount_precision: Any, min_amount_limit: float, leverage: float) -> float:
+    """
+    Minimum order amount: the largest of min_cost in base units, the market's minimum amount and the $11
+    notional buffer divided by leverage, rounded up to the amount step once. Rounding up cannot fall below
+    any of the three, so no clamp is needed afterwards. price and leverage must be positive; pass 0.0 when
+    the market has no min_cost or minimum amount.
+    """
+    raw_min_amount: float = max(
+        min_cost / price if min_cost > 0 else 0.0,
+        min_amount_limit,
+        # Ensure order value meets the minimum buffer (e.g., $11, adjusted by leverage)
+        # The $10/leverage check is implicitly covered by this stricter $11/leverage check.
+        (11.0 / leverage) / price,
+    )
+    return _ceil_to_precision(raw_min_amount, amount_precision)
+
 class FutureExecution:
+    # Tickers are only reused for a short window so a caller fetching one right before
+    # execute_trade does not pay a second round-trip; market info rarely changes and is kept.
+    TICKER_TTL_SECONDS: float = 1.0
+    _ticker_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+    _market_info_cache: dict[str, dict[str, Any]] = {}
+
     def __init__(self) -> None:
         self.order_manager: CcxtOrderManagement = CcxtOrderManagement()
         self.wallet_manager: CcxtWalletManagement = CcxtWalletManagement() 
+        # The pre-flight requests are independent and network-bound, so they are issued side by side.
+        # They share the singleton ccxt client; each call builds its own request, so this is safe across threads.
+        self._preflight_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="preflight")
+        # Leverage last applied per symbol, so repeat trades skip the set_leverage round-trip
+        self._leverage_cache: dict[str, int] = {}
 
     def _log_order_summary(self, order_name: str, order_result: dict[str, Any] | None) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if order_result and isinstance(order_result, dict):
             info = order_result.get('info', {})
             status = order_result.get('status')
             if not status and isinstance(info, dict): # Hyperliquid often nests useful status info
-                if info.get('filled'):
-                    status = 'filled'
-                elif info.get('resting'):
-                    status = 'resting'
-                elif info.get('error'):
-                    status = f"error ({info.get('error')})"
-            
-            summary = {
-                "id": order_result.get('id'),
-                "status": status,
-                "type": order_result.get('type'),
-                "side": order_result.get('side'),
-                "amount": order_result.get('amount'),
-                "price": order_result.get('price'), # For limit/stop orders
-                "average": order_result.get('average'), # For filled market orders
-                "triggerPrice": order_result.get('triggerPrice') # For stop orders
-            }
-            # Clean None values for brevity
-            summary_cleaned = {k: v for k, v in summary.items() if v is not None}
-            logger.info(f"{order_name} summary: {summary_cleaned}")
+                status = next((label for flag, label in _INFO_STATUS_FLAGS if info.get(flag)), None)
+                if status is None and info.get('error'):
+                    status = f"error ({info['error']})"
+
+            # Clean None values for brevity; price is for limit/stop orders, average for filled market orders
+            values: list[Any] = list(map(order_result.get, _SUMMARY_KEYS))
+            values[_STATUS_INDEX] = status
+            summary_cleaned = {k: v for k, v in zip(_SUMMARY_KEYS, values) if v is not None}
+            logger.info("%s summary: %s", order_name, summary_cleaned)
         elif order_result:
-            logger.info(f"{order_name}: {order_result}") # Log as is if not a dict or empty
+            logger.info("%s: %s", order_name, order_result) # Log as is if not a dict or empty
         else:
-            logger.info(f"{order_name}: Not placed or no result.")
+            logger.info("%s: Not placed or no result.", order_name)
 
     def _usdc_to_base_amount(
         self,
@@ -57,79 +169,78 @@ class FutureExecution:
         Assumes target_usdc_amount is a positive float.
         """
         desired_base_amount: float = target_usdc_amount / current_price
-        amount_precision: float = market_info['precision']['amount']
-        adjusted_desired_base_amount: float
-
-        if isinstance(amount_precision, (int, float)) and amount_precision > 0:
-            if amount_precision < 1:  # Decimal precision (e.g., 0.01)
-                decimal_places: int = abs(math.floor(math.log10(amount_precision)))
-                adjusted_desired_base_amount = math.floor(desired_base_amount * (10 ** decimal_places)) / (10 ** decimal_places)
-                if adjusted_desired_base_amount == 0 and desired_base_amount > 0:
-                    adjusted_desired_base_amount = (10 ** -decimal_places)
-            else:  # Integer precision (e.g., 1, 10)
-                adjusted_desired_base_amount = math.floor(desired_base_amount / amount_precision) * amount_precision
-                if adjusted_desired_base_amount == 0 and desired_base_amount > 0:
-                    adjusted_desired_base_amount = amount_precision
-        else:  # Fallback precision
-            adjusted_desired_base_amount = math.floor(desired_base_amount * 100) / 100
-            if adjusted_desired_base_amount == 0 and desired_base_amount > 0:
-                adjusted_desired_base_amount = 0.01
-
-        logger.info(f"Desired base amount from {target_usdc_amount:.2f} USDC: {desired_base_amount:.8f}, "
-                    f"adjusted for precision: {adjusted_desired_base_amount:.8f} {symbol.split('/')[0]}")
+        adjusted_desired_base_amount: float = _floor_to_precision(desired_base_amount, market_info['precision']['amount'])
+
+        base_currency: str = symbol.split('/')[0]
+        logger.info("Desired base amount from %.2f USDC: %.8f, "
+                    "adjusted for precision: %.8f %s",
+                    target_usdc_amount, desired_base_amount, adjusted_desired_base_amount, base_currency)
 
         if adjusted_desired_base_amount == 0 and target_usdc_amount > 0: # target_usdc_amount is already > 0 here
-            logger.warning(f"Requested USDC amount {target_usdc_amount:.2f} is too small to be represented with market precision for {symbol}. "
-                           f"Falling back to minimum viable amount.")
+            logger.warning("Requested USDC amount %.2f is too small to be represented with market precision for %s. "
+                           "Falling back to minimum viable amount.", target_usdc_amount, symbol)
             return min_viable_base_amount
         elif adjusted_desired_base_amount < min_viable_base_amount:
             logger.warning(
-                f"Requested trade amount ({adjusted_desired_base_amount:.8f} {symbol.split('/')[0]}) "
-                f"is less than the minimum viable amount ({min_viable_base_amount:.8f} {symbol.split('/')[0]}). "
-                f"Using minimum viable amount instead."
+                "Requested trade amount (%.8f %s) "
+                "is less than the minimum viable amount (%.8f %s). "
+                "Using minimum viable amount instead.",
+                adjusted_desired_base_amount, base_currency, min_viable_base_amount, base_currency
             )
             return min_viable_base_amount
         else:
             return adjusted_desired_base_amount
 
-    def _check_market_active(self, symbol: str) -> None:
-        """Checks if the market for the given symbol is active."""
-        if not self.order_manager.is_market_active(symbol):
+    def _check_market_active(self, symbol: str, market_active: bool | None = None) -> None:
+        """Checks if the market for the given symbol is active. Uses market_active if it was already fetched."""
+        if market_active is None:
+            market_active = self.order_manager.is_market_active(symbol)
+        if not market_active:
             logger.error(f"Market {symbol} is not active")
             raise MarketNotActiveError(f"Market {symbol} is not active")
-        logger.info(f"Market {symbol} is active.")
+        logger.info("Market %s is active.", symbol)
 
     def _get_market_info(self, symbol: str) -> dict[str, Any]:
-        """Retrieves market information for a symbol, raising an error if not found."""
+        """Retrieves market information for a symbol, raising an error if not found. Cached per symbol."""
+        cached_market_info: dict[str, Any] | None = self._market_info_cache.get(symbol)
+        if cached_market_info is not None:
+            return cached_market_info
+
         market_info: dict[str, Any] = self.order_manager.get_market_info(symbol)
         if not market_info:
             raise ValueError(f"Market information for {symbol} not found.")
-        logger.info(f"Successfully fetched market info for {symbol}.") 
+        self._market_info_cache[symbol] = market_info
+        logger.info("Successfully fetched market info for %s.", symbol)
         if market_info['limits']['cost']['min'] is not None:
-            logger.info(f"Market info - Min cost: {market_info['limits']['cost']['min']}")
+            logger.info("Market info - Min cost: %s", market_info['limits']['cost']['min'])
         if market_info['limits']['amount']['min'] is not None:
-            logger.info(f"Market info - Min amount: {market_info['limits']['amount']['min']}")
+            logger.info("Market info - Min amount: %s", market_info['limits']['amount']['min'])
         return market_info
 
     def _get_ticker_info(self, symbol: str) -> dict[str, Any]:
-        """Fetches ticker information for the given symbol."""
+        """Fetches ticker information for the given symbol, reusing a ticker younger than TICKER_TTL_SECONDS."""
+        cached: tuple[float, dict[str, Any]] | None = self._ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.TICKER_TTL_SECONDS:
+            return cached[1]
+
         ticker: dict[str, Any] = self.order_manager.get_ticker_info(symbol)
         if not ticker:
             raise ValueError(f"Ticker for {symbol} not found.")
-        logger.info(f"Successfully fetched ticker info for {symbol}.")
+        self._ticker_cache[symbol] = (time.monotonic(), ticker)
+        logger.info("Successfully fetched ticker info for %s.", symbol)
         return ticker
 
+    def _invalidate_symbol_cache(self, symbol: str) -> None:
+        """Drops cached ticker, market info and leverage for a symbol, e.g. after the exchange rejected it as stale."""
+        self._ticker_cache.pop(symbol, None)
+        self._market_info_cache.pop(symbol, None)
+        self._leverage_cache.pop(symbol, None)
+
     def _adjust_to_precision(self, base_value: float, precision_value: float | int) -> float:
         """Adjusts a base_value upwards to the given precision_value."""
-        if not (isinstance(precision_value, (int, float)) and precision_value > 0):
-            logger.warning(f"Invalid precision_value ({precision_value}) for adjustment, defaulting to 2 decimal places.")
-            return math.ceil(base_value * 100) / 100
-
-        if precision_value < 1:  # Decimal precision (e.g., 0.01)
-            decimal_places: int = abs(math.floor(math.log10(precision_value)))
-            return math.ceil(base_value * (10 ** decimal_places)) / (10 ** decimal_places)
-        else:  # Integer precision (e.g., 1, 10)
-            return math.ceil(base_value / precision_value) * precision_value
+        if _precision_spec(precision_value).mode == 'fallback':
+            logger.warning("Invalid precision_value (%s) for adjustment, defaulting to 2 decimal places.", precision_value)
+        return _ceil_to_precision(base_value, precision_value)
 
     def _calculate_min_order_amount(self, symbol: str, price: float, market_info: dict[str, Any], leverage: float) -> float:
         """Calculates the minimum order amount based on market rules and a minimum order value."""
@@ -143,74 +254,63 @@ class FutureExecution:
             logger.error(f"Invalid price ({price}) for min_amount calculation of {symbol}.")
             raise ValueError(f"Price must be positive for min_amount calculation. Got {price}")
 
-        raw_min_amount: float = min_cost_value / price if min_cost_value > 0 else 0.0
-        
-        min_amount: float
-        if isinstance(amount_precision, (int, float)) and amount_precision > 0:
-            if amount_precision < 1:  # Decimal precision (e.g., 0.01)
-                decimal_places: int = abs(math.floor(math.log10(amount_precision)))
-                min_amount = math.ceil(raw_min_amount * (10 ** decimal_places)) / (10 ** decimal_places)
-            else:  # Integer precision (e.g., 1, 10)
-                min_amount = math.ceil(raw_min_amount / amount_precision) * amount_precision
-        else: # Fallback if precision is not a positive number or is zero/None
-            min_amount = math.ceil(raw_min_amount * 100) / 100 # Default to 2 decimal places
-
-        min_amount_limit: float = market_info['limits']['amount']['min']
-        if min_amount_limit is not None and min_amount < float(min_amount_limit):
-            min_amount = float(min_amount_limit)
-        
         # Ensure order value meets $10 minimum, then apply $11 buffer
         # Adjust target values by leverage
         if leverage <= 0:
             logger.error(f"Invalid leverage ({leverage}) for min_order_value calculation. Must be > 0.")
             raise ValueError(f"Leverage must be positive for min_order_value calculation. Got {leverage}")
 
-        # Ensure order value meets the minimum buffer (e.g., $11, adjusted by leverage)
-        # The $10/leverage check is implicitly covered by this stricter $11/leverage check.
-        effective_min_order_value_buffer: float = 11.0 / leverage
-        
-        if min_amount * price < effective_min_order_value_buffer:
-            required_amount_for_buffer: float = effective_min_order_value_buffer / price
-            min_amount = self._adjust_to_precision(required_amount_for_buffer, amount_precision)
+        if _precision_spec(amount_precision).mode == 'fallback':
+            logger.warning("Invalid amount precision (%s) for %s, defaulting to 2 decimal places.", amount_precision, symbol)
 
-        # Final check against min_amount_limit if calculations pushed it below again
-        if min_amount_limit is not None and min_amount < float(min_amount_limit):
-            min_amount = float(min_amount_limit)
+        min_amount_limit: float = market_info['limits']['amount']['min']
+        min_amount: float = _min_amount_kernel(
+            min_cost_value,
+            price,
+            amount_precision,
+            float(min_amount_limit) if min_amount_limit is not None else 0.0,
+            float(leverage)
+        )
 
+        raw_min_amount: float = min_cost_value / price if min_cost_value > 0 else 0.0
+        effective_min_order_value_buffer: float = 11.0 / leverage
         final_order_value: float = min_amount * price
-        logger.info(f"Calculated min_amount for {symbol}: {min_amount} units (raw from min_cost: {raw_min_amount:.8f})")
-        logger.info(f"Final order value: ${final_order_value:.2f} (target notional: >= ${effective_min_order_value_buffer * leverage:.2f}, effective margin target: >= ${effective_min_order_value_buffer:.2f} with {leverage}x leverage)")
+        logger.info("Calculated min_amount for %s: %s units (raw from min_cost: %.8f)", symbol, min_amount, raw_min_amount)
+        logger.info("Final order value: $%.2f (target notional: >= $%.2f, effective margin target: >= $%.2f with %sx leverage)", final_order_value, effective_min_order_value_buffer * leverage, effective_min_order_value_buffer, leverage)
         if min_amount_limit:
-            logger.info(f"Market min amount limit: {min_amount_limit}")
+            logger.info("Market min amount limit: %s", min_amount_limit)
             
         return min_amount
 
     def _calculate_dynamic_slippage(self, ticker_info: dict, current_price: float) -> float:
         """Calculates dynamic slippage based on bid-ask spread."""
-        bid: Literal[0] | float = float(ticker_info.get('bid', 0)) if ticker_info.get('bid') else 0
-        ask: Literal[0] | float = float(ticker_info.get('ask', 0)) if ticker_info.get('ask') else 0
+        bid_raw: Any = ticker_info.get('bid')
+        ask_raw: Any = ticker_info.get('ask')
+        bid: float = float(bid_raw) if bid_raw else 0.0
+        ask: float = float(ask_raw) if ask_raw else 0.0
         
         dynamic_slippage: float
         if bid > 0 and ask > 0 and current_price > 0 and ask >= bid : # Ensure price > 0 and ask >= bid
             spread_percentage: float = ((ask - bid) / current_price) * 100
             # Set slippage to at least 2x the spread, with a minimum of 0.5% and maximum of 5%
             dynamic_slippage = max(0.005, min(0.05, spread_percentage * 2 / 100))
-            logger.info(f"Market bid: {bid}, ask: {ask}. Spread: {spread_percentage:.2f}%, Dynamic slippage: {dynamic_slippage*100:.2f}%")
+            logger.info("Market bid: %s, ask: %s. Spread: %.2f%%, Dynamic slippage: %.2f%%", bid, ask, spread_percentage, dynamic_slippage*100)
         else:
             dynamic_slippage = 0.01  # Default 1% slippage
-            logger.info(f"No valid bid/ask data or zero price, using default slippage: {dynamic_slippage*100:.2f}%")
+            logger.info("No valid bid/ask data or zero price, using default slippage: %.2f%%", dynamic_slippage*100)
         return dynamic_slippage
 
-    def _check_wallet_balance(self, required_usdc_amount: float) -> None:
-        """Checks if there is sufficient USDC balance in the wallet."""
-        balances = self.wallet_manager.get_balance()
+    def _check_wallet_balance(self, required_usdc_amount: float, balances: dict[str, Any] | None = None) -> None:
+        """Checks if there is sufficient USDC balance in the wallet. Uses balances if they were already fetched."""
+        if balances is None:
+            balances = self.wallet_manager.get_balance()
         if not balances or 'USDC' not in balances or 'free' not in balances['USDC']: 
             msg: str = "Cannot fetch wallet balance for USDC or missing 'free' field."
             logger.error(msg)
             raise WalletBalanceError(msg)
 
         available_balance: float = float(balances['USDC']['free'])
-        logger.info(f"Available USDC balance: {available_balance:.2f}")
+        logger.info("Available USDC balance: %.2f", available_balance)
         
         if available_balance < required_usdc_amount:
             msg: str = f"Insufficient balance: {available_balance:.2f} USDC, required: {required_usdc_amount:.2f} USDC"
@@ -218,6 +318,102 @@ class FutureExecution:
             raise WalletBalanceError(msg)
         logger.info("Wallet balance check passed.")
 
+    def _create_orders_batch(self, order_requests: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """
+        Submits the orders in a single request. Returns None if the exchange cannot batch orders,
+        in which case the caller places them one by one.
+        """
+        try:
+            return self.order_manager.create_orders(order_requests)
+        except ccxt.NotSupported as e:
+            logger.warning("Batched order placement unavailable, placing orders one by one: %s", e)
+            return None
+
+    def _order_succeeded(self, order_result: dict[str, Any] | None) -> bool:
+        """An entry of a batched order response succeeded unless the exchange reported an error for it."""
+        if not order_result:
+            return False
+        info = order_result.get('info')
+        return not (isinstance(info, dict) and info.get('error'))
+
+    def _cancel_orphaned_orders(self, symbol: str, order_results: list[dict[str, Any] | None]) -> None:
+        """
+        Cancels the TP/SL orders of a batch whose main order was rejected. Orders that cannot be
+        cancelled are logged, so they can be removed by hand.
+        """
+        for order_result in order_results:
+            if not self._order_succeeded(order_result) or not order_result.get('id'):
+                continue
+            try:
+                self.order_manager.cancel_order(order_result['id'], symbol)
+                logger.warning("Cancelled order %s for %s because the main order was rejected.", order_result['id'], symbol)
+            except Exception as e:
+                logger.error(f"Failed to cancel order {order_result['id']} for {symbol} after the main order was rejected; it is still live: {e}")
+
+    def _order_error(self, order_result: dict[str, Any] | None) -> str:
+        """Returns the exchange's error message for a rejected entry of a batched order response."""
+        info = order_result.get('info') if order_result else None
+        if isinstance(info, dict) and info.get('error'):
+            return str(info['error'])
+        return "no result returned"
+
+    def _preflight(self,
+                   symbol: str,
+                   ticker_info: dict[str, Any] | None = None,
+                   market_info: dict[str, Any] | None = None
+                   ) -> tuple[bool, dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+        """
+        Fetches market status, ticker, market info and wallet balance concurrently.
+        A ticker or market info passed in is used as-is instead of being fetched again.
+
+        Returns:
+            tuple: (market_active, ticker_info, market_info, balances). The first error raised by any fetch is re-raised.
+        """
+        market_active_future: Future | None = None
+        market_info_future: Future | None = None
+        if market_info is None:
+            market_active_future = self._preflight_pool.submit(self.order_manager.is_market_active, symbol)
+            market_info_future = self._preflight_pool.submit(self._get_market_info, symbol)
+        ticker_future: Future | None = self._preflight_pool.submit(self._get_ticker_info, symbol) if ticker_info is None else None
+        balances_future: Future = self._preflight_pool.submit(self.wallet_manager.get_balance)
+
+        if market_info_future is not None:
+            market_active: bool = market_active_future.result()
+            market_info = market_info_future.result()
+        else:
+            market_active = bool(market_info.get('active', False))
+        if ticker_future is not None:
+            ticker_info = ticker_future.result()
+        balances: dict[str, Any] | None = balances_future.result()
+        return market_active, ticker_info, market_info, balances
+
+    def _validate_inputs(self,
+                         symbol: str,
+                         side: str,
+                         leverage: int,
+                         take_profit_price: float | None,
+                         stop_loss_price: float | None) -> None:
+        """
+        Rejects invalid trade arguments before any request is made.
+        TP/SL checks against the current price need the ticker and happen during execution.
+        """
+        msg: str | None = None
+        if side not in _SIDE_RULES:
+            msg = f"Unsupported order side '{side}'. Expected 'buy' or 'sell'."
+        elif leverage <= 0:
+            msg = f"Leverage must be greater than 0, got {leverage}"
+        elif take_profit_price is not None and take_profit_price <= 0:
+            msg = f"Take Profit price must be positive, got {take_profit_price}"
+        elif stop_loss_price is not None and stop_loss_price <= 0:
+            msg = f"Stop Loss price must be positive, got {stop_loss_price}"
+        elif take_profit_price is not None and stop_loss_price is not None:
+            tp_invalid, _, tp_direction, _ = _SIDE_RULES[side]
+            if tp_invalid(take_profit_price, stop_loss_price):
+                msg = f"For a '{side}' order, Take Profit price ({take_profit_price}) must be {tp_direction} than Stop Loss price ({stop_loss_price})."
+        if msg is not None:
+            logger.error(f"Trade execution aborted for {symbol}: {msg}")
+            raise ValueError(msg)
+
     def execute_trade(self, 
                         symbol: str,
                         side: str,
@@ -225,17 +421,22 @@ class FutureExecution:
                         target_usdc_amount: float | None = None,
                         take_profit_price: float | None = None,
                         stop_loss_price: float | None = None,
-                        leverage: int = 2) -> dict[str, Any]:
+                        leverage: int = 2,
+                        ticker_info: dict[str, Any] | None = None,
+                        market_info: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         Handles the checks and executes a trade for the given symbol.
         If take_profit_price or stop_loss_price are provided, it attempts to place them
         as separate orders after the main order is successfully placed.
+        A ticker the caller has just fetched can be passed as ticker_info to skip fetching it again,
+        and already resolved market info as market_info (see make_executor).
         """
-        logger.info(f"--- Attempting to execute {side} {order_type} order for {symbol} ---") 
+        side = side.lower()
+        logger.info("--- Attempting to execute %s %s order for %s ---", side, order_type, symbol) 
         if stop_loss_price:
-            logger.info(f"Planned Stop Loss Price: {stop_loss_price}")
+            logger.info("Planned Stop Loss Price: %s", stop_loss_price)
         if take_profit_price:
-            logger.info(f"Planned Take Profit Price: {take_profit_price}")
+            logger.info("Planned Take Profit Price: %s", take_profit_price)
         
         main_order_result: dict[str, Any] = {}
         sl_order_result: dict[str, Any] = {}
@@ -243,34 +444,33 @@ class FutureExecution:
 
         # Optional: Warning for symbol format, specific to Hyperliquid's common pattern
         if ':' not in symbol:
-            logger.warning(f"Symbol {symbol} may not be a typical futures/perpetual pair for Hyperliquid (usually contains ':'). Proceeding.")
+            logger.warning("Symbol %s may not be a typical futures/perpetual pair for Hyperliquid (usually contains ':'). Proceeding.", symbol)
+
+        self._validate_inputs(symbol, side, leverage, take_profit_price, stop_loss_price)
         
         try: 
+            # Market status, ticker, market info and balance are fetched together up front
+            market_active, ticker_info, market_info, balances = self._preflight(symbol, ticker_info, market_info)
+
             # 1. Market active check
-            self._check_market_active(symbol) 
+            self._check_market_active(symbol, market_active) 
 
-            # 2. Fetch ticker & determine current price
-            ticker_info: dict[str, Any] = self._get_ticker_info(symbol)
-            current_price: float = float(ticker_info['last']) if float(ticker_info['last']) else float(ticker_info['ask'])
+            # 2. Determine current price from the ticker
+            last_price: Any = ticker_info.get('last')
+            ask_price: Any = ticker_info.get('ask')
+            current_price: float = float(last_price) if last_price else (float(ask_price) if ask_price else 0.0)
             if not current_price or current_price <= 0:
-                logger.error(f"Invalid current price ({current_price}) for {symbol} from ticker. Last: {ticker_info.get('last')}, Ask: {ticker_info.get('ask')}")
+                logger.error(f"Invalid current price ({current_price}) for {symbol} from ticker. Last: {last_price}, Ask: {ask_price}")
                 raise TickerFetchError(f"Invalid or zero/negative current price ({current_price}) for {symbol} from ticker.") 
  
             # Validate TP/SL prices against current price and side
-            if side == 'buy':
-                if take_profit_price is not None and take_profit_price <= current_price:
-                    raise ValueError(f"For a 'buy' order, Take Profit price ({take_profit_price}) must be greater than current price ({current_price}).")
-                if stop_loss_price is not None and stop_loss_price >= current_price:
-                    raise ValueError(f"For a 'buy' order, Stop Loss price ({stop_loss_price}) must be less than current price ({current_price}).")
-            elif side == 'sell':
-                if take_profit_price is not None and take_profit_price >= current_price:
-                    raise ValueError(f"For a 'sell' order, Take Profit price ({take_profit_price}) must be less than current price ({current_price}).")
-                if stop_loss_price is not None and stop_loss_price <= current_price:
-                    raise ValueError(f"For a 'sell' order, Stop Loss price ({stop_loss_price}) must be greater than current price ({current_price}).")
+            tp_invalid, sl_invalid, tp_direction, sl_direction = _SIDE_RULES[side]
+            if take_profit_price is not None and tp_invalid(take_profit_price, current_price):
+                raise ValueError(f"For a '{side}' order, Take Profit price ({take_profit_price}) must be {tp_direction} than current price ({current_price}).")
+            if stop_loss_price is not None and sl_invalid(stop_loss_price, current_price):
+                raise ValueError(f"For a '{side}' order, Stop Loss price ({stop_loss_price}) must be {sl_direction} than current price ({current_price}).")
 
             # 3. Calculate minimum viable base amount
-            market_info: dict[str, Any] = self._get_market_info(symbol)
-
             # Pass leverage to _calculate_min_order_amount
             min_viable_base_amount: float = self._calculate_min_order_amount(symbol, current_price, market_info, leverage)
             final_base_amount_to_trade: float # final base amount to trade in units 
@@ -287,93 +487,140 @@ class FutureExecution:
                 logger.info("No target USDC amount specified or it's invalid. Using calculated minimum viable trade amount.")
                 final_base_amount_to_trade = min_viable_base_amount
             
-            logger.info(f"Final base amount to trade for {symbol}: {final_base_amount_to_trade:.8f} units.")
+            logger.info("Final base amount to trade for %s: %.8f units.", symbol, final_base_amount_to_trade)
 
             # 4. Calculate dynamic slippage
             dynamic_slippage: float = self._calculate_dynamic_slippage(ticker_info, current_price)
 
             # 5. Calculate estimated cost and check wallet balance
             estimated_cost_for_order: float = final_base_amount_to_trade * current_price * (1 + dynamic_slippage)
-            # Calculate the actual margin required based on leverage
-            # Ensure leverage is not zero to avoid DivisionByZeroError, though typically leverage is >= 1
-            if leverage <= 0:
-                logger.error(f"Invalid leverage value ({leverage}) for margin calculation. Must be greater than 0.")
-                raise ValueError(f"Leverage must be greater than 0, got {leverage}")
+            # Calculate the actual margin required based on leverage (validated > 0 up front)
             required_margin: float = estimated_cost_for_order / leverage
             
-            logger.info(f"Estimated cost (notional value) with slippage for {final_base_amount_to_trade:.8f} units: {estimated_cost_for_order:.2f} USDC")
-            logger.info(f"Required margin for this order (with {leverage}x leverage): {required_margin:.2f} USDC")
-            self._check_wallet_balance(required_margin) # Pass required_margin instead of estimated_cost_for_order
+            logger.info("Estimated cost (notional value) with slippage for %.8f units: %.2f USDC", final_base_amount_to_trade, estimated_cost_for_order)
+            logger.info("Required margin for this order (with %sx leverage): %.2f USDC", leverage, required_margin)
+            self._check_wallet_balance(required_margin, balances) # Pass required_margin instead of estimated_cost_for_order
 
             # 6. Set leverage for the symbol on the exchange
-            logger.info(f"Attempting to set leverage for {symbol} to {int(leverage)}x before placing order.")
-            self.order_manager.set_leverage_for_symbol(symbol, int(leverage)) # Assuming set_leverage_for_symbol handles if exchange doesn't support it
+            if self._leverage_cache.get(symbol) != int(leverage):
+                logger.info("Attempting to set leverage for %s to %sx before placing order.", symbol, int(leverage))
+                self.order_manager.set_leverage_for_symbol(symbol, int(leverage)) # Assuming set_leverage_for_symbol handles if exchange doesn't support it
+                self._leverage_cache[symbol] = int(leverage)
+            else:
+                logger.info("Leverage for %s already set to %sx, skipping.", symbol, int(leverage))
             
-            # 7. Place main order
+            # 7. Place main order, together with its TP/SL orders in one request when the exchange supports it
             logger.info("All pre-flight checks passed. Ready to place main order.")
             
             main_order_params: dict[str, Any] = {'slippage': dynamic_slippage, 'leverage': leverage}
-            logger.info(f"Constructed main_order_params: {main_order_params}")
+            logger.info("Constructed main_order_params: %s", main_order_params)
 
-            main_order_result = self.order_manager.create_order(
-                symbol=symbol,
-                type=order_type,
-                side=side,
-                amount=final_base_amount_to_trade,
-                price=current_price, # Pass current_price for market orders as well, as required by Hyperliquid
-                params=main_order_params
-            )
-            self._log_order_summary("Main order placement", main_order_result)
+            # Determine side for TP/SL orders (opposite of main order)
+            opposite_side = 'sell' if side == 'buy' else 'buy'
 
-            # If main order is successful, attempt to place TP/SL orders
-            if main_order_result and main_order_result.get('id'):
-                logger.info(f"Main order ID: {main_order_result.get('id')}. Proceeding with TP/SL if specified.")
+            main_order_request: dict[str, Any] = {
+                'symbol': symbol,
+                'type': order_type,
+                'side': side,
+                'amount': final_base_amount_to_trade,
+                'price': current_price, # Pass current_price for market orders as well, as required by Hyperliquid
+                'params': main_order_params,
+            }
+            sl_order_request: dict[str, Any] | None = None
+            if stop_loss_price is not None:
+                # Based on GitHub issue, for Hyperliquid SL: amount=0, price=trigger_price 
+                sl_order_request = {
+                    'symbol': symbol,
+                    'type': 'STOP_MARKET', # Or 'stop'. Could also be 'stop_limit' if a limit_price for SL is desired.
+                    'side': opposite_side,
+                    'amount': 0, # Crucial for Hyperliquid SL according to GitHub issue
+                    'price': stop_loss_price, # This is the trigger price for STOP_MARKET
+                    'params': {**_SL_PARAMS_TEMPLATE, 'stopPrice': stop_loss_price},
+                }
+            tp_order_request: dict[str, Any] | None = None
+            if take_profit_price is not None:
+                tp_order_request = {
+                    'symbol': symbol,
+                    'type': 'LIMIT', # Take profit is typically a limit order
+                    'side': opposite_side,
+                    'amount': final_base_amount_to_trade, # TP amount should match the main trade
+                    'price': take_profit_price,
+                    'params': dict(_TP_PARAMS_TEMPLATE),
+                }
 
-                # Determine side for TP/SL orders (opposite of main order)
-                opposite_side = 'sell' if side == 'buy' else 'buy'
+            # Track if TP and SL orders were successfully placed
+            tp_success = False
+            sl_success = False
 
-                # Track if TP and SL orders were successfully placed
-                tp_success = False
-                sl_success = False
+            try:
+                batch_results: list[dict[str, Any]] | None = None
+                if sl_order_request is not None or tp_order_request is not None:
+                    batch_results = self._create_orders_batch(
+                        [request for request in (main_order_request, sl_order_request, tp_order_request) if request is not None]
+                    )
+
+                if batch_results is not None:
+                    # The response has one entry per submitted order, in submission order
+                    remaining_results = iter(batch_results)
+                    main_order_result = next(remaining_results, None)
+                    if not self._order_succeeded(main_order_result):
+                        # The batch is not grouped, so TP/SL orders the exchange accepted would stay live without a position
+                        self._cancel_orphaned_orders(symbol, list(remaining_results))
+                        raise ccxt.InvalidOrder(f"Main order for {symbol} was rejected: {self._order_error(main_order_result)}")
+                    self._log_order_summary("Main order placement", main_order_result)
+
+                    if sl_order_request is not None:
+                        sl_order_result = next(remaining_results, None)
+                        sl_success = self._order_succeeded(sl_order_result)
+                        if sl_success:
+                            self._log_order_summary("Stop Loss order placement", sl_order_result)
+                        else:
+                            logger.error(f"Failed to place Stop Loss order for {symbol}: {self._order_error(sl_order_result)}")
+                            sl_order_result = None
+                    if tp_order_request is not None:
+                        tp_order_result = next(remaining_results, None)
+                        tp_success = self._order_succeeded(tp_order_result)
+                        if tp_success:
+                            self._log_order_summary("Take Profit order placement", tp_order_result)
+                        else:
+                            logger.error(f"Failed to place Take Profit order for {symbol}: {self._order_error(tp_order_result)}")
+                            tp_order_result = None
+                else:
+                    main_order_result = self.order_manager.create_order(**main_order_request)
+                    self._log_order_summary("Main order placement", main_order_result)
+            except ccxt.BadSymbol:
+                # Cached market data no longer matches the exchange; reload it and refetch it on the next attempt
+                self._invalidate_symbol_cache(symbol)
+                self.order_manager.reload_markets()
+                raise
+            except ccxt.ExchangeError:
+                # Leverage may have been changed outside this process; set it again on the next attempt
+                self._leverage_cache.pop(symbol, None)
+                raise
+
+            # If main order is successful, attempt to place TP/SL orders (unless they already went out with it)
+            if main_order_result and main_order_result.get('id'):
+                logger.info("Main order ID: %s. Proceeding with TP/SL if specified.", main_order_result.get('id'))
 
                 # Place Stop Loss Order
-                if stop_loss_price is not None:
+                if batch_results is None and sl_order_request is not None:
                     try:
-                        logger.info(f"Attempting to place Stop Loss order for {symbol} at {stop_loss_price}")
-                        sl_params = {'reduceOnly': True}
-                        # Based on GitHub issue, for Hyperliquid SL: amount=0, price=trigger_price 
-                        sl_params['stopPrice'] = stop_loss_price
-
-                        sl_order_result = self.order_manager.create_order(
-                            symbol=symbol,
-                            type='STOP_MARKET', # Or 'stop'. Could also be 'stop_limit' if a limit_price for SL is desired.
-                            side=opposite_side,
-                            amount=0, # Crucial for Hyperliquid SL according to GitHub issue
-                            price=stop_loss_price, # This is the trigger price for STOP_MARKET
-                            params=sl_params
-                        )
+                        logger.info("Attempting to place Stop Loss order for %s at %s", symbol, stop_loss_price)
+                        sl_order_result = self.order_manager.create_order(**sl_order_request)
                         self._log_order_summary("Stop Loss order placement", sl_order_result)
                         sl_success = True
-                    except Exception as e_sl:
+                    except (ccxt.NetworkError, ccxt.ExchangeError) as e_sl:
                         logger.error(f"Failed to place Stop Loss order for {symbol}: {e_sl}")
                         sl_order_result = None
 
                 # Place Take Profit Order
-                if take_profit_price is not None:
+                if batch_results is None and tp_order_request is not None:
                     try:
-                        logger.info(f"Attempting to place Take Profit order for {symbol} at {take_profit_price}")
-                        tp_params = {'reduceOnly': True}
-                        tp_order_result = self.order_manager.create_order(
-                            symbol=symbol,
-                            type='LIMIT', # Take profit is typically a limit order
-                            side=opposite_side,
-                            amount=final_base_amount_to_trade, # TP amount should match the main trade
-                            price=take_profit_price,
-                            params=tp_params
-                        )
+                        logger.info("Attempting to place Take Profit order for %s at %s", symbol, take_profit_price)
+                        tp_order_result = self.order_manager.create_order(**tp_order_request)
                         self._log_order_summary("Take Profit order placement", tp_order_result)
                         tp_success = True
-                    except Exception as e_tp:
+                    except (ccxt.NetworkError, ccxt.ExchangeError) as e_tp:
                         logger.error(f"Failed to place Take Profit order for {symbol}: {e_tp}")
                         tp_order_result = None
 
@@ -382,7 +629,7 @@ class FutureExecution:
                     logger.warning("Both TP and SL orders failed. Cancelling main order.")
                     try:
                         self.order_manager.cancel_order(main_order_result['id'], symbol)
-                        logger.info(f"Successfully cancelled main order {main_order_result.get('id')} due to both TP and SL failures.")
+                        logger.info("Successfully cancelled main order %s due to both TP and SL failures.", main_order_result.get('id'))
                         raise DependentOrderError(f"Both Take Profit and Stop Loss orders failed for {symbol}. Main order has been cancelled.")
                     except Exception as e_cancel:
                         logger.error(f"Failed to cancel main order {main_order_result.get('id')}: {e_cancel}")
@@ -397,7 +644,7 @@ class FutureExecution:
                 "stop_loss_order_id": sl_order_result.get('id') if sl_order_result else None,
                 "take_profit_order_id": tp_order_result.get('id') if tp_order_result else None,
             }
-            logger.info(f"Trade execution summary for {symbol}: {trade_execution_summary}")
+            logger.info("Trade execution summary for %s: %s", symbol, trade_execution_summary)
             
             return {
                 "main_order": main_order_result,
@@ -408,10 +655,331 @@ class FutureExecution:
         except (MarketNotActiveError, MarketInfoError, TickerFetchError, WalletBalanceError, ValueError, DependentOrderError) as e:  # Added DependentOrderError here
             logger.error(f"Trade execution aborted for {symbol}: {e}")
             raise 
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            # Expected failure modes of the exchange; the operation that failed has already logged the details
+            logger.error(f"Trade execution failed for {symbol} due to an exchange error: {e}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error occurred during trade execution for {symbol}")
             raise
 
+    def make_executor(self, symbol: str) -> Callable[..., Any]:
+        """
+        Binds execute_trade to one symbol, for bots that trade a small fixed set of markets.
+
+        The market is checked and its info resolved here, once. The returned
+        execute(side, target_usdc_amount=None, take_profit_price=None, stop_loss_price=None, leverage=2, order_type='market')
+        passes it along, so each trade only fetches the ticker and balance before placing orders.
+        The market is resolved again after execute.invalidate(), or once the shared market cache has dropped it
+        (e.g. after a BadSymbol rejection). On AsyncFutureExecution, execute returns an awaitable.
+        """
+        self._check_market_active(symbol)
+        market_info: dict[str, Any] = self._get_market_info(symbol)
+
+        def execute(side: str,
+                    target_usdc_amount: float | None = None,
+                    take_profit_price: float | None = None,
+                    stop_loss_price: float | None = None,
+                    leverage: int = 2,
+                    order_type: str = 'market') -> Any:
+            nonlocal market_info
+            if self._market_info_cache.get(symbol) is not market_info:
+                market_info = self._get_market_info(symbol)
+            return self.execute_trade(
+                symbol=symbol,
+                side=side,
+                order_type=order_type,
+                target_usdc_amount=target_usdc_amount,
+                take_profit_price=take_profit_price,
+                stop_loss_price=stop_loss_price,
+                leverage=leverage,
+                market_info=market_info
+            )
+
+        def invalidate() -> None:
+            """Drops the cached market, ticker and leverage for the symbol so the next trade resolves them again."""
+            self._invalidate_symbol_cache(symbol)
+
+        execute.invalidate = invalidate
+        return execute
+
+    def execute_batch(self,
+                      symbols: list[str],
+                      sides: list[str],
+                      target_usdc_amounts: list[float | None],
+                      leverages: list[int] | None = None,
+                      order_type: str = 'market') -> list[dict[str, Any] | None]:
+        """
+        Opens positions (without TP/SL) for several symbols at once.
+
+        Tickers come from one fetch_tickers request, order sizes, slippage and required margin are computed
+        for all rows with NumPy, and the orders go out in one batched create_orders request. Margin is
+        allocated in row order against the free USDC balance. Rows the vectorized path cannot size (unknown
+        or inactive market, non-decimal amount precision, invalid side or leverage, no usable price) are
+        executed one by one through execute_trade afterwards.
+
+        Returns:
+            list: The main order result per row, in input order, or None where no order was placed.
+        """
+        n: int = len(symbols)
+        if len(sides) != n or len(target_usdc_amounts) != n or (leverages is not None and len(leverages) != n):
+            raise ValueError("symbols, sides, target_usdc_amounts and leverages must have the same length.")
+        sides = [side.lower() for side in sides]
+        leverages = list(leverages) if leverages is not None else [2] * n
+        results: list[dict[str, Any] | None] = [None] * n
+
+        # Rows whose market cannot be sized here take the per-symbol path; the vectorized rounding below
+        # scales by powers of ten, so markets with another step (mode 'step') go per symbol too
+        market_infos: list[dict[str, Any] | None] = []
+        fallback: np.ndarray = np.zeros(n, dtype=bool)
+        for i, symbol in enumerate(symbols):
+            try:
+                market_info: dict[str, Any] | None = self._get_market_info(symbol)
+            except ValueError:
+                market_info = None
+            market_infos.append(market_info)
+            fallback[i] = (market_info is None or not market_info.get('active', False)
+                           or _precision_spec(market_info['precision']['amount']).mode != 'decimal'
+                           or sides[i] not in _SIDE_RULES or leverages[i] <= 0)
+
+        rows: np.ndarray = np.flatnonzero(~fallback)
+        if rows.size:
+            tickers: dict[str, dict[str, Any]] = self.order_manager.get_tickers_info(
+                list(dict.fromkeys(symbols[i] for i in rows))
+            ) or {}
+            fetched_at: float = time.monotonic()
+            for symbol, ticker in tickers.items():
+                self._ticker_cache[symbol] = (fetched_at, ticker)
+
+            def column(values) -> np.ndarray:
+                return np.array([float(v) if v else np.nan for v in values], dtype=np.float64)
+
+            row_tickers: list[dict[str, Any]] = [tickers.get(symbols[i]) or {} for i in rows]
+            last: np.ndarray = column(t.get('last') for t in row_tickers)
+            bid: np.ndarray = column(t.get('bid') for t in row_tickers)
+            ask: np.ndarray = column(t.get('ask') for t in row_tickers)
+            prices: np.ndarray = np.where(last > 0, last, ask)
+            min_costs: np.ndarray = np.nan_to_num(column(market_infos[i]['limits']['cost']['min'] for i in rows))
+            min_limits: np.ndarray = np.nan_to_num(column(market_infos[i]['limits']['amount']['min'] for i in rows))
+            scales: np.ndarray = np.array([_precision_spec(market_infos[i]['precision']['amount']).scale for i in rows], dtype=np.float64)
+            leverage_arr: np.ndarray = np.array([leverages[i] for i in rows], dtype=np.float64)
+            targets: np.ndarray = np.nan_to_num(column(target_usdc_amounts[i] for i in rows))
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Same rules as _min_amount_kernel / _usdc_to_base_amount. Scaled values are rounded to 6 places
+                # before floor/ceil so float error (0.29 * 100 == 28.999999999999996) cannot cost a whole tick.
+                raw_min_amounts: np.ndarray = np.maximum.reduce([
+                    np.where(min_costs > 0, min_costs / prices, 0.0),
+                    min_limits,
+                    (11.0 / leverage_arr) / prices,
+                ])
+                min_viable: np.ndarray = np.ceil(np.round(raw_min_amounts * scales, 6)) / scales
+
+                desired: np.ndarray = targets / prices
+                adjusted: np.ndarray = np.floor(np.round(desired * scales, 6)) / scales
+                adjusted = np.where((adjusted == 0) & (desired > 0), 1.0 / scales, adjusted)
+                amounts: np.ndarray = np.where(targets > 0, np.maximum(adjusted, min_viable), min_viable)
+
+                spread_ok: np.ndarray = (bid > 0) & (ask > 0) & (ask >= bid)
+                slippage: np.ndarray = np.where(spread_ok, np.clip((ask - bid) / prices * 2, 0.005, 0.05), 0.01)
+                required_margin: np.ndarray = amounts * prices * (1 + slippage) / leverage_arr
+
+            priced: np.ndarray = prices > 0
+            fallback[rows[~priced]] = True
+
+            balances: dict[str, Any] | None = self.wallet_manager.get_balance()
+            if not balances or 'USDC' not in balances or 'free' not in balances['USDC']:
+                msg: str = "Cannot fetch wallet balance for USDC or missing 'free' field."
+                logger.error(msg)
+                raise WalletBalanceError(msg)
+            available_balance: float = float(balances['USDC']['free'])
+            # Margin is taken from this running total only for rows that are actually submitted, in row order
+            remaining_balance: float = available_balance
+
+            order_requests: list[dict[str, Any]] = []
+            request_rows: list[int] = []
+            for j in np.flatnonzero(priced):
+                i: int = int(rows[j])
+                if required_margin[j] > remaining_balance:
+                    logger.warning("Insufficient balance for %s in batch: %.2f USDC margin required, %.2f USDC left.",
+                                   symbols[i], required_margin[j], remaining_balance)
+                    continue
+                try:
+                    if self._leverage_cache.get(symbols[i]) != int(leverages[i]):
+                        self.order_manager.set_leverage_for_symbol(symbols[i], int(leverages[i]))
+                        self._leverage_cache[symbols[i]] = int(leverages[i])
+                except Exception as e:
+                    logger.error(f"Skipping {symbols[i]} in batch, could not set leverage: {e}")
+                    continue
+                order_requests.append({
+                    'symbol': symbols[i],
+                    'type': order_type,
+                    'side': sides[i],
+                    'amount': float(amounts[j]),
+                    'price': float(prices[j]), # Hyperliquid needs a price for market orders as well
+                    'params': {'slippage': float(slippage[j]), 'leverage': leverages[i]},
+                })
+                request_rows.append(i)
+                remaining_balance -= float(required_margin[j])
+            logger.info("Batch of %d priced order(s): %d submitted within the available %.2f USDC margin.",
+                        priced.sum(), len(order_requests), available_balance)
+
+            if order_requests:
+                batch_results: list[dict[str, Any]] | None = None
+                try:
+                    batch_results = self._create_orders_batch(order_requests)
+                except Exception as e:
+                    # The request may have reached the exchange, so these rows are not retried one by one
+                    logger.error(f"Batched order placement failed for {len(order_requests)} order(s): {e}")
+                    batch_results = []
+                if batch_results is None:
+                    fallback[request_rows] = True
+                else:
+                    for i, order_result in zip(request_rows, batch_results):
+                        if self._order_succeeded(order_result):
+                            results[i] = order_result
+                            self._log_order_summary(f"Batch order for {symbols[i]}", order_result)
+                        else:
+                            logger.error(f"Batch order for {symbols[i]} was rejected: {self._order_error(order_result)}")
+
+        for i in np.flatnonzero(fallback):
+            try:
+                # The synchronous implementation, also on AsyncFutureExecution, whose execute_batch runs this in a worker thread
+                results[i] = FutureExecution.execute_trade(
+                    self,
+                    symbol=symbols[i],
+                    side=sides[i],
+                    order_type=order_type,
+                    target_usdc_amount=target_usdc_amounts[i],
+                    leverage=leverages[i]
+                ).get('main_order')
+            except Exception as e:
+                logger.error(f"Batch row for {symbols[i]} failed on the per-symbol path: {e}")
+        return results
+
+class AsyncFutureExecution(FutureExecution):
+    """
+    FutureExecution with an awaitable execute_trade and execute_batch.
+
+    The pre-flight ticker and balance requests are gathered on a ccxt.async_support client whose
+    aiohttp session keeps up to 8 connections alive across trades, so TCP/TLS handshakes are paid once.
+    Everything after the pre-flight, including order signing and placement, is the synchronous
+    FutureExecution logic running in a worker thread. Use one instance per event loop and await close() when done.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._async_exchange: ccxt_async.Exchange | None = None
+        self._async_markets: dict[str, Any] | None = None  # The order manager's markets last copied to the async client
+
+    def _get_async_exchange(self) -> ccxt_async.Exchange:
+        """Creates the shared async client on first use. Must be called on the event loop."""
+        if self._async_exchange is None:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60))
+            self._async_exchange = ccxt_async.hyperliquid({
+                # Credentials come from the sync client; wallet_address is only set on the first initialized singleton
+                'walletAddress': self.order_manager.exchange.walletAddress, # Balances are looked up by wallet address
+                'privateKey': self.order_manager.exchange.privateKey, # Same signing key as the sync client
+                'enableRateLimit': True,
+                'session': self._session, # ccxt leaves a session it did not create open; close() owns it
+            })
+        if self.order_manager.markets and self.order_manager.markets is not self._async_markets:
+            # Reuse the already loaded markets instead of downloading them again, and pick up later reloads
+            self._async_exchange.set_markets(self.order_manager.markets, self.order_manager.exchange.currencies)
+            self._async_markets = self.order_manager.markets
+        return self._async_exchange
+
+    async def close(self) -> None:
+        """Closes the async client and its HTTP session."""
+        if self._async_exchange is not None:
+            await self._async_exchange.close()
+            self._async_exchange = None
+            self._async_markets = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_ticker_info_async(self, symbol: str) -> dict[str, Any]:
+        """Async counterpart of _get_ticker_info, sharing its TTL cache."""
+        cached: tuple[float, dict[str, Any]] | None = self._ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.TICKER_TTL_SECONDS:
+            return cached[1]
+
+        ticker: dict[str, Any] | None = None
+        try:
+            ticker = await self._get_async_exchange().fetch_ticker(symbol)
+        except Exception as e:
+            self.order_manager._handle_operation_error(f"fetching ticker for {symbol}", e)
+        if not ticker:
+            raise ValueError(f"Ticker for {symbol} not found.")
+        self._ticker_cache[symbol] = (time.monotonic(), ticker)
+        logger.info("Successfully fetched ticker info for %s.", symbol)
+        return ticker
+
+    async def _get_balance_async(self, wallet_type: str = 'margin') -> dict[str, Any] | None:
+        """Async counterpart of CcxtWalletManagement.get_balance. Returns None if the fetch fails."""
+        try:
+            balance: dict[str, Any] = await self._get_async_exchange().fetch_balance({'type': wallet_type})
+            logger.info("Balance fetched for wallet_type=%s", wallet_type)
+            return balance
+        except Exception as e:
+            self.wallet_manager._handle_operation_error("fetch_balance", e)
+            return None
+
+    async def _preflight_async(self,
+                               symbol: str,
+                               ticker_info: dict[str, Any] | None = None,
+                               market_info: dict[str, Any] | None = None
+                               ) -> tuple[bool, dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+        """
+        Async counterpart of _preflight. Ticker and balance are fetched concurrently on the keep-alive client;
+        market status and market info are read from the loaded markets and need no request.
+        """
+        if ticker_info is None:
+            ticker_info, balances = await asyncio.gather(self._get_ticker_info_async(symbol), self._get_balance_async())
+        else:
+            balances = await self._get_balance_async()
+        if market_info is not None:
+            return bool(market_info.get('active', False)), ticker_info, market_info, balances
+        return self.order_manager.is_market_active(symbol), ticker_info, self._get_market_info(symbol), balances
+
+    def _preflight(self,
+                   symbol: str,
+                   ticker_info: dict[str, Any] | None = None,
+                   market_info: dict[str, Any] | None = None
+                   ) -> tuple[bool, dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+        """Runs _preflight_async on the event loop that awaited execute_trade. Called from the worker thread."""
+        return asyncio.run_coroutine_threadsafe(self._preflight_async(symbol, ticker_info, market_info), self._loop).result()
+
+    async def execute_trade(self,
+                            symbol: str,
+                            side: str,
+                            order_type: str = 'market',
+                            target_usdc_amount: float | None = None,
+                            take_profit_price: float | None = None,
+                            stop_loss_price: float | None = None,
+                            leverage: int = 2,
+                            ticker_info: dict[str, Any] | None = None,
+                            market_info: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Awaitable FutureExecution.execute_trade; arguments and result are the same."""
+        self._loop = asyncio.get_running_loop()
+        return await asyncio.to_thread(
+            super().execute_trade,
+            symbol, side, order_type, target_usdc_amount, take_profit_price, stop_loss_price, leverage, ticker_info, market_info
+        )
+
+    async def execute_batch(self,
+                            symbols: list[str],
+                            sides: list[str],
+                            target_usdc_amounts: list[float | None],
+                            leverages: list[int] | None = None,
+                            order_type: str = 'market') -> list[dict[str, Any] | None]:
+        """Awaitable FutureExecution.execute_batch; arguments and result are the same."""
+        self._loop = asyncio.get_running_loop()
+        return await asyncio.to_thread(super().execute_batch, symbols, sides, target_usdc_amounts, leverages, order_type)
+
 # --- example execution used ---
 # if __name__ == "__main__":
 #     logger.info("=== Script Start: Hyperliquid Future Execution ===")
@@ -445,7 +1013,8 @@ class FutureExecution:
 #             target_usdc_amount=target_trade_value_usdc,
 #             leverage=2,
 #             stop_loss_price=sl_price,
-#             take_profit_price=tp_price
+#             take_profit_price=tp_price,
+#             ticker_info=ticker # Reuse the ticker fetched above instead of fetching it again
 #         )
 #         # Using the new helper for final logging as well
 #         executor._log_order_summary("Final Main order result", trade_results.get('main_order'))
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+import ccxt # type: ignore
+import ccxt.pro as ccxtpro # type: ignore
+from ..log.logger import logger
+
+class MarkPriceCache:
+    """
+    Keeps the latest price of the subscribed symbols in memory, streamed over the Hyperliquid
+    websocket with ccxt.pro watch_tickers, so closing positions does not have to request tickers.
+
+    run() is a coroutine to schedule on the bot's event loop; subscribe() and get() are plain
+    methods that can be called from synchronous code. A price older than max_age_seconds is
+    treated as missing, so callers fall back to a REST ticker instead of trading on a stale price.
+    """
+
+    def __init__(self, symbols: Optional[Iterable[str]] = None, max_age_seconds: float = 5.0) -> None:
+        self.max_age_seconds: float = max_age_seconds
+        self._subscribed: Set[str] = set(symbols or ())
+        self._prices: Dict[str, Tuple[float, float]] = {}  # symbol -> (monotonic time received, price)
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        """Adds symbols to the stream; run() picks them up on its next update."""
+        self._subscribed.update(symbol for symbol in symbols if symbol)
+
+    def get(self, symbol: str) -> Optional[float]:
+        """Returns the streamed price of symbol, or None if it is not subscribed yet or the price is stale."""
+        entry: Optional[Tuple[float, float]] = self._prices.get(symbol)
+        if entry is None or time.monotonic() - entry[0] > self.max_age_seconds:
+            return None
+        return entry[1]
+
+    async def run(self) -> None:
+        """
+        Streams the tickers of the subscribed symbols until cancelled.
+        Network errors are logged and the subscription is retried after a second.
+        """
+        pro_exchange: ccxtpro.Exchange = ccxtpro.hyperliquid({'enableRateLimit': True})
+        try:
+            while True:
+                if not self._subscribed:
+                    await asyncio.sleep(1)
+                    continue
+                try:
+                    tickers = await pro_exchange.watch_tickers(sorted(self._subscribed))
+                except ccxt.NetworkError as e:
+                    logger.warning("Mark price stream interrupted, resubscribing: %s", e)
+                    await asyncio.sleep(1)
+                    continue
+                received_at: float = time.monotonic()
+                for symbol, ticker in tickers.items():
+                    price = ticker.get('last') or ticker.get('ask')
+                    if price:
+                        self._prices[symbol] = (received_at, float(price))
+        finally:
+            await pro_exchange.close()
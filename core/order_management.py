@@ -1,7 +1,47 @@
 from ..ccxt_base import CcxtBase
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping
+import aiohttp
+import asyncio
 import ccxt # type: ignore
+import ccxt.async_support as ccxt_async # type: ignore
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from types import MappingProxyType
 from ..log.logger import logger
+from .mark_price_cache import MarkPriceCache
+
+# Most orders submitted in one createOrders request
+_BATCH_ORDER_LIMIT: int = 10
+
+# Fixed parameters of a position-closing market order (1% slippage). Orders get a fresh copy,
+# since ccxt writes into the params dict it is given
+_CLOSE_PARAMS_TEMPLATE: Mapping[str, Any] = MappingProxyType({'reduceOnly': True, 'slippage': 0.01})
+# Position sides that a sell (for longs) or a buy (for shorts) closes
+_LONG_SIDES: frozenset[str] = frozenset({'long', 'buy'})
+_SHORT_SIDES: frozenset[str] = frozenset({'short', 'sell'})
+
+@dataclass(frozen=True, slots=True)
+class Position:
+    """
+    The fields of a CCXT position structure that the order and portfolio code use.
+    Parsed once with from_ccxt, so the fallbacks between CCXT's field names live in one place.
+    """
+    symbol: str
+    side: str  # 'long', 'short', or '' when the exchange did not report it
+    contracts: float  # As reported; a signed amount is kept signed
+    entry_price: Optional[float]
+
+    @classmethod
+    def from_ccxt(cls, position: Dict[str, Any]) -> 'Position':
+        amount = position.get('contracts') or position.get('positionAmt') or position.get('amount')
+        entry_price = position.get('entryPrice') or position.get('avgEntryPrice')
+        return cls(
+            symbol=position.get('symbol') or '',
+            side=(position.get('side') or '').lower(),
+            contracts=float(amount) if amount is not None else 0.0,
+            entry_price=float(entry_price) if entry_price is not None else None,
+        )
 
 class CcxtOrderManagement(CcxtBase):
     """
@@ -10,15 +50,37 @@ class CcxtOrderManagement(CcxtBase):
     All messages related to order management operations are logged.
     """
 
-    def __init__(self) -> None:
+    # Positions and balance are reused for this long, so one workflow does not refetch them for every step.
+    # Orders placed or cancelled through this class drop both immediately.
+    ACCOUNT_TTL_SECONDS: float = 0.5
+    _positions_cache: Optional[tuple[float, List[Dict[str, Any]]]] = None
+    _balance_cache: Optional[tuple[float, Dict[str, Any]]] = None
+    mark_price_cache: Optional[MarkPriceCache] = None
+    # close_all_orders lists the open orders again before cancelling when its listing is older than this
+    OPEN_ORDERS_RECHECK_SECONDS: float = 1.0
+
+    def __init__(self, mark_price_cache: Optional[MarkPriceCache] = None) -> None:
         """
         Initializes the CcxtOrderManagement by calling the parent CcxtBase
         constructor, which ensures the CCXT Hyperliquid exchange is initialized.
+        A mark_price_cache, when given, supplies the prices of closing orders; the symbols
+        of fetched positions are subscribed to it.
         """
+        if mark_price_cache is not None:
+            self.mark_price_cache = mark_price_cache
+        if self._initialized:  # Singleton already set up by an earlier construction
+            return
         super().__init__()
         # Ensure the exchange is available before proceeding with order operations
         if not self.exchange:
             logger.warning("Hyperliquid exchange not initialized. Order operations may fail.")
+        # The exchange's capabilities do not change, so they are looked up once
+        has: Dict[str, Any] = self.exchange.has if self.exchange else {}
+        self._has_create_orders: bool = bool(has.get('createOrders'))
+        self._has_set_leverage: bool = bool(has.get('setLeverage'))
+        self._has_fetch_tickers: bool = bool(has.get('fetchTickers'))
+        self._has_cancel_all_orders: bool = bool(has.get('cancelAllOrders'))
+        self._has_cancel_orders: bool = bool(has.get('cancelOrders'))
 
     def create_order(
         self,
@@ -66,12 +128,143 @@ class CcxtOrderManagement(CcxtBase):
 
         try:
             order: Dict[str, Any] = self.exchange.create_order(symbol, type, side, amount, price, params)
-            logger.info(f"Order created successfully: {order}")
+            logger.info("Order %s created successfully for %s.", order.get('id'), symbol)
+            logger.debug("Created order: %s", order)
             return order
         except Exception as e: 
-            self._handle_operation_error(f"creating {side} {type} order for {symbol}", e) 
-            raise 
-            
+            self._handle_operation_error(f"creating {side} {type} order for {symbol}", e)
+            raise
+        finally:
+            self.invalidate_positions()
+
+    def _market_close(self, symbol: str, side: str, amount: float, price: float) -> Dict[str, Any]:
+        """
+        create_order specialized for the reduce-only market orders that close positions: the callers have
+        already checked the exchange, amount and price, so the order goes straight to the exchange.
+        """
+        try:
+            order: Dict[str, Any] = self.exchange.create_order(symbol, 'market', side, amount, price, dict(_CLOSE_PARAMS_TEMPLATE))
+            logger.info("Order %s created successfully for %s.", order.get('id'), symbol)
+            logger.debug("Created order: %s", order)
+            return order
+        except Exception as e:
+            self._handle_operation_error(f"creating {side} market order for {symbol}", e)
+            raise
+        finally:
+            self.invalidate_positions()
+
+    def create_orders(self, orders: List[Dict[str, Any]], params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Places several orders on Hyperliquid in a single request.
+
+        Args:
+            orders (List[Dict[str, Any]]): One dict per order with the create_order arguments
+                                           ('symbol', 'type', 'side', 'amount', 'price', 'params').
+            params (Optional[Dict[str, Any]]): Additional exchange-specific parameters for the whole request.
+
+        Returns:
+            List[Dict[str, Any]]: One order structure per submitted order, in the same order.
+                                  A rejected order carries the exchange's message in its 'info' error field.
+
+        Raises:
+            RuntimeError: If the exchange is not initialized.
+            ccxt.NotSupported: If the exchange does not support createOrders via CCXT.
+            ccxt.NetworkError: For network-related issues.
+            ccxt.ExchangeError: For exchange-specific errors.
+            Exception: For any other unexpected errors during order creation.
+        """
+        if not self.exchange:
+            logger.error("Exchange not initialized. Cannot create orders.")
+            raise RuntimeError("Exchange not initialized. Cannot create orders.")
+
+        if not self._has_create_orders:
+            raise ccxt.NotSupported(f"Exchange {self.exchange.id} does not support createOrders via CCXT.")
+
+        try:
+            orders_result: List[Dict[str, Any]] = self.exchange.create_orders(orders, params or {})
+            logger.info("%s orders created in one request.", len(orders_result))
+            logger.debug("Created orders: %s", orders_result)
+            return orders_result
+        except Exception as e:
+            self._handle_operation_error(f"creating {len(orders)} orders in one request", e)
+            raise
+        finally:
+            self.invalidate_positions()
+
+    def create_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Places any number of orders, up to _BATCH_ORDER_LIMIT per request when the exchange supports createOrders,
+        otherwise one create_order call per order.
+
+        Args:
+            orders (List[Dict[str, Any]]): One dict per order with the create_order arguments
+                                           ('symbol', 'type', 'side', 'amount', 'price', 'params').
+
+        Returns:
+            List[Any]: One result per order, in the same order: the order structure, or the exception
+                       that rejected it. A failed batch request fails every order in it.
+        """
+        if not self.exchange:
+            logger.error("Exchange not initialized. Cannot create orders.")
+            raise RuntimeError("Exchange not initialized. Cannot create orders.")
+
+        results: List[Any] = []
+        if not self._has_create_orders:
+            for order in orders:
+                try:
+                    results.append(self.create_order(**order))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        for start in range(0, len(orders), _BATCH_ORDER_LIMIT):
+            chunk: List[Dict[str, Any]] = orders[start:start + _BATCH_ORDER_LIMIT]
+            try:
+                results.extend(self._batch_results(chunk, self.create_orders(chunk)))
+            except Exception as e:
+                results.extend([e] * len(chunk))
+        return results
+
+    async def _create_orders_batch_async(self, async_exchange: ccxt_async.Exchange, orders: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Async counterpart of create_orders_batch using the given ccxt.async_support client.
+        The batches (or single orders) are submitted concurrently.
+        """
+        if not self._has_create_orders:
+            return await self._gather_limited(
+                async_exchange.create_order(o['symbol'], o['type'], o['side'], o['amount'], o.get('price'), o.get('params'))
+                for o in orders
+            )
+
+        chunks: List[List[Dict[str, Any]]] = [orders[i:i + _BATCH_ORDER_LIMIT] for i in range(0, len(orders), _BATCH_ORDER_LIMIT)]
+        chunk_results: List[Any] = await self._gather_limited(async_exchange.create_orders(chunk) for chunk in chunks)
+        results: List[Any] = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, BaseException):
+                self._handle_operation_error(f"creating {len(chunk)} orders in one request", chunk_result)
+                results.extend([chunk_result] * len(chunk))
+            else:
+                results.extend(self._batch_results(chunk, chunk_result))
+        return results
+
+    @staticmethod
+    def _batch_results(chunk: List[Dict[str, Any]], orders_result: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Lines up a createOrders response with the submitted orders. An entry the exchange rejected,
+        or that is missing from the response, becomes a ccxt.InvalidOrder carrying the exchange's message.
+        """
+        results: List[Any] = []
+        for i, order in enumerate(chunk):
+            result: Optional[Dict[str, Any]] = orders_result[i] if i < len(orders_result) else None
+            info = result.get('info') if result else None
+            if not result:
+                results.append(ccxt.InvalidOrder(f"No result returned for {order['side']} order on {order['symbol']}."))
+            elif isinstance(info, dict) and info.get('error'):
+                results.append(ccxt.InvalidOrder(f"{order['side']} order on {order['symbol']} rejected: {info['error']}"))
+            else:
+                results.append(result)
+        return results
+
     def set_leverage_for_symbol(self, symbol: str, leverage: int, params: Optional[Dict[str, Any]] = None) -> None:
         """
         Sets the leverage for a specific trading symbol.
@@ -92,7 +285,7 @@ class CcxtOrderManagement(CcxtBase):
             logger.error("Exchange not initialized. Cannot set leverage.")
             raise RuntimeError("Exchange not initialized. Cannot set leverage.")
         
-        if not self.exchange.has.get('setLeverage'):
+        if not self._has_set_leverage:
             msg: str = f"Exchange {self.exchange.id} does not support setLeverage via CCXT."
             # Create an instance of the error to pass to the handler
             error_instance: ccxt.ExchangeError = ccxt.ExchangeError(msg) 
@@ -100,9 +293,9 @@ class CcxtOrderManagement(CcxtBase):
             raise error_instance # Re-raise the specific error instance
 
         try:
-            logger.info(f"Attempting to set leverage for {symbol} to {leverage}x with params: {params}") 
+            logger.info("Attempting to set leverage for %s to %sx with params: %s", symbol, leverage, params) 
             self.exchange.set_leverage(leverage, symbol, params) 
-            logger.info(f"Successfully set leverage for {symbol} to {leverage}x")
+            logger.info("Successfully set leverage for %s to %sx", symbol, leverage)
         except Exception as e: # Catch any exception during the set_leverage call
             self._handle_operation_error(operation=f"setting leverage for {symbol} to {leverage}x", error=e)
             raise  
@@ -117,11 +310,14 @@ class CcxtOrderManagement(CcxtBase):
 
         try:
             cancellation: Dict[str, Any] = self.exchange.cancel_order(order_id, symbol)
-            logger.info(f"Order {order_id} cancelled successfully: {cancellation}")
+            logger.info("Order %s cancelled successfully.", order_id)
+            logger.debug("Cancellation of order %s: %s", order_id, cancellation)
             return cancellation
         except Exception as e:
             self._handle_operation_error(f"cancelling order {order_id} for {symbol}", e)
             raise
+        finally:
+            self.invalidate_positions()
 
     def fetch_order(self, order_id: str, symbol: str) -> Dict[str, Any]: 
         """
@@ -148,7 +344,7 @@ class CcxtOrderManagement(CcxtBase):
 
         try:
             orders: List[Dict[str, Any]] = self.exchange.fetch_open_orders(symbol)
-            logger.info(f"Fetched {len(orders)} open orders for {symbol or 'all symbols'}.")
+            logger.info("Fetched %s open orders for %s.", len(orders), symbol or 'all symbols')
             return orders
         except Exception as e:
             self._handle_operation_error(f"fetching open orders for {symbol or 'all symbols'}", e)
@@ -164,7 +360,7 @@ class CcxtOrderManagement(CcxtBase):
 
         try:
             orders: List[Dict[str, Any]] = self.exchange.fetch_closed_orders(symbol)
-            logger.info(f"Fetched {len(orders)} closed orders for {symbol or 'all symbols'}.")
+            logger.info("Fetched %s closed orders for %s.", len(orders), symbol or 'all symbols')
             return orders
         except Exception as e:
             self._handle_operation_error(f"fetching closed orders for {symbol or 'all symbols'}", e)
@@ -173,14 +369,20 @@ class CcxtOrderManagement(CcxtBase):
     def fetch_balance(self) -> Dict[str, Any]: # Changed return type
         """
         Fetches the account balance for all assets on Hyperliquid.
+        A balance fetched less than ACCOUNT_TTL_SECONDS ago is returned without a new request.
         """
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot fetch balance.")
             raise RuntimeError("Exchange not initialized. Cannot fetch balance.")
-        
+
+        cached: Optional[tuple[float, Dict[str, Any]]] = self._balance_cache
+        if cached is not None and time.monotonic() - cached[0] < self.ACCOUNT_TTL_SECONDS:
+            return cached[1]
+
         try:
             balance: Dict[str, Any] = self.exchange.fetch_balance()
             logger.info("Balance fetched successfully.")
+            self._balance_cache = (time.monotonic(), balance)
             return balance
         except Exception as e:
             self._handle_operation_error("fetching balance", e)
@@ -189,24 +391,45 @@ class CcxtOrderManagement(CcxtBase):
     def fetch_positions(self) -> List[Dict[str, Any]]: 
         """
         Fetches all open positions on Hyperliquid.
+        Positions fetched less than ACCOUNT_TTL_SECONDS ago are returned without a new request.
         """
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot fetch positions.")
             raise RuntimeError("Exchange not initialized. Cannot fetch positions.")
 
+        cached: Optional[tuple[float, List[Dict[str, Any]]]] = self._positions_cache
+        if cached is not None and time.monotonic() - cached[0] < self.ACCOUNT_TTL_SECONDS:
+            return cached[1]
+
         try:
             positions: List[Dict[str, Any]] = self.exchange.fetch_positions()
-            logger.info(f"Fetched {len(positions)} positions.")
+            logger.info("Fetched %s positions.", len(positions))
+            self._positions_cache = (time.monotonic(), positions)
+            if self.mark_price_cache is not None:
+                self.mark_price_cache.subscribe(pos.get('symbol') for pos in positions)
             return positions
         except Exception as e:
             self._handle_operation_error(f"fetching positions", e) 
             raise
 
-    def close_position_by_symbol(self, symbol_to_close: str) -> None:
+    def invalidate_positions(self) -> None:
+        """Drops the cached positions and balance, so the next fetch goes to the exchange."""
+        self._positions_cache = None
+        self._balance_cache = None
+        self._bump_mutation_epoch()
+
+    def close_position_by_symbol(self,
+                                 symbol_to_close: str,
+                                 prefetched_tickers: Optional[Dict[str, Dict[str, Any]]] = None) -> bool:
         """
         Closes a specific open futures position by its symbol.
         Submits a market order in the opposite direction.
         For Hyperliquid, price is required even for market orders.
+        Callers closing several symbols can pass the result of one fetch_tickers call as prefetched_tickers;
+        the ticker is only fetched when the symbol is missing from it.
+
+        Returns:
+            bool: True if a closing order was submitted, False if there was nothing to close or no valid price.
         """
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot close position.")
@@ -214,78 +437,74 @@ class CcxtOrderManagement(CcxtBase):
 
         if ':' not in symbol_to_close:
             logger.warning(
-                f"Symbol '{symbol_to_close}' does not appear to be a futures contract (e.g., 'ETH/USDC:USDC'). "
-                "This function is intended for futures positions."
+                "Symbol '%s' does not appear to be a futures contract (e.g., 'ETH/USDC:USDC'). "
+                "This function is intended for futures positions.",
+                symbol_to_close
             )
             # Optionally, you might want to raise an error or simply return if the symbol format is incorrect.
-            return
+            return False
 
         try:
             positions: List[Dict[str, Any]] = self.fetch_positions()
             if not positions:
-                logger.info(f"No open positions found. Cannot close '{symbol_to_close}'.")
-                return
+                logger.info("No open positions found. Cannot close '%s'.", symbol_to_close)
+                return False
 
-            target_position: Optional[Dict[str, Any]] = None
+            target_position: Optional[Position] = None
             for pos in positions:
                 current_symbol = pos.get('symbol', '')
                 # Ensure it's a futures position and matches the target symbol
                 if ':' in current_symbol and current_symbol == symbol_to_close:
-                    target_position = pos
+                    target_position = Position.from_ccxt(pos)
                     break
             
             if not target_position:
-                logger.info(f"No open futures position found for symbol '{symbol_to_close}'.")
-                return
+                logger.info("No open futures position found for symbol '%s'.", symbol_to_close)
+                return False
 
-            symbol: str = target_position.get('symbol', '') # Should be symbol_to_close
-            # Consolidate fetching amount from various possible keys
-            amt_str = target_position.get('contracts') or target_position.get('positionAmt') or target_position.get('amount')
-            amt: float = float(amt_str) if amt_str is not None else 0.0
-            
-            side: str = target_position.get('side', '').lower()
+            symbol: str = target_position.symbol # Should be symbol_to_close
+            amt: float = target_position.contracts
+            side: str = target_position.side
 
             if amt == 0:
-                logger.info(f"Position for '{symbol}' has zero amount. No action needed.")
-                return
+                logger.info("Position for '%s' has zero amount. No action needed.", symbol)
+                return False
             
             # Determine the side of the closing order
             close_side: str
-            if side in ['long', 'buy'] or (side == '' and amt > 0): # Position is long
+            if side in _LONG_SIDES or (side == '' and amt > 0): # Position is long
                 close_side = 'sell'
-            elif side in ['short', 'sell'] or (side == '' and amt < 0): # Position is short
+            elif side in _SHORT_SIDES or (side == '' and amt < 0): # Position is short
                 close_side = 'buy'
             else:
                 logger.error(f"Could not determine position side for '{symbol}'. Amount: {amt}, Side: '{side}'. Cannot close.")
-                return
+                return False
 
             close_amt: float = abs(amt)
             
             try:
-                # Fetch current price for the symbol (required for Hyperliquid market orders)
-                ticker: dict[str, Any] = self.exchange.fetch_ticker(symbol)
-                price_last = ticker.get('last')
-                price_ask = ticker.get('ask')
-                
-                price: Optional[float] = None
-                if price_last is not None:
-                    price = float(price_last)
-                elif price_ask is not None: # Use ask if last is not available
-                    price = float(price_ask)
-
-                if price is None or price <= 0:
-                    logger.error(f"Cannot get a valid positive price for '{symbol}'. Last: {price_last}, Ask: {price_ask}. Skipping close.")
-                    return 
-                
-                # Prepare params for closing position
-                params: Dict[str, Any] = {
-                    'reduceOnly': True,
-                    'slippage': 0.01  # Example: 1% slippage, adjust as needed
-                }
+                # A streamed price is used when available, otherwise the current price is fetched (required for Hyperliquid market orders)
+                price: Optional[float] = self.mark_price_cache.get(symbol) if self.mark_price_cache is not None else None
+                if price is None:
+                    ticker: Optional[dict[str, Any]] = prefetched_tickers.get(symbol) if prefetched_tickers else None
+                    if not ticker:
+                        ticker = self.exchange.fetch_ticker(symbol)
+                    price_last = ticker.get('last')
+                    price_ask = ticker.get('ask')
+
+                    if price_last is not None:
+                        price = float(price_last)
+                    elif price_ask is not None: # Use ask if last is not available
+                        price = float(price_ask)
+
+                    if price is None or price <= 0:
+                        logger.error(f"Cannot get a valid positive price for '{symbol}'. Last: {price_last}, Ask: {price_ask}. Skipping close.")
+                        return False
                 
-                logger.info(f"Attempting to close position for '{symbol}': side='{close_side}', amount={close_amt}, price={price}, params={params}")
-                order: dict[str, Any] = self.create_order(symbol, 'market', close_side, close_amt, price=price, params=params)
-                logger.info(f"Successfully submitted market order to close position for '{symbol}'. Order ID: {order.get('id', 'N/A')}")
+                logger.info("Attempting to close position for '%s': side='%s', amount=%s, price=%s, params=%s", symbol, close_side, close_amt, price, _CLOSE_PARAMS_TEMPLATE)
+                order: dict[str, Any] = self._market_close(symbol, close_side, close_amt, price)
+                logger.info("Successfully submitted market order to close position for '%s'. Order ID: %s", symbol, order.get('id', 'N/A'))
+                return True
                 
             except ccxt.NetworkError as e:
                 logger.error(f"Network error while preparing or executing closing order for '{symbol}': {e}")
@@ -313,102 +532,302 @@ class CcxtOrderManagement(CcxtBase):
             self._handle_operation_error(f"closing position unexpected for {symbol_to_close}", e)
             raise
 
-    def close_all_positions(self) -> None:
+    def _create_async_exchange(self) -> ccxt_async.Exchange:
+        """
+        Creates a ccxt.async_support Hyperliquid client with the same credentials, so independent
+        requests can be issued together with asyncio.gather. The already loaded markets are reused.
+        The caller owns the client and must close it with _close_async_exchange.
+        """
+        # Must be called on the event loop that uses the client, the aiohttp session binds to it
+        session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=75)
+        )
+        async_exchange: ccxt_async.Exchange = ccxt_async.hyperliquid({
+            'walletAddress': self.exchange.walletAddress,
+            'privateKey': self.exchange.privateKey,
+            'enableRateLimit': True,  # Keep CCXT's rate limiter on, requests are spaced even when gathered
+            'session': session,  # Shared by every request of the client; ccxt does not close a session it did not create
+        })
+        if self.markets:
+            async_exchange.set_markets(self.markets, self.exchange.currencies)
+        return async_exchange
+
+    @staticmethod
+    async def _close_async_exchange(async_exchange: ccxt_async.Exchange) -> None:
+        """Closes a client made by _create_async_exchange together with its HTTP session."""
+        session: Optional[aiohttp.ClientSession] = async_exchange.session
+        try:
+            await async_exchange.close()
+        finally:
+            if session is not None:
+                await session.close()
+
+    async def _fetch_close_tickers(self, async_exchange: ccxt_async.Exchange, symbols: List[str]) -> List[Any]:
+        """
+        Fetches the tickers of the given symbols, in one fetch_tickers request when the exchange supports it.
+        Returns one result per symbol, in the same order: the ticker, or the exception raised while fetching it.
+        If the batch request fails, the tickers are fetched one by one so a single bad symbol only affects itself.
+        """
+        if self._has_fetch_tickers:
+            try:
+                tickers_by_symbol: Dict[str, Dict[str, Any]] = await async_exchange.fetch_tickers(symbols)
+                return [
+                    tickers_by_symbol.get(symbol) or ccxt.BadSymbol(f"Ticker for {symbol} not found.")
+                    for symbol in symbols
+                ]
+            except ccxt.BaseError as e:
+                logger.warning("Batch ticker fetch failed, fetching %s tickers one by one: %s", len(symbols), e)
+
+        return await self._gather_limited(async_exchange.fetch_ticker(symbol) for symbol in symbols)
+
+    def _positions_to_close(self) -> list[tuple[str, str, float]]:
+        """
+        Fetches the open futures positions and returns (symbol, close_side, close_amt) for each one
+        with a non-zero size.
+        """
+        positions: List[Dict[str, Any]] = self.fetch_positions()
+        if not positions:
+            logger.info("No open positions to close.")
+            return []
+        
+        # Filter only futures/perpetual positions (containing ':')
+        futures_positions: list[Position] = [
+            Position.from_ccxt(pos) for pos in positions if ':' in (pos.get('symbol') or '')
+        ]
+        
+        if not futures_positions:
+            logger.info("No futures positions to close.")
+            return []
+        
+        logger.info("Found %s futures positions to close.", len(futures_positions))
+
+        closes: list[tuple[str, str, float]] = []
+        for pos in futures_positions:
+            symbol, amt, side = pos.symbol, pos.contracts, pos.side
+            
+            if amt == 0 or not symbol:
+                logger.info("Skipping position with symbol=%s, amount=%s", symbol, amt)
+                continue
+            
+            # Determine close side based on position side or amount
+            if side in _LONG_SIDES or (side == '' and amt > 0):
+                close_side = 'sell'
+            else:
+                close_side = 'buy'
+                
+            closes.append((symbol, close_side, abs(amt)))
+        return closes
+
+    def _close_one_position(self, symbol: str, close_side: str, close_amt: float) -> Dict[str, Any]:
+        """
+        Prices and submits the market order closing one position, with the sync exchange.
+        Raises ValueError if no valid price is available.
+        """
+        # A streamed price is used when available, otherwise the current price is fetched (required for Hyperliquid market orders)
+        price: Optional[float] = self.mark_price_cache.get(symbol) if self.mark_price_cache is not None else None
+        if price is None:
+            ticker: Dict[str, Any] = self.exchange.fetch_ticker(symbol)
+            price = float(ticker['last']) if ticker.get('last') else float(ticker.get('ask') or 0)
+        if price <= 0:
+            raise ValueError(f"Cannot get valid price for {symbol}, skipping close.")
+
+        logger.info("Closing futures position: %s, size=%s, side=%s, price=%s", symbol, close_amt, close_side, price)
+        return self._market_close(symbol, close_side, close_amt, price)
+
+    def _close_all_positions_threaded(self) -> None:
+        """
+        close_all_positions for callers that cannot use asyncio: each position is closed with the sync exchange
+        on a small thread pool. CCXT's sync calls release the GIL while waiting on the network, and its
+        rate limiter still spaces the requests.
+        """
+        if not self.exchange:
+            logger.error("Exchange not initialized. Cannot close positions.")
+            raise RuntimeError("Exchange not initialized. Cannot close positions.")
+
+        try:
+            closes: list[tuple[str, str, float]] = self._positions_to_close()
+            if closes:
+                with ThreadPoolExecutor(max_workers=min(8, len(closes))) as pool:
+                    futures: Dict[Future, str] = {pool.submit(self._close_one_position, *close): close[0] for close in closes}
+                    for future in as_completed(futures):
+                        symbol: str = futures[future]
+                        try:
+                            order: Dict[str, Any] = future.result()
+                            logger.info("Position closed successfully: %s", order.get('id', 'N/A'))
+                        except Exception as e:
+                            logger.error(f"Failed to close position for {symbol}: {e}")
+
+            logger.info("Finished closing all futures positions.")
+
+        except Exception as e:
+            logger.error(f"Failed to close all positions: {e}")
+            raise
+
+    async def close_all_positions_async(self) -> None:
         """
         Closes all open futures positions by submitting market orders in the opposite direction.
         For Hyperliquid, price is required even for market orders.
+        Prices come from the mark price cache when one is set; the remaining tickers are fetched in one request,
+        then the closing orders are submitted in batches.
         """
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot close positions.")
             raise RuntimeError("Exchange not initialized. Cannot close positions.")
 
         try:
-            positions: List[Dict[str, Any]] = self.fetch_positions()
-            if not positions:
-                logger.info("No open positions to close.")
-                return
-            
-            futures_positions: list[Dict[str, Any]] = []
-            for pos in positions:
-                symbol = pos.get('symbol', '')
-                # Filter only futures/perpetual positions (containing ':')
-                if ':' in symbol:
-                    futures_positions.append(pos)
-            
-            if not futures_positions:
-                logger.info("No futures positions to close.")
-                return
-            
-            logger.info(f"Found {len(futures_positions)} futures positions to close.")
-            
-            for pos in futures_positions:
-                symbol: str = pos.get('symbol', '')
-                amt: float = float(pos.get('contracts') or pos.get('positionAmt') or pos.get('amount') or 0) 
-                side: str = pos.get('side', '').lower()
-                
-                if amt == 0 or not symbol:
-                    logger.info(f"Skipping position with symbol={symbol}, amount={amt}")
-                    continue
-                
-                # Determine close side based on position side or amount
-                if side in ['long', 'buy'] or (side == '' and amt > 0):
-                    close_side = 'sell'
-                else:
-                    close_side = 'buy'
-                    
-                close_amt: float = abs(amt)
-                
+            closes: list[tuple[str, str, float]] = self._positions_to_close()
+            if closes:
+                async_exchange: ccxt_async.Exchange = self._create_async_exchange()
                 try:
-                    # Fetch current price for the symbol (required for Hyperliquid market orders)
-                    ticker: dict[str, Any] = self.exchange.fetch_ticker(symbol)
-                    price: float = float(ticker['last']) if ticker.get('last') else float(ticker.get('ask', 0))
-                    
-                    if price <= 0:
-                        logger.error(f"Cannot get valid price for {symbol}, skipping close.")
-                        continue
-                    
-                    # Prepare params for closing position
-                    params: Dict[str, Any] = {
-                        'reduceOnly': True,
-                        'slippage': 0.01  # 1% slippage
-                    }
-                    
-                    logger.info(f"Closing futures position: {symbol}, size={close_amt}, side={close_side}, price={price}")
-                    order: dict[str, Any] = self.create_order(symbol, 'market', close_side, close_amt, price=price, params=params)
-                    logger.info(f"Position closed successfully: {order.get('id', 'N/A')}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to close position for {symbol}: {e}")
+                    # Streamed prices are used when available, the rest are fetched (required for Hyperliquid market orders)
+                    streamed_prices: Dict[str, Optional[float]] = {
+                        symbol: self.mark_price_cache.get(symbol) for symbol, _, _ in closes
+                    } if self.mark_price_cache is not None else {}
+                    symbols_to_fetch: List[str] = [symbol for symbol, _, _ in closes if streamed_prices.get(symbol) is None]
+                    tickers: List[Any] = await self._fetch_close_tickers(async_exchange, symbols_to_fetch) if symbols_to_fetch else []
+                    tickers_by_symbol: Dict[str, Any] = dict(zip(symbols_to_fetch, tickers))
+
+                    # create_order arguments per closing order that can be submitted
+                    orders_to_place: List[Dict[str, Any]] = []
+                    for symbol, close_side, close_amt in closes:
+                        price: Optional[float] = streamed_prices.get(symbol)
+                        if price is None:
+                            ticker = tickers_by_symbol[symbol]
+                            if isinstance(ticker, BaseException):
+                                logger.error(f"Failed to close position for {symbol}: {ticker}")
+                                continue
+                            price = float(ticker['last']) if ticker.get('last') else float(ticker.get('ask') or 0)
+                        if price <= 0:
+                            logger.error(f"Cannot get valid price for {symbol}, skipping close.")
+                            continue
+                        logger.info("Closing futures position: %s, size=%s, side=%s, price=%s", symbol, close_amt, close_side, price)
+                        orders_to_place.append({
+                            'symbol': symbol,
+                            'type': 'market',
+                            'side': close_side,
+                            'amount': close_amt,
+                            'price': price,
+                            'params': dict(_CLOSE_PARAMS_TEMPLATE),
+                        })
+
+                    results: List[Any] = await self._create_orders_batch_async(async_exchange, orders_to_place)
+                finally:
+                    await self._close_async_exchange(async_exchange)
+                    self.invalidate_positions()
+
+                for order, result in zip(orders_to_place, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Failed to close position for {order['symbol']}: {result}")
+                    else:
+                        logger.info("Position closed successfully: %s", result.get('id', 'N/A'))
                     
             logger.info("Finished closing all futures positions.")
             
         except Exception as e:
             logger.error(f"Failed to close all positions: {e}")
             raise
- 
-    def close_all_orders(self) -> None:
-            """
-            Cancels all currently open orders for all symbols on the exchange.
-            """
-            if not self.exchange:
-                logger.error("Exchange not initialized. Cannot cancel orders.")
-                raise RuntimeError("Exchange not initialized. Cannot cancel orders.")
+
+    def close_all_positions(self, use_threads: bool = False) -> None:
+        """
+        Closes all open futures positions. Synchronous wrapper around close_all_positions_async.
+        With use_threads, or when called from a running event loop (where asyncio.run is not allowed),
+        the positions are closed on a thread pool with the sync exchange instead.
+        """
+        if not use_threads:
             try:
-                open_orders = self.fetch_open_orders()
-                if not open_orders:
-                    logger.info("No open orders to cancel.")
-                    return
-                for order in open_orders:
-                    order_id = order.get('id') or order.get('order_id')
-                    symbol = order.get('symbol')
-                    if not order_id or not symbol:
-                        logger.warning(f"Skipping order with missing id or symbol: {order}")
-                        continue
-                    try:
-                        self.cancel_order(order_id, symbol)
-                    except Exception as e:
-                        logger.error(f"Failed to cancel order {order_id} for {symbol}: {e}")
-                logger.info("Finished cancelling all open orders.")
-            except Exception as e:
-                logger.error(f"Failed to cancel all open orders: {e}")
-                raise
\ No newline at end of file
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.close_all_positions_async())
+                return
+        self._close_all_positions_threaded()
+
+    async def close_all_orders_async(self) -> None:
+        """
+        Cancels all currently open orders for all symbols on the exchange.
+        Uses a single cancelAllOrders request when the exchange supports it, otherwise one cancelOrders
+        request per symbol, otherwise one cancel_order per order; the requests are submitted concurrently.
+        Open orders listed more than OPEN_ORDERS_RECHECK_SECONDS before cancelling are listed again,
+        so orders that filled or were cancelled in the meantime are skipped.
+        """
+        if not self.exchange:
+            logger.error("Exchange not initialized. Cannot cancel orders.")
+            raise RuntimeError("Exchange not initialized. Cannot cancel orders.")
+        try:
+            if self._has_cancel_all_orders:
+                async_exchange: ccxt_async.Exchange = self._create_async_exchange()
+                try:
+                    await async_exchange.cancel_all_orders()
+                finally:
+                    await self._close_async_exchange(async_exchange)
+                    self.invalidate_positions()
+                logger.info("Cancelled all open orders in one request.")
+                return
+
+            open_orders = self.fetch_open_orders()
+            fetched_at: float = time.monotonic()
+            if not open_orders:
+                logger.info("No open orders to cancel.")
+                return
+
+            # Order ids to cancel, grouped by symbol
+            ids_by_symbol: Dict[str, List[str]] = {}
+            for order in open_orders:
+                order_id = order.get('id') or order.get('order_id')
+                symbol = order.get('symbol')
+                if not order_id or not symbol:
+                    logger.warning("Skipping order with missing id or symbol: %s", order)
+                    continue
+                ids_by_symbol.setdefault(symbol, []).append(order_id)
+
+            results: List[Any] = []
+            if ids_by_symbol:
+                async_exchange = self._create_async_exchange()
+                try:
+                    if time.monotonic() - fetched_at > self.OPEN_ORDERS_RECHECK_SECONDS:
+                        # Orders may have filled or been cancelled since they were listed; only cancel those still open
+                        still_open: set[str] = {order.get('id') for order in await async_exchange.fetch_open_orders()}
+                        ids_by_symbol = {
+                            symbol: open_ids for symbol, ids in ids_by_symbol.items()
+                            if (open_ids := [order_id for order_id in ids if order_id in still_open])
+                        }
+                    if self._has_cancel_orders:
+                        results = await self._gather_limited(
+                            async_exchange.cancel_orders(ids, symbol) for symbol, ids in ids_by_symbol.items()
+                        )
+                    else:
+                        cancellations: List[Any] = await self._gather_limited(
+                            async_exchange.cancel_order(order_id, symbol) for symbol, ids in ids_by_symbol.items() for order_id in ids
+                        )
+                        # Regroup the per-order results by symbol
+                        offset: int = 0
+                        for ids in ids_by_symbol.values():
+                            results.append(cancellations[offset:offset + len(ids)])
+                            offset += len(ids)
+                finally:
+                    await self._close_async_exchange(async_exchange)
+                    self.invalidate_positions()
+
+            total: int = sum(len(ids) for ids in ids_by_symbol.values())
+            failed: int = 0
+            for (symbol, ids), result in zip(ids_by_symbol.items(), results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to cancel orders {ids} for {symbol}: {result}")
+                    failed += len(ids)
+                    continue
+                for order_id, cancellation in zip(ids, result):
+                    info = cancellation.get('info') if isinstance(cancellation, dict) else None
+                    if isinstance(cancellation, BaseException) or (isinstance(info, dict) and info.get('error')):
+                        error = cancellation if isinstance(cancellation, BaseException) else info['error']
+                        logger.error(f"Failed to cancel order {order_id} for {symbol}: {error}")
+                        failed += 1
+            logger.info("Finished cancelling open orders: %s of %s cancelled across %s symbols.", total - failed, total, len(ids_by_symbol))
+        except Exception as e:
+            logger.error(f"Failed to cancel all open orders: {e}")
+            raise
+
+    def close_all_orders(self) -> None:
+        """
+        Cancels all currently open orders. Synchronous wrapper around close_all_orders_async;
+        must not be called from a running event loop.
+        """
+        asyncio.run(self.close_all_orders_async())
@@ -1,211 +1,225 @@
-from ccxt_base import CcxtBase
-from core import CcxtOrderManagement, CcxtWalletManagement
-from log.logger import logger
-from typing import Any, List, Dict
-from collections import defaultdict
+from ..ccxt_base import CcxtBase
+from .order_management import CcxtOrderManagement, Position
+from .wallet_management import CcxtWalletManagement
+from ..log.logger import logger
+from typing import Any, AsyncIterator, List, Dict
+import math
+import time
 from datetime import datetime, timezone
-from adapter.adapter import SignalTweetDownstream
-from collections import defaultdict, Counter
+from .portfolio_management_core import filter_out_position_in_portfolio, drop_duplicate_signals, categorize_signals, classify_signals
+
+# How far back each successive trades request of _find_open_timestamp reaches: 1 day, 7 days, 30 days
+_OPEN_SCAN_LOOKBACKS_MS: tuple[int, ...] = (86_400_000, 7 * 86_400_000, 30 * 86_400_000)
+# Most fills Hyperliquid returns for one time-window request; a full response is the oldest fills of the window
+_FILLS_PER_REQUEST: int = 2000
+
+def _position_key(pos: Position) -> tuple[str, str, float]:
+    """Returns (symbol, side, size): what identifies a position when looking up its open timestamp."""
+    return pos.symbol, pos.side, pos.contracts
+
 class CcxtPortfolioManagement(CcxtBase):
     """
     Manages portfolio operations for Hyperliquid, including position count checks and summaries.
     All actions related to portfolio management are logged.
     """
 
-    def __init__(self):
+    # Position open timestamps are reused for this long across summaries, keyed by (symbol, side, size)
+    OPEN_TIMESTAMP_TTL_SECONDS: float = 2.0
+    _open_timestamp_cache: Dict[tuple, tuple[float, int | None]] = {}
+
+    def __init__(self) -> None:
+        if self._initialized:  # Singleton already set up by an earlier construction
+            return
+        super().__init__()
         self.order_manager: CcxtOrderManagement = CcxtOrderManagement()
         self.wallet_manager: CcxtWalletManagement = CcxtWalletManagement()
         if not self.order_manager.exchange or not self.wallet_manager.exchange:
             logger.warning("Hyperliquid exchange not initialized. Portfolio operations may fail.")
 
-    def _get_positions(self) -> List[dict[str, Any]]:
-        """Fetch all open positions using the order manager."""
+    def _get_positions(self) -> List[Position]:
+        """Fetch all open positions using the order manager, which reuses positions fetched within the last ACCOUNT_TTL_SECONDS."""
         if not self.order_manager.exchange:
             logger.error("Exchange not initialized. Cannot fetch positions.")
             return []
         try:
-            positions = self.order_manager.fetch_positions()
-            logger.info(f"Fetched {len(positions)} open positions.")
+            positions = [Position.from_ccxt(pos) for pos in self.order_manager.fetch_positions()]
+            logger.info("Fetched %s open positions.", len(positions))
             return positions
         except Exception as e:
             logger.error(f"Error fetching positions: {e}")
             return []
 
+    @staticmethod
+    async def _trade_pages_newest_first(async_exchange: Any, symbol: str, since: int, until: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yields the trades of [since, until] in pages ordered from the newest trade to the oldest.
+        A response holding _FILLS_PER_REQUEST fills may be missing the newest fills of its window, so such a
+        window is split in half and the newer half is paged first.
+        """
+        trades: List[Dict[str, Any]] = await async_exchange.fetch_my_trades(symbol=symbol, since=since, params={'until': until})
+        if len(trades) >= _FILLS_PER_REQUEST and until > since:
+            middle: int = (since + until) // 2
+            async for page in CcxtPortfolioManagement._trade_pages_newest_first(async_exchange, symbol, middle + 1, until):
+                yield page
+            async for page in CcxtPortfolioManagement._trade_pages_newest_first(async_exchange, symbol, since, middle):
+                yield page
+            return
+        yield sorted(trades, key=lambda t: t.get('timestamp') or 0, reverse=True)
+
+    async def _find_open_timestamp(self, async_exchange: Any, symbol: str, side: str, contracts: float) -> int | None:
+        """
+        Finds when a position was opened by walking its symbol's trades from the newest backwards and summing
+        their signed amounts: the position opened with the trade before which it was flat or on the other side
+        (a trade that flipped it from short to long, or back, counts as its opening trade).
+        Trades are fetched one lookback window at a time (see _OPEN_SCAN_LOOKBACKS_MS), so a recent position
+        only costs one request. If the opening trade lies beyond the last window, the most recent trades the
+        exchange returns without a time window are walked as well; failing that, the oldest trade on the
+        position's side that was seen is used instead.
+
+        Returns:
+            int | None: The timestamp in milliseconds, or None if no trade on the position's side was found.
+        """
+        # Positions report a positive size; a short one is the negative sum of its trades
+        target: float = float(contracts) if side == 'long' else -float(contracts)
+        position_side_for_trade: str = 'buy' if side == 'long' else 'sell'
+        net_amount: float = 0.0
+        oldest_side_timestamp: int | None = None
+
+        def is_opening_trade(t: Dict[str, Any]) -> bool:
+            nonlocal net_amount, oldest_side_timestamp
+            amount: float = float(t.get('amount') or 0)
+            net_amount += amount if t.get('side') == 'buy' else -amount
+            if t.get('side') == position_side_for_trade:
+                oldest_side_timestamp = t.get('timestamp')
+            # The position held just before this trade: flat, or on the other side when the trade flipped it
+            position_before: float = target - net_amount
+            return math.isclose(position_before, 0.0, abs_tol=1e-9 * max(1.0, abs(target))) or position_before * target < 0
+
+        now_ms: int = int(time.time() * 1000)
+        until: int = now_ms
+        for lookback_ms in _OPEN_SCAN_LOOKBACKS_MS:
+            since: int = now_ms - lookback_ms
+            async for page in self._trade_pages_newest_first(async_exchange, symbol, since, until):
+                for t in page:
+                    if t.get('symbol') == symbol and is_opening_trade(t):
+                        return t.get('timestamp')
+            until = since - 1
+
+        # Positions older than the last window: the recent fills without a window reach as far back as the exchange keeps them
+        trades: List[Dict[str, Any]] = await async_exchange.fetch_my_trades(symbol=symbol)
+        for t in sorted(trades, key=lambda t: t.get('timestamp') or 0, reverse=True):
+            if t.get('symbol') == symbol and (t.get('timestamp') or 0) <= until and is_opening_trade(t):
+                return t.get('timestamp')
+
+        logger.warning("Opening trade of the %s position not found, using the oldest %s trade seen.", symbol, position_side_for_trade)
+        return oldest_side_timestamp
+
+    async def _fetch_open_timestamps(self, positions: List[Position]) -> Dict[tuple, Any]:
+        """
+        Looks up the open timestamp of each distinct (symbol, side, size) concurrently through ccxt.async_support.
+        Timestamps found less than OPEN_TIMESTAMP_TTL_SECONDS ago are reused without new requests.
+        Returns the timestamp (or None) of each key, or the exception raised while looking it up.
+        """
+        now: float = time.monotonic()
+        open_timestamps: Dict[tuple, Any] = {}
+        keys_to_fetch: List[tuple] = []
+        for key in dict.fromkeys(_position_key(pos) for pos in positions):
+            cached = self._open_timestamp_cache.get(key)
+            if cached is not None and now - cached[0] < self.OPEN_TIMESTAMP_TTL_SECONDS:
+                open_timestamps[key] = cached[1]
+            else:
+                keys_to_fetch.append(key)
+        if not keys_to_fetch:
+            return open_timestamps
+
+        async_exchange = self.order_manager._create_async_exchange()
+        try:
+            results: List[Any] = await self._gather_limited(self._find_open_timestamp(async_exchange, *key) for key in keys_to_fetch)
+        finally:
+            await self.order_manager._close_async_exchange(async_exchange)
+
+        for key, result in zip(keys_to_fetch, results):
+            open_timestamps[key] = result
+            if not isinstance(result, BaseException):
+                self._open_timestamp_cache[key] = (time.monotonic(), result)
+        return open_timestamps
+
+    def invalidate_positions(self) -> None:
+        """Drops the cached positions and open timestamps, e.g. after placing or cancelling orders outside the order manager."""
+        self.order_manager.invalidate_positions()
+        self._open_timestamp_cache.clear()
+
     def get_positions_summary(self) -> List[Dict[str, Any]]:
-        """Return a summary of current open positions (symbol, size, side, entry price, open_timestamp_utc)."""
+        """
+        Return a summary of current open positions (symbol, size, side, entry price, open_timestamp_utc),
+        with the open timestamp also as epoch milliseconds (open_timestamp_ms) for cheap age comparisons.
+        """
         if not self.order_manager or not self.order_manager.exchange:
             logger.error("Order manager or exchange not initialized. Cannot fetch trades for position timestamps.")
-            positions_data = self._get_positions()
-            summary = []
-            for pos in positions_data:
-                summary.append({
-                    'symbol': pos.get('symbol'),
-                    'size': pos.get('contracts') or pos.get('positionAmt') or pos.get('amount'),
-                    'side': pos.get('side'),
-                    'entry_price': pos.get('entryPrice') or pos.get('avgEntryPrice'),
-                    'open_timestamp_utc': None
-                })
+            summary = [
+                {
+                    'symbol': pos.symbol or None,
+                    'size': pos.contracts,
+                    'side': pos.side,
+                    'entry_price': pos.entry_price,
+                    'open_timestamp_utc': None,
+                    'open_timestamp_ms': None
+                }
+                for pos in self._get_positions()
+            ]
             logger.warning("Returning positions summary without open timestamps as exchange is not available.")
             return summary
 
         positions = self._get_positions()
+        # Look up the open timestamps of all positions concurrently
+        timed_positions: List[Position] = [pos for pos in positions if pos.symbol and pos.contracts]
+        open_timestamps: Dict[tuple, Any] = self._run_sync(self._fetch_open_timestamps(timed_positions)) if timed_positions else {}
         summary = []
         for pos in positions:
-            symbol = pos.get('symbol')
-            side = pos.get('side')
-            entry_price = pos.get('entryPrice') or pos.get('avgEntryPrice')
-            contracts = pos.get('contracts') or pos.get('positionAmt') or pos.get('amount')
-            open_timestamp_ms = None # Timestamp in milliseconds
             open_timestamp_utc = None # Timestamp in ISO 8601 UTC format
+            open_timestamp_ms = None # Timestamp in milliseconds
 
-            if not symbol:
-                logger.warning(f"Position data is missing 'symbol': {pos}")
+            if not pos.symbol:
+                logger.warning("Position data is missing 'symbol': %s", pos)
                 summary.append({
                     'symbol': None,
-                    'size': contracts,
-                    'side': side,
-                    'entry_price': entry_price,
-                    'open_timestamp_utc': None
+                    'size': pos.contracts,
+                    'side': pos.side,
+                    'entry_price': pos.entry_price,
+                    'open_timestamp_utc': None,
+                    'open_timestamp_ms': None
                 })
                 continue
 
             try:
-                trades = self.order_manager.exchange.fetchMyTrades(symbol=symbol, limit=100)
-                position_side_for_trade = 'buy' if side == 'long' else 'sell'
-                candidate_trades = [
-                    t for t in trades
-                    if t.get('symbol') == symbol and t.get('side') == position_side_for_trade
-                ]
-
-                if candidate_trades:
-                    oldest_relevant_trade = candidate_trades[-1]
-                    open_timestamp_ms = oldest_relevant_trade.get('timestamp')
-                    if open_timestamp_ms is not None:
-                        # Convert milliseconds to seconds for datetime.fromtimestamp
-                        open_timestamp_utc = datetime.fromtimestamp(open_timestamp_ms / 1000, tz=timezone.utc).isoformat()
+                open_timestamp_ms = open_timestamps.get(_position_key(pos)) # Timestamp in milliseconds
+                if isinstance(open_timestamp_ms, BaseException):
+                    raise open_timestamp_ms
+                if open_timestamp_ms is not None:
+                    # Convert milliseconds to seconds for datetime.fromtimestamp
+                    open_timestamp_utc = datetime.fromtimestamp(open_timestamp_ms / 1000, tz=timezone.utc).isoformat()
 
             except Exception as e:
-                logger.error(f"Error fetching trades or determining open timestamp for position {symbol}: {e}")
+                logger.error(f"Error fetching trades or determining open timestamp for position {pos.symbol}: {e}")
 
             summary.append({
-                'symbol': symbol,
-                'size': contracts,
-                'side': side,
-                'entry_price': entry_price,
-                'open_timestamp_utc': open_timestamp_utc # Store ISO string or None
+                'symbol': pos.symbol,
+                'size': pos.contracts,
+                'side': pos.side,
+                'entry_price': pos.entry_price,
+                'open_timestamp_utc': open_timestamp_utc, # Store ISO string or None
+                'open_timestamp_ms': open_timestamp_ms if open_timestamp_utc is not None else None
             })
         
-        logger.info(f"Successfully generated positions summary with best-effort open UTC timestamps for {len(summary)} positions.")
+        logger.info("Successfully generated positions summary with best-effort open UTC timestamps for %s positions.", len(summary))
         return summary
 
     def positions_count(self) -> int:
         """Return the number of open positions."""
         return len(self._get_positions())
     
-    @staticmethod
-    def filter_out_position_in_portfolio(signals: list[SignalTweetDownstream], positions: list[dict]) -> list[SignalTweetDownstream]:
-        """Filter out signals that have positions in portfolio. (duplicate symbol and side)"""
-        remaining_signals = []
-        existing_positions_set = set()
-        for pos in positions: 
-            normalized_side = ''
-            if pos['side'] == 'long':
-                normalized_side = 'buy'
-            elif pos['side'] == 'short':
-                normalized_side = 'sell'
-            
-            existing_positions_set.add((pos['symbol'], normalized_side))
-
-        for sig in signals: 
-            if (sig.symbol, sig.side) not in existing_positions_set:
-                remaining_signals.append(sig)
-        
-        return remaining_signals
-
-    @staticmethod
-    def drop_duplicate_signals(signals: list[SignalTweetDownstream]) -> list[SignalTweetDownstream]:
-        """
-        Drop duplicate signals based on symbol and side.
-        - For each symbol, keep only the first signal of the majority side (buy/sell).
-        - If there is a tie in side counts for a symbol, drop all signals for that symbol.
-        """
-        if not signals:
-            return []
-        # Group signals by symbol
-        signals_by_symbol: defaultdict[str, list[SignalTweetDownstream]] = defaultdict(list)
-        for signal in signals:
-            signals_by_symbol[signal.symbol].append(signal)
-
-        final_signals: list[SignalTweetDownstream] = []
-
-        for symbol, symbol_signals in signals_by_symbol.items():
-            side_counts = Counter(signal.side for signal in symbol_signals)
-            if len(side_counts) == 1:
-                # Only one side, keep the first
-                final_signals.append(symbol_signals[0])
-            else:
-                # More than one side, check for majority
-                most_common = side_counts.most_common()
-                if len(most_common) >= 2 and most_common[0][1] == most_common[1][1]:
-                    # Tie, skip this symbol
-                    continue
-                # Keep the first signal of the majority side
-                majority_side = most_common[0][0]
-                for signal in symbol_signals:
-                    if signal.side == majority_side:
-                        final_signals.append(signal)
-                        break
-
-        return final_signals
-
-    @staticmethod
-    def categorize_signals(
-        signal_list: list[dict | Any], 
-        positions_list: list[dict[str, Any]]
-    ) -> tuple[list[dict | Any], list[dict | Any]]:
-        """
-        Categorizes signals into open signals and close signals based on existing positions.
-
-        Args:
-            signal_list: List of signals (can be a list of objects or list of dicts)
-            positions_list: List of positions (list of dicts)
-
-        Returns:
-            tuple: (open_signals, close_signals)
-                open_signals (list): List of signals for opening new orders
-                close_signals (list): List of signals for closing existing positions
-        """
-        open_signal_result: list[dict | Any] = []
-        close_signal_result: list[dict | Any] = []
-
-        for s_item in signal_list:
-            is_closing_signal: bool = False
-             
-            # Extract symbol and side from signal (handling both dict and object)
-            signal_symbol: str = ''
-            signal_side: str = ''
-            if isinstance(s_item, dict):
-                signal_symbol = s_item.get('symbol', '')
-                signal_side = s_item.get('side', '')
-            else:  
-                signal_symbol = getattr(s_item, 'symbol', '')
-                signal_side = getattr(s_item, 'side', '')
-            
-            # Check if this signal would close any existing position
-            for p_item in positions_list:
-                position_symbol: str = p_item.get('symbol', '')
-                position_side: str = p_item.get('side', '')
-                
-                if signal_symbol == position_symbol:
-                    if (signal_side == 'buy' and position_side == 'short') or \
-                       (signal_side == 'sell' and position_side == 'long'):
-                        is_closing_signal = True
-                        break 
-            
-            # Categorize the signal
-            if is_closing_signal:
-                close_signal_result.append(s_item)
-            else:
-                open_signal_result.append(s_item)
-                
-        return open_signal_result, close_signal_result
\ No newline at end of file
+    # The signal helpers live in portfolio_management_core, which only depends on plain data
+    filter_out_position_in_portfolio = staticmethod(filter_out_position_in_portfolio)
+    drop_duplicate_signals = staticmethod(drop_duplicate_signals)
+    categorize_signals = staticmethod(categorize_signals)
+    classify_signals = staticmethod(classify_signals)
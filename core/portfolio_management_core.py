@@ -0,0 +1,133 @@
+from collections import defaultdict
+from typing import Any
+from ..adapter.adapter import SignalTweetDownstream
+
+# Signal filtering used by CcxtPortfolioManagement. It works on plain signals and position dicts only,
+# with no exchange state, so it can be compiled on its own with mypyc (mypyc core/portfolio_management_core.py)
+
+# Position side -> the order side that opened it
+_SIDE_TO_ACTION: dict[str, str] = {'long': 'buy', 'short': 'sell'}
+
+def _signal_symbol_side(signal: dict | Any) -> tuple[str, str]:
+    """Returns (symbol, side) of a signal given either as a dict or as an object."""
+    if isinstance(signal, dict):
+        return signal.get('symbol', ''), signal.get('side', '')
+    return getattr(signal, 'symbol', ''), getattr(signal, 'side', '')
+
+def filter_out_position_in_portfolio(signals: list[SignalTweetDownstream], positions: list[dict]) -> list[SignalTweetDownstream]:
+    """Filter out signals that have positions in portfolio. (duplicate symbol and side)"""
+    existing_positions_set = {(pos.get('symbol'), _SIDE_TO_ACTION.get(pos.get('side'), '')) for pos in positions}
+    return [sig for sig in signals if (sig.symbol, sig.side) not in existing_positions_set]
+
+def drop_duplicate_signals(signals: list[SignalTweetDownstream]) -> list[SignalTweetDownstream]:
+    """
+    Drop duplicate signals based on symbol and side.
+    - For each symbol, keep only the first signal of the majority side (buy/sell).
+    - If there is a tie in side counts for a symbol, drop all signals for that symbol.
+    """
+    if not signals:
+        return []
+    # Group signals by symbol
+    signals_by_symbol: defaultdict[str, list[SignalTweetDownstream]] = defaultdict(list)
+    for signal in signals:
+        signals_by_symbol[signal.symbol].append(signal)
+
+    final_signals: list[SignalTweetDownstream] = []
+
+    for symbol, symbol_signals in signals_by_symbol.items():
+        # One pass: count each side and remember where it first appears
+        side_counts: dict[str, int] = {}
+        first_index_by_side: dict[str, int] = {}
+        for i, signal in enumerate(symbol_signals):
+            side_counts[signal.side] = side_counts.get(signal.side, 0) + 1
+            first_index_by_side.setdefault(signal.side, i)
+
+        if len(side_counts) == 1:
+            # Only one side, keep the first
+            final_signals.append(symbol_signals[0])
+            continue
+        # More than one side, check for majority
+        majority_side, majority_count = max(side_counts.items(), key=lambda item: item[1])
+        if sum(1 for count in side_counts.values() if count == majority_count) > 1:
+            # Tie, skip this symbol
+            continue
+        # Keep the first signal of the majority side
+        final_signals.append(symbol_signals[first_index_by_side[majority_side]])
+
+    return final_signals
+
+def categorize_signals(
+    signal_list: list[dict | Any], 
+    positions_list: list[dict[str, Any]]
+) -> tuple[list[dict | Any], list[dict | Any]]:
+    """
+    Categorizes signals into open signals and close signals based on existing positions.
+
+    Args:
+        signal_list: List of signals (can be a list of objects or list of dicts)
+        positions_list: List of positions (list of dicts)
+
+    Returns:
+        tuple: (open_signals, close_signals)
+            open_signals (list): List of signals for opening new orders
+            close_signals (list): List of signals for closing existing positions
+    """
+    open_signal_result: list[dict | Any] = []
+    close_signal_result: list[dict | Any] = []
+
+    # Index the position sides by symbol once, so each signal is a single lookup
+    position_sides_by_symbol: defaultdict[str, set[str]] = defaultdict(set)
+    for p_item in positions_list:
+        position_sides_by_symbol[p_item.get('symbol', '')].add(p_item.get('side', ''))
+
+    for s_item in signal_list:
+        signal_symbol, signal_side = _signal_symbol_side(s_item)
+
+        # Check if this signal would close any existing position
+        position_sides = position_sides_by_symbol.get(signal_symbol, ())
+        is_closing_signal: bool = (signal_side == 'buy' and 'short' in position_sides) or \
+                                  (signal_side == 'sell' and 'long' in position_sides)
+
+        # Categorize the signal
+        if is_closing_signal:
+            close_signal_result.append(s_item)
+        else:
+            open_signal_result.append(s_item)
+
+    return open_signal_result, close_signal_result
+
+def classify_signals(
+    signals: list[SignalTweetDownstream],
+    positions: list[dict[str, Any]]
+) -> tuple[list[SignalTweetDownstream], list[SignalTweetDownstream], list[SignalTweetDownstream], list[SignalTweetDownstream]]:
+    """
+    drop_duplicate_signals, filter_out_position_in_portfolio and categorize_signals fused: the positions are indexed
+    once and each deduplicated signal is classified as it is picked.
+
+    Returns:
+        tuple: (deduplicated, not_held, open_signals, close_signals), the same lists as
+            drop_duplicate_signals(signals), filter_out_position_in_portfolio(deduplicated, positions)
+            and categorize_signals(deduplicated, positions)
+    """
+    held: set[tuple[str, str]] = set()
+    position_sides_by_symbol: defaultdict[str, set[str]] = defaultdict(set)
+    for pos in positions:
+        symbol: str = pos.get('symbol', '')
+        side: str = pos.get('side', '')
+        held.add((symbol, _SIDE_TO_ACTION.get(side, '')))
+        position_sides_by_symbol[symbol].add(side)
+
+    deduplicated: list[SignalTweetDownstream] = []
+    not_held: list[SignalTweetDownstream] = []
+    open_signals: list[SignalTweetDownstream] = []
+    close_signals: list[SignalTweetDownstream] = []
+    for signal in drop_duplicate_signals(signals):
+        deduplicated.append(signal)
+        if (signal.symbol, signal.side) not in held:
+            not_held.append(signal)
+        position_sides = position_sides_by_symbol.get(signal.symbol, ())
+        if (signal.side == 'buy' and 'short' in position_sides) or (signal.side == 'sell' and 'long' in position_sides):
+            close_signals.append(signal)
+        else:
+            open_signals.append(signal)
+    return deduplicated, not_held, open_signals, close_signals
@@ -1,6 +1,7 @@
 from ..ccxt_base import CcxtBase
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from ..log.logger import logger
+import time
 
 class CcxtWalletManagement(CcxtBase):
     """
@@ -8,7 +9,19 @@ class CcxtWalletManagement(CcxtBase):
     All actions related to wallet management are logged.
     """
 
+    # A balance is reused until the account changes through any manager (see CcxtBase._mutation_epoch),
+    # and for at most this long, since fills and funding change it too
+    BALANCE_TTL_SECONDS: float = 0.5
+    _wallet_balance_cache: Dict[str, tuple[int, float, Dict[str, Any]]] = {}
+
+    # Deposit addresses rarely change, so each asset's address is reused for this long
+    DEPOSIT_ADDRESS_TTL_SECONDS: float = 3600.0
+    DEPOSIT_ADDRESS_CACHE_SIZE: int = 64
+    _deposit_address_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
     def __init__(self) -> None:
+        if self._initialized:  # Singleton already set up by an earlier construction
+            return
         super().__init__()
         if not self.exchange:
             logger.warning("Hyperliquid exchange not initialized. Wallet operations may fail.")
@@ -16,6 +29,7 @@ class CcxtWalletManagement(CcxtBase):
     def get_balance(self, wallet_type: str = 'margin') -> Optional[Dict[str, Any]]:
         """
         Fetches the account balance for the specified wallet type.
+        A balance fetched less than BALANCE_TTL_SECONDS ago is reused if the account has not changed since.
         
         Args:
             wallet_type: Type of wallet to fetch balance for (e.g., 'spot', 'margin', 'funding')
@@ -26,6 +40,9 @@ class CcxtWalletManagement(CcxtBase):
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot fetch balance.")
             return None
+        cached: Optional[tuple[int, float, Dict[str, Any]]] = self._wallet_balance_cache.get(wallet_type)
+        if cached is not None and cached[0] == self._mutation_epoch and time.monotonic() - cached[1] < self.BALANCE_TTL_SECONDS:
+            return cached[2]
         try:
             # Forward wallet_type to exchange params if supported
             params: Dict[str, str] = {}
@@ -33,8 +50,10 @@ class CcxtWalletManagement(CcxtBase):
                 params['type'] = wallet_type  # 'spot', 'margin', 'funding', etc. (depends on exchange)
 
 
+            epoch: int = self._mutation_epoch
             balance: Dict[str, Any] = self.exchange.fetch_balance(params)
-            logger.info(f"Balance fetched for wallet_type={wallet_type}")
+            logger.info("Balance fetched for wallet_type=%s", wallet_type)
+            self._wallet_balance_cache[wallet_type] = (epoch, time.monotonic(), balance)
             return balance
         except Exception as e:
             self._handle_operation_error("fetch_balance", e)
@@ -67,7 +86,8 @@ class CcxtWalletManagement(CcxtBase):
             return None
         try:
             result: Dict[str, Any] = self.exchange.withdraw(asset, amount, address, tag, params or {})
-            logger.info(f"Withdraw successful for {amount} {asset} to {address}")
+            self._bump_mutation_epoch()
+            logger.info("Withdraw successful for %s %s to %s", amount, asset, address)
             return result
         except Exception as e:
             self._handle_operation_error("withdraw", e)
@@ -76,6 +96,7 @@ class CcxtWalletManagement(CcxtBase):
     def get_deposit_address(self, asset: str) -> Optional[Dict[str, Any]]:
         """
         Fetches the deposit address for the specified asset.
+        An address fetched less than DEPOSIT_ADDRESS_TTL_SECONDS ago is returned without a new request.
         
         Args:
             asset: The asset to get the deposit address for (e.g., 'BTC', 'ETH')
@@ -87,14 +108,29 @@ class CcxtWalletManagement(CcxtBase):
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot get deposit address.")
             return None
+        cached: Optional[tuple[float, Dict[str, Any]]] = self._deposit_address_cache.get(asset)
+        if cached is not None and time.monotonic() - cached[0] < self.DEPOSIT_ADDRESS_TTL_SECONDS:
+            return cached[1]
         try:
             address: Dict[str, Any] = self.exchange.fetch_deposit_address(asset)
-            logger.info(f"Deposit address fetched for {asset}")
+            logger.info("Deposit address fetched for %s", asset)
+            self._deposit_address_cache.pop(asset, None)
+            if len(self._deposit_address_cache) >= self.DEPOSIT_ADDRESS_CACHE_SIZE:
+                # Evict the least recently fetched address
+                del self._deposit_address_cache[next(iter(self._deposit_address_cache))]
+            self._deposit_address_cache[asset] = (time.monotonic(), address)
             return address
         except Exception as e:
             self._handle_operation_error("fetch_deposit_address", e)
             return None
 
+    def invalidate_deposit_address(self, asset: Optional[str] = None) -> None:
+        """Drops the cached deposit address of asset, or of every asset, e.g. after an address rotation."""
+        if asset is None:
+            self._deposit_address_cache.clear()
+        else:
+            self._deposit_address_cache.pop(asset, None)
+
     def transfer(
         self,
         asset: str,
@@ -123,40 +159,118 @@ class CcxtWalletManagement(CcxtBase):
             result: Dict[str, Any] = self.exchange.transfer(
                 asset, amount, from_account, to_account, params or {}
             )
-            logger.info(f"Transfer of {amount} {asset} from {from_account} to {to_account} successful")
+            self._bump_mutation_epoch()
+            logger.info("Transfer of %s %s from %s to %s successful", amount, asset, from_account, to_account)
             return result
         except Exception as e:
             self._handle_operation_error("transfer", e)
             return None
 
+    def iter_transaction_history(
+        self,
+        asset: Optional[str] = None,
+        since: Optional[int] = None,
+        page_size: int = 100,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Fetches the transaction history one page at a time, oldest first.
+        Each page is requested only when the previous one has been consumed, starting at the last
+        transaction's timestamp so rows sharing that millisecond are not skipped; rows already yielded
+        are dropped by id. Paging stops at a page shorter than page_size.
+        
+        Args:
+            asset: Filter transactions by asset (optional)
+            since: Timestamp in milliseconds for the start time (optional)
+            page_size: Maximum number of transactions per request
+            params: Additional parameters for the API request
+            
+        Yields:
+            List[Dict[str, Any]]: One page of transactions
+
+        Raises:
+            ValueError: If page_size is not positive (raised by this call, before any page is requested).
+            RuntimeError: If the exchange is not initialized.
+            ccxt.BaseError: If a page cannot be fetched.
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}.")
+        if not self.exchange:
+            logger.error("Exchange not initialized. Cannot fetch transaction history.")
+            raise RuntimeError("Exchange not initialized. Cannot fetch transaction history.")
+        return self._transaction_pages(asset, since, page_size, params)
+
+    def _transaction_pages(
+        self,
+        asset: Optional[str],
+        since: Optional[int],
+        page_size: int,
+        params: Optional[Dict[str, Any]]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """The paging generator behind iter_transaction_history, which validates its arguments first."""
+        seen_ids: set[str] = set() # Ids of the yielded rows at `since`, which the next page returns again
+        while True:
+            page: List[Dict[str, Any]] = self.exchange.fetch_transactions(asset, since, page_size, params or {})
+            new_rows: List[Dict[str, Any]] = [tx for tx in page if tx.get('id') is None or tx.get('id') not in seen_ids]
+            if new_rows:
+                yield new_rows
+            if len(page) < page_size:
+                return
+            last_timestamp: Optional[int] = page[-1].get('timestamp')
+            if last_timestamp is None or (since is not None and last_timestamp < since):
+                return  # Cannot tell where the next page starts
+            last_ids: set[str] = {tx['id'] for tx in page if tx.get('timestamp') == last_timestamp and tx.get('id') is not None}
+            if last_timestamp != since:
+                seen_ids = last_ids
+            elif not last_ids <= seen_ids:
+                seen_ids |= last_ids
+            else:
+                # A full page of already seen rows within one millisecond; since cannot page through it, so move past it
+                logger.warning("At least %s transactions share timestamp %s; any beyond them are skipped.", page_size, since)
+                seen_ids = set()
+                last_timestamp += 1
+            since = last_timestamp
+
     def get_transaction_history(
         self,
         asset: Optional[str] = None,
         since: Optional[int] = None,
         limit: Optional[int] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100
     ) -> Optional[List[Dict[str, Any]]]:
         """
-        Fetches the transaction history for the account.
+        Fetches the transaction history for the account, in pages of page_size (see iter_transaction_history).
         
         Args:
             asset: Filter transactions by asset (optional)
             since: Timestamp in milliseconds for the start time (optional)
-            limit: Maximum number of transactions to return (optional)
+            limit: Maximum number of transactions to return (optional); no further pages are requested once reached
             params: Additional parameters for the API request
+            page_size: Maximum number of transactions per request
             
         Returns:
             Optional[List[Dict[str, Any]]]: List of transactions if successful, None otherwise
+
+        Raises:
+            ValueError: If page_size is not positive.
         """
         if not self.exchange:
             logger.error("Exchange not initialized. Cannot fetch transaction history.")
             return None
+        if limit is not None and limit <= 0:
+            return []
+        pages: Iterator[List[Dict[str, Any]]] = self.iter_transaction_history(
+            asset, since, page_size if limit is None else min(page_size, limit), params)
         try:
-            history: List[Dict[str, Any]] = self.exchange.fetch_transactions(
-                asset, since, limit, params or {}
-            )
-            logger.info(f"Fetched {len(history)} transactions")
+            history: List[Dict[str, Any]] = []
+            for page in pages:
+                history.extend(page)
+                if limit is not None and len(history) >= limit:
+                    del history[limit:]
+                    break
+            logger.info("Fetched %s transactions", len(history))
             return history
         except Exception as e:
             self._handle_operation_error("fetch_transactions", e)
-            return None
\ No newline at end of file
+            return None
@@ -1,15 +1,29 @@
 import logging
+import os
 
 logger = logging.getLogger("ccxt_hyperliquid")
-logger.setLevel(logging.INFO)
-
-# Clear existing handlers
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-formatter = logging.Formatter(
-    "[%(asctime)s][%(levelname)s|%(filename)s:%(lineno)s] > %(message)s"
-)
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
\ No newline at end of file
+
+# Configure the handler only once, even if this module is imported under several names or reloaded
+if not getattr(logger, "_configured", False):
+    # LOG_LEVEL=WARNING skips building the INFO messages entirely
+    log_level_name = (os.environ.get("LOG_LEVEL") or "INFO").upper()
+    # getLevelName returns the number of a known level name, and a "Level ..." string for anything else
+    log_level = logging.getLevelName(log_level_name)
+    logger.setLevel(log_level if isinstance(log_level, int) else logging.INFO)
+
+    # Clear existing handlers
+    if logger.hasHandlers():
+        logger.handlers.clear()
+
+    formatter = logging.Formatter(
+        "[%(asctime)s][%(levelname)s|%(filename)s:%(lineno)s] > %(message)s"
+    )
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
+    # Records are written by our own handler only, not formatted again by root handlers set up by dependencies
+    logger.propagate = False
+    logger._configured = True
+
+    if not isinstance(log_level, int):
+        logger.warning("Unknown LOG_LEVEL %r, using INFO.", log_level_name)
@@ -3,68 +3,125 @@ from core import CcxtOrderManagement, FutureExecution, CcxtPortfolioManagement
 from adapter.adapter import SignalTweetAdapter
 from adapter.adapter import SignalTweetDownstream
 from typing import List, Dict, Any
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 from discord_webhook import DiscordWebhook
 from config import get_config
 
+# Positions closed concurrently at most; the exchange's rate limiter still spaces the requests
+MAX_CLOSE_WORKERS: int = 8
+# Trades opened concurrently at most
+MAX_OPEN_WORKERS: int = 4
+# Positions open for longer than this (72 hours) are closed
+MAX_POSITION_AGE_SECONDS: float = 72 * 3600
+# Longest a Discord notification may take to post
+WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+
+@functools.lru_cache(maxsize=None)
+def webhook_url() -> str:
+    """The Discord webhook URL from the config, looked up on first use only."""
+    return get_config(["hyperliquid", "webhook_url"])
+
+def send_notification(message: str) -> threading.Thread:
+    """
+    Posts message to the Discord webhook on a background thread, so the cycle does not wait for Discord.
+    The thread is not a daemon: a process exiting right after main() still delivers the message,
+    within WEBHOOK_TIMEOUT_SECONDS.
+    """
+    def post() -> None:
+        try:
+            DiscordWebhook(url=webhook_url(), content=message, timeout=WEBHOOK_TIMEOUT_SECONDS).execute()
+        except Exception as e:
+            logger.error(f"Failed to send Discord notification: {e}")
+
+    thread: threading.Thread = threading.Thread(target=post, name="discord-webhook")
+    thread.start()
+    return thread
+
 def main():
     # ======== check open_timestamp_utc for close signal ========
 
     order_manager: CcxtOrderManagement = CcxtOrderManagement()
     portfolio_manager: CcxtPortfolioManagement = CcxtPortfolioManagement()
 
+    # The signals do not depend on the exchange, so they are fetched in the background while positions are checked
+    adapter: SignalTweetAdapter = SignalTweetAdapter()
+    signal_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+    signals_future: Future = signal_pool.submit(adapter.get_signal, use_tp_sl=False, usdc_amount=15)
+    signal_pool.shutdown(wait=False)
+
     holding_positions: List[Dict[str, Any]] = portfolio_manager.get_positions_summary()
  
     current_time_utc: datetime = datetime.now(timezone.utc)
 
+    # Positions open for more than MAX_POSITION_AGE_SECONDS, with how long they have been open
+    now_ms: int = int(current_time_utc.timestamp() * 1000)
+    cutoff_ms: int = now_ms - int(MAX_POSITION_AGE_SECONDS * 1000)
+    stale_positions: Dict[str, timedelta] = {}
     for pos in holding_positions:
-        if pos['open_timestamp_utc'] is not None:
-            open_time_utc: datetime = datetime.fromisoformat(pos['open_timestamp_utc'])
-            time_difference: timedelta = current_time_utc - open_time_utc
-            if time_difference > timedelta(hours=72): 
-                order_manager.close_position_by_symbol(pos['symbol'])  
-                logger.info(f"Closed position for {pos['symbol']} as it has been open for {time_difference}.")
+        open_ms: int | None = pos['open_timestamp_ms']
+        if open_ms is not None:
+            if open_ms < cutoff_ms:
+                stale_positions[pos['symbol']] = timedelta(milliseconds=now_ms - open_ms)
             else:
-                logger.info(f"Position for {pos['symbol']} has been open for {time_difference}. Not closing yet.")
+                logger.info("Position for %s has been open for %s. Not closing yet.", pos['symbol'], timedelta(milliseconds=now_ms - open_ms))
+
+    positions_changed: bool = False # Whether holding_positions is outdated by a close made below
+    if stale_positions:
+        # Each close is a blocking round trip to the exchange, so they run on a small thread pool
+        with ThreadPoolExecutor(max_workers=min(MAX_CLOSE_WORKERS, len(stale_positions))) as pool:
+            futures: Dict[Future, str] = {pool.submit(order_manager.close_position_by_symbol, symbol): symbol for symbol in stale_positions}
+            for future in as_completed(futures):
+                symbol: str = futures[future]
+                try:
+                    if future.result():
+                        positions_changed = True
+                        logger.info("Closed position for %s as it has been open for %s.", symbol, stale_positions[symbol])
+                except Exception as e:
+                    logger.error(f"Failed to close position for {symbol}: {e}")
 
     # ======== Check signal to close and open position ========
 
-    adapter: SignalTweetAdapter = SignalTweetAdapter()
-    signals: List[SignalTweetDownstream] = adapter.get_signal(use_tp_sl=False, usdc_amount=15) 
+    signals: List[SignalTweetDownstream] = signals_future.result()
 
     if not signals:
         logger.info("No signals generated.")  
         return
     else:
-        logger.info(f"Generated {len(signals)} signals.") 
-    holding_positions: List[Dict[str, Any]] = portfolio_manager.get_positions_summary()
-    filtered_duplicated = portfolio_manager.drop_duplicate_signals(signals)
-    logger.info(f"Filtered duplicated: {filtered_duplicated}")
-    filtered_position_in_port = portfolio_manager.filter_out_position_in_portfolio(filtered_duplicated, holding_positions)
-    logger.info(f"Filtered position in portfolio: {filtered_position_in_port}")
-    signal_should_open, signal_should_close = portfolio_manager.categorize_signals(filtered_duplicated, holding_positions) 
-    logger.info(f"Signal should open: {len(signal_should_open)}")
-    logger.info(f"Signal should close: {len(signal_should_close)}")
+        logger.info("Generated %s signals.", len(signals)) 
+    if positions_changed:
+        holding_positions = portfolio_manager.get_positions_summary()
+    filtered_duplicated, filtered_position_in_port, signal_should_open, signal_should_close = \
+        portfolio_manager.classify_signals(signals, holding_positions)
+    logger.info("Filtered duplicated: %s", filtered_duplicated)
+    logger.info("Filtered position in portfolio: %s", filtered_position_in_port)
+    logger.info("Signal should open: %s", len(signal_should_open))
+    logger.info("Signal should close: %s", len(signal_should_close))
+    closed_count: int = 0
     if signal_should_close:
         for sig in signal_should_close:
-            order_manager.close_position_by_symbol(sig.symbol)
-            logger.info(f"Have signal in opposite side, closed position for {sig.symbol}.")
+            if order_manager.close_position_by_symbol(sig.symbol):
+                closed_count += 1
+                logger.info("Have signal in opposite side, closed position for %s.", sig.symbol)
         
     # ======== Check signal to open position ========
     
     MAX_ALLOWED_POSITIONS = 10
-    positions_count = portfolio_manager.positions_count() 
+    # Close signals only exist for held positions (one per symbol), so each submitted close above removed one of them
+    positions_count: int = len(holding_positions) - closed_count
     available_slots: int = MAX_ALLOWED_POSITIONS - positions_count
 
     signals_to_open_now: list[Any] = []
 
     if signal_should_open:
         if available_slots <= 0:
-            logger.warning(f"Portfolio is full. Cannot open new positions. Current count: {positions_count}.")
+            logger.warning("Portfolio is full. Cannot open new positions. Current count: %s.", positions_count)
         else: 
             if len(signal_should_open) > available_slots:
-                logger.warning(f"There are {len(signal_should_open)} new signals, but only {available_slots} slot(s) available. "
-                               f"Only the first {available_slots} signal(s) will be processed.")
+                logger.warning("There are %s new signals, but only %s slot(s) available. Only the first %s signal(s) will be processed.",
+                               len(signal_should_open), available_slots, available_slots)
                 signals_to_open_now = signal_should_open[:available_slots]
             else:
                 # There is enough space for all new signals.
@@ -73,29 +130,36 @@ def main():
     # Proceed to open positions for the selected signals.
     executor: FutureExecution = FutureExecution()
     if signals_to_open_now:
-        logger.info(f"Proceeding to open {len(signals_to_open_now)} new position(s).")
+        logger.info("Proceeding to open %s new position(s).", len(signals_to_open_now))
         notification_message: str = ""
-        for sig in signals_to_open_now:
-            try: 
-                executor.execute_trade(
+        # Trades go out concurrently; each one makes several requests (leverage, order, TP/SL), hence the smaller pool
+        with ThreadPoolExecutor(max_workers=min(MAX_OPEN_WORKERS, len(signals_to_open_now))) as pool:
+            trade_futures: Dict[Future, SignalTweetDownstream] = {
+                pool.submit(
+                    executor.execute_trade,
                     symbol=sig.symbol, 
                     side=sig.side, 
                     target_usdc_amount=sig.target_usdc_amount,
                     leverage=2,
                     stop_loss_price=sig.sl_price,
                     take_profit_price=sig.tp_price
-                )
-                notification_message += f"SUCCESS: Order placed for {sig.side.upper()} {sig.symbol} with amount {sig.target_usdc_amount} USDC.\n"
-                logger.info(f"SUCCESS: Order placed for {sig.side.upper()} {sig.symbol} with amount {sig.target_usdc_amount} USDC.")
+                ): sig
+                for sig in signals_to_open_now
+            }
+            for future in as_completed(trade_futures):
+                sig = trade_futures[future]
+                try: 
+                    future.result()
+                    notification_message += f"SUCCESS: Order placed for {sig.side.upper()} {sig.symbol} with amount {sig.target_usdc_amount} USDC.\n"
+                    logger.info("SUCCESS: Order placed for %s %s with amount %s USDC.", sig.side.upper(), sig.symbol, sig.target_usdc_amount)
 
-            except Exception as e:
-                logger.error(f"FAILED to place order for {sig.symbol}. Reason: {e}")
+                except Exception as e:
+                    logger.error(f"FAILED to place order for {sig.symbol}. Reason: {e}")
         if notification_message:
-            webhook = DiscordWebhook(url=get_config(["hyperliquid", "webhook_url"]), content=notification_message)
-            webhook.execute()
-        portfolio_manager = CcxtPortfolioManagement()
+            send_notification(notification_message)
         positions = portfolio_manager.get_positions_summary()
-        logger.info(f"Positions: {positions}")
+        logger.info("%s open positions after this cycle.", len(positions))
+        logger.debug("Positions: %s", positions)
     else:
         logger.info("No new positions will be opened in this cycle.")
 
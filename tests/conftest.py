@@ -0,0 +1,241 @@
+"""
+Shared fixtures for the unit tests.
+
+The package normally lives inside a host application that provides the `config` module and imports this
+tree both as `ccxt_hyperliquid` and through the top-level `core` and `log` names. The layout is rebuilt here
+so the modules can be imported on their own. The `core` package __init__ is not executed, since it pulls in
+the signal adapter and with it the host's database helpers; no test needs them.
+
+Exchanges are replaced by small in-memory stubs, so no test makes a network request.
+"""
+import importlib
+import sys
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+def _install_package_layout() -> None:
+    if 'config' not in sys.modules:
+        config = types.ModuleType('config')
+        config.get_config = lambda path: None
+        sys.modules['config'] = config
+
+    package = types.ModuleType('ccxt_hyperliquid')
+    package.__path__ = [str(ROOT)]
+    sys.modules['ccxt_hyperliquid'] = package
+    core = types.ModuleType('ccxt_hyperliquid.core')
+    core.__path__ = [str(ROOT / 'core')]
+    sys.modules['ccxt_hyperliquid.core'] = core
+    package.core = core
+
+    log = importlib.import_module('ccxt_hyperliquid.log')
+    sys.modules['log'] = log
+    sys.modules['log.logger'] = importlib.import_module('ccxt_hyperliquid.log.logger')
+
+    core.CcxtOrderManagement = importlib.import_module('ccxt_hyperliquid.core.order_management').CcxtOrderManagement
+    core.CcxtWalletManagement = importlib.import_module('ccxt_hyperliquid.core.wallet_management').CcxtWalletManagement
+    sys.modules['core'] = core
+    importlib.import_module('ccxt_hyperliquid.core.executor')
+
+
+_install_package_layout()
+
+from ccxt_hyperliquid.ccxt_base import CcxtBase  # noqa: E402
+from ccxt_hyperliquid.core.executor import AsyncFutureExecution, FutureExecution  # noqa: E402
+from ccxt_hyperliquid.core.order_management import CcxtOrderManagement  # noqa: E402
+from ccxt_hyperliquid.core.wallet_management import CcxtWalletManagement  # noqa: E402
+
+SYMBOL: str = 'BTC/USDC:USDC'
+
+
+def market(amount_precision: Any = 0.001, active: bool = True) -> Dict[str, Any]:
+    """A ccxt market structure with the fields the executor reads."""
+    return {
+        'active': active,
+        'precision': {'amount': amount_precision},
+        'limits': {'cost': {'min': 10}, 'amount': {'min': None}},
+    }
+
+
+class StubExchange:
+    """
+    Stands in for ccxt.hyperliquid. Every call is recorded in `calls`; create_orders answers with
+    `create_orders_response` (or calls it with the orders when it is callable).
+    """
+
+    id: str = 'hyperliquid'
+    walletAddress: str = '0xwallet'
+    privateKey: str = '0xkey'
+
+    def __init__(self) -> None:
+        self.calls: List[tuple] = []
+        self.has: Dict[str, bool] = {'createOrders': True, 'cancelAllOrders': False, 'cancelOrders': False}
+        self.markets: Dict[str, Any] = {SYMBOL: market()}
+        self.currencies: Dict[str, Any] = {}
+        self.ticker: Dict[str, Any] = {'last': 100.0, 'bid': 99.95, 'ask': 100.05}
+        self.balance: Dict[str, Any] = {'USDC': {'free': 1000.0}}
+        self.create_orders_response: Any = None
+        self.open_orders: List[Dict[str, Any]] = []
+        self.transactions: List[Dict[str, Any]] = []
+        self._order_ids: int = 0
+
+    def _next_id(self) -> str:
+        self._order_ids += 1
+        return f"o{self._order_ids}"
+
+    def create_order(self, symbol, type, side, amount, price=None, params=None) -> Dict[str, Any]:
+        self.calls.append(('create_order', symbol, type, side, amount))
+        return {'id': self._next_id(), 'symbol': symbol, 'type': type, 'side': side, 'amount': amount, 'info': {}}
+
+    def create_orders(self, orders, params=None) -> List[Dict[str, Any]]:
+        self.calls.append(('create_orders', [o['symbol'] for o in orders]))
+        response = self.create_orders_response
+        if callable(response):
+            return response(orders)
+        if response is not None:
+            return response
+        return [{'id': self._next_id(), 'symbol': o['symbol'], 'info': {}} for o in orders]
+
+    def cancel_order(self, order_id, symbol) -> Dict[str, Any]:
+        self.calls.append(('cancel_order', order_id, symbol))
+        return {'id': order_id, 'info': {}}
+
+    def set_leverage(self, leverage, symbol, params=None) -> Dict[str, Any]:
+        self.calls.append(('set_leverage', symbol, leverage))
+        return {}
+
+    def fetch_ticker(self, symbol) -> Dict[str, Any]:
+        self.calls.append(('fetch_ticker', symbol))
+        return self.ticker
+
+    def fetch_tickers(self, symbols) -> Dict[str, Dict[str, Any]]:
+        self.calls.append(('fetch_tickers', list(symbols)))
+        return {symbol: self.ticker for symbol in symbols}
+
+    def fetch_balance(self, params=None) -> Dict[str, Any]:
+        self.calls.append(('fetch_balance',))
+        return self.balance
+
+    def fetch_open_orders(self, symbol=None) -> List[Dict[str, Any]]:
+        self.calls.append(('fetch_open_orders', symbol))
+        return self.open_orders
+
+    def fetch_transactions(self, code, since, limit, params) -> List[Dict[str, Any]]:
+        self.calls.append(('fetch_transactions', since, limit))
+        rows = sorted(self.transactions, key=lambda tx: tx['timestamp'])
+        return [tx for tx in rows if since is None or tx['timestamp'] >= since][:limit]
+
+
+class StubAsyncExchange:
+    """Stands in for a ccxt.async_support client; cancellation results can be replaced per test."""
+
+    def __init__(self, exchange: StubExchange) -> None:
+        self.exchange: StubExchange = exchange
+        self.session: Optional[Any] = None
+        self.calls: List[tuple] = []
+        self.cancel_orders_result: Callable[[List[str], str], Any] = lambda ids, symbol: [{'id': i, 'info': {}} for i in ids]
+        self.cancel_order_result: Callable[[str, str], Any] = lambda order_id, symbol: {'id': order_id, 'info': {}}
+
+    def set_markets(self, markets, currencies=None) -> None:
+        self.calls.append(('set_markets',))
+
+    async def cancel_all_orders(self) -> List[Any]:
+        self.calls.append(('cancel_all_orders',))
+        return []
+
+    async def cancel_orders(self, ids, symbol) -> Any:
+        self.calls.append(('cancel_orders', list(ids), symbol))
+        result = self.cancel_orders_result(ids, symbol)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def cancel_order(self, order_id, symbol) -> Any:
+        self.calls.append(('cancel_order', order_id, symbol))
+        result = self.cancel_order_result(order_id, symbol)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def fetch_open_orders(self, symbol=None) -> List[Dict[str, Any]]:
+        self.calls.append(('fetch_open_orders', symbol))
+        return self.exchange.open_orders
+
+    async def fetch_ticker(self, symbol) -> Dict[str, Any]:
+        return self.exchange.ticker
+
+    async def fetch_balance(self, params=None) -> Dict[str, Any]:
+        return self.exchange.balance
+
+    async def close(self) -> None:
+        self.calls.append(('close',))
+
+
+@pytest.fixture
+def exchange() -> StubExchange:
+    """Installs a StubExchange as the shared exchange and resets the class-level caches around the test."""
+    stub = StubExchange()
+    saved = (CcxtBase._exchange, CcxtBase._markets, CcxtBase._markets_reloaded_at)
+    CcxtBase._exchange, CcxtBase._markets = stub, stub.markets
+    # A reload right away would replace the stub markets
+    CcxtBase._markets_reloaded_at = float('inf')
+    yield stub
+    CcxtBase._exchange, CcxtBase._markets, CcxtBase._markets_reloaded_at = saved
+    CcxtOrderManagement._positions_cache = None
+    CcxtWalletManagement._wallet_balance_cache.clear()
+    FutureExecution._ticker_cache.clear()
+    FutureExecution._market_info_cache.clear()
+
+
+@pytest.fixture
+def order_manager(exchange: StubExchange) -> CcxtOrderManagement:
+    """A CcxtOrderManagement on the stub exchange, built without the singleton's network initialization."""
+    manager: CcxtOrderManagement = object.__new__(CcxtOrderManagement)
+    manager.mark_price_cache = None
+    manager._has_create_orders = exchange.has['createOrders']
+    manager._has_set_leverage = True
+    manager._has_fetch_tickers = True
+    manager._has_cancel_all_orders = exchange.has['cancelAllOrders']
+    manager._has_cancel_orders = exchange.has['cancelOrders']
+    manager.async_exchange = StubAsyncExchange(exchange)
+    manager._create_async_exchange = lambda: manager.async_exchange
+    return manager
+
+
+@pytest.fixture
+def wallet_manager(exchange: StubExchange) -> CcxtWalletManagement:
+    return object.__new__(CcxtWalletManagement)
+
+
+def _build_executor(cls: type, order_manager: CcxtOrderManagement, wallet_manager: CcxtWalletManagement) -> Any:
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = object.__new__(cls)
+    executor.order_manager = order_manager
+    executor.wallet_manager = wallet_manager
+    executor._preflight_pool = ThreadPoolExecutor(max_workers=4)
+    executor._leverage_cache = {}
+    return executor
+
+
+@pytest.fixture
+def executor(order_manager: CcxtOrderManagement, wallet_manager: CcxtWalletManagement) -> FutureExecution:
+    executor: FutureExecution = _build_executor(FutureExecution, order_manager, wallet_manager)
+    yield executor
+    executor._preflight_pool.shutdown()
+
+
+@pytest.fixture
+def async_executor(order_manager: CcxtOrderManagement, wallet_manager: CcxtWalletManagement) -> AsyncFutureExecution:
+    executor: AsyncFutureExecution = _build_executor(AsyncFutureExecution, order_manager, wallet_manager)
+    executor._loop = None
+    executor._session = None
+    executor._async_exchange = order_manager.async_exchange
+    executor._async_markets = None
+    yield executor
+    executor._preflight_pool.shutdown()
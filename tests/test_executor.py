@@ -0,0 +1,172 @@
+import asyncio
+from decimal import Decimal
+
+import ccxt
+import pytest
+
+from ccxt_hyperliquid.core.executor import _ceil_to_precision, _floor_to_precision, _precision_spec
+from conftest import SYMBOL, market
+
+OTHER_SYMBOL: str = 'ETH/USDC:USDC'
+
+
+@pytest.mark.parametrize('precision, mode, quantum', [
+    (0.01, 'decimal', Decimal('0.01')),
+    (1e-13, 'decimal', Decimal('1e-13')),
+    (0.25, 'step', Decimal('0.25')),
+    (5e-05, 'step', Decimal('0.00005')),
+    (1, 'integer', Decimal(1)),
+    (10, 'integer', Decimal(1)),
+    (0, 'fallback', Decimal('0.01')),
+    (None, 'fallback', Decimal('0.01')),
+    ('0.1', 'fallback', Decimal('0.01')),
+])
+def test_precision_spec_modes(precision, mode, quantum):
+    spec = _precision_spec(precision)
+    assert spec.mode == mode
+    assert spec.quantum == quantum
+
+
+@pytest.mark.parametrize('value, precision, floor, ceil', [
+    (0.29, 0.01, 0.29, 0.29),  # 0.29 * 100 is 28.999999999999996 in floats
+    (1.3, 0.25, 1.25, 1.5),
+    (0.123456, 5e-05, 0.12345, 0.1235),
+    (37, 10, 30, 40),
+    (1.234, None, 1.23, 1.24),
+])
+def test_rounding_to_step(value, precision, floor, ceil):
+    assert _floor_to_precision(value, precision) == floor
+    assert _ceil_to_precision(value, precision) == ceil
+
+
+@pytest.mark.parametrize('precision, step', [(0.01, 0.01), (0.25, 0.25)])
+def test_floor_to_precision_keeps_one_step_for_positive_values(precision, step):
+    assert _floor_to_precision(precision / 10, precision) == step
+
+
+def test_preflight_returns_fetched_state(executor, exchange):
+    market_active, ticker, market_info, balances = executor._preflight(SYMBOL)
+
+    assert market_active is True
+    assert ticker == exchange.ticker
+    assert market_info == exchange.markets[SYMBOL]
+    assert balances == exchange.balance
+
+
+def test_preflight_reuses_given_ticker_and_market(executor, exchange):
+    given_market = market()
+    market_active, ticker, market_info, _ = executor._preflight(SYMBOL, {'last': 5.0}, given_market)
+
+    assert (market_active, ticker, market_info) == (True, {'last': 5.0}, given_market)
+    assert ('fetch_ticker', SYMBOL) not in exchange.calls
+
+
+def test_create_orders_batch_returns_none_when_batching_unsupported(executor, order_manager):
+    order_manager._has_create_orders = False
+
+    assert executor._create_orders_batch([{'symbol': SYMBOL}]) is None
+
+
+def test_batched_trade_places_main_and_protective_orders(executor, exchange):
+    result = executor.execute_trade(SYMBOL, 'buy', target_usdc_amount=20, take_profit_price=110, stop_loss_price=95)
+
+    assert [call[0] for call in exchange.calls if call[0].startswith('create')] == ['create_orders']
+    assert result['main_order']['id'] and result['stop_loss_order']['id'] and result['take_profit_order']['id']
+
+
+def test_rejected_main_order_cancels_accepted_siblings(executor, exchange):
+    exchange.create_orders_response = [
+        {'id': None, 'info': {'error': 'Insufficient margin'}},
+        {'id': 'sl1', 'info': {}},
+        {'id': 'tp1', 'info': {}},
+    ]
+
+    with pytest.raises(ccxt.InvalidOrder, match='Insufficient margin'):
+        executor.execute_trade(SYMBOL, 'buy', target_usdc_amount=20, take_profit_price=110, stop_loss_price=95)
+
+    assert [call for call in exchange.calls if call[0] == 'cancel_order'] == [
+        ('cancel_order', 'sl1', SYMBOL),
+        ('cancel_order', 'tp1', SYMBOL),
+    ]
+
+
+def test_rejected_main_order_skips_rejected_siblings(executor, exchange):
+    exchange.create_orders_response = [
+        {'id': None, 'info': {'error': 'Insufficient margin'}},
+        {'id': None, 'info': {'error': 'Reduce only order would increase position'}},
+        {'id': 'tp1', 'info': {}},
+    ]
+
+    with pytest.raises(ccxt.InvalidOrder):
+        executor.execute_trade(SYMBOL, 'buy', target_usdc_amount=20, take_profit_price=110, stop_loss_price=95)
+
+    assert [call for call in exchange.calls if call[0] == 'cancel_order'] == [('cancel_order', 'tp1', SYMBOL)]
+
+
+def test_failed_sibling_cancellation_is_logged_not_raised(executor, exchange, caplog):
+    def cancel_order(order_id, symbol):
+        raise ccxt.NetworkError('timeout')
+
+    exchange.cancel_order = cancel_order
+    executor._cancel_orphaned_orders(SYMBOL, [{'id': 'sl1', 'info': {}}, None])
+
+    assert 'Failed to cancel order sl1' in caplog.text
+
+
+def test_execute_batch_submits_vectorized_rows_in_one_request(executor, exchange):
+    exchange.markets[OTHER_SYMBOL] = market()
+
+    results = executor.execute_batch([SYMBOL, OTHER_SYMBOL], ['buy', 'sell'], [20, 20], [1, 1])
+
+    assert all(result and result['id'] for result in results)
+    assert [call for call in exchange.calls if call[0].startswith('create')] == [('create_orders', [SYMBOL, OTHER_SYMBOL])]
+
+
+def test_execute_batch_sends_unsized_rows_through_execute_trade(executor, exchange):
+    # A step that is not a power of ten cannot be sized by the vectorized path
+    exchange.markets[OTHER_SYMBOL] = market(amount_precision=0.25)
+
+    results = executor.execute_batch([SYMBOL, OTHER_SYMBOL], ['buy', 'buy'], [20, 20], [1, 1])
+
+    assert results[0]['id'] and results[1]['id']
+    creates = [call for call in exchange.calls if call[0].startswith('create')]
+    assert creates[0] == ('create_orders', [SYMBOL])
+    assert creates[1][:2] == ('create_order', OTHER_SYMBOL)
+    assert creates[1][4] % 0.25 == 0
+
+
+def test_execute_batch_leaves_failed_fallback_rows_empty(executor, exchange):
+    exchange.markets[OTHER_SYMBOL] = market(active=False)
+
+    results = executor.execute_batch([SYMBOL, OTHER_SYMBOL], ['buy', 'buy'], [20, 20], [1, 1])
+
+    assert results[0]['id'] and results[1] is None
+
+
+def test_execute_batch_allocates_margin_only_to_submitted_rows(executor, exchange):
+    third_symbol = 'SOL/USDC:USDC'
+    exchange.markets[OTHER_SYMBOL] = market()
+    exchange.markets[third_symbol] = market()
+    exchange.balance = {'USDC': {'free': 130.0}}
+    set_leverage = exchange.set_leverage
+
+    def failing_set_leverage(leverage, symbol, params=None):
+        if symbol == SYMBOL:
+            raise ccxt.ExchangeError('leverage rejected')
+        return set_leverage(leverage, symbol, params)
+
+    exchange.set_leverage = failing_set_leverage
+
+    results = executor.execute_batch([SYMBOL, OTHER_SYMBOL, third_symbol], ['buy'] * 3, [100, 100, 20], [1, 1, 1])
+
+    # The first row's margin is not held back after its leverage failed, so both later rows fit
+    assert results[0] is None
+    assert results[1]['id'] and results[2]['id']
+
+
+def test_async_execute_batch_runs_fallback_rows(async_executor, exchange):
+    exchange.markets[OTHER_SYMBOL] = market(amount_precision=0.25)
+
+    results = asyncio.run(async_executor.execute_batch([OTHER_SYMBOL], ['buy'], [20], [1]))
+
+    assert results[0]['id']
@@ -0,0 +1,127 @@
+import asyncio
+
+import ccxt
+import pytest
+
+from ccxt_hyperliquid.core import order_management
+from conftest import SYMBOL
+
+OTHER_SYMBOL: str = 'ETH/USDC:USDC'
+
+
+def order(symbol: str = SYMBOL, side: str = 'buy') -> dict:
+    return {'symbol': symbol, 'type': 'market', 'side': side, 'amount': 1.0, 'price': 100.0, 'params': {}}
+
+
+def test_create_orders_batch_splits_requests_at_the_batch_limit(order_manager, exchange, monkeypatch):
+    monkeypatch.setattr(order_management, '_BATCH_ORDER_LIMIT', 2)
+
+    results = order_manager.create_orders_batch([order() for _ in range(5)])
+
+    assert len(results) == 5 and all(result['id'] for result in results)
+    assert [len(call[1]) for call in exchange.calls if call[0] == 'create_orders'] == [2, 2, 1]
+
+
+def test_create_orders_batch_maps_rejected_and_missing_entries_to_errors(order_manager, exchange):
+    exchange.create_orders_response = [{'id': 'a', 'info': {}}, {'id': None, 'info': {'error': 'Price too far'}}]
+
+    results = order_manager.create_orders_batch([order(), order(OTHER_SYMBOL), order(side='sell')])
+
+    assert results[0]['id'] == 'a'
+    assert isinstance(results[1], ccxt.InvalidOrder) and 'Price too far' in str(results[1])
+    assert isinstance(results[2], ccxt.InvalidOrder) and 'No result returned' in str(results[2])
+
+
+def test_create_orders_batch_fails_every_order_of_a_failed_request(order_manager, exchange, monkeypatch):
+    monkeypatch.setattr(order_management, '_BATCH_ORDER_LIMIT', 2)
+    calls = []
+
+    def create_orders(orders, params=None):
+        calls.append(len(orders))
+        if len(calls) == 1:
+            raise ccxt.NetworkError('timeout')
+        return [{'id': f"x{i}", 'info': {}} for i in range(len(orders))]
+
+    exchange.create_orders = create_orders
+
+    results = order_manager.create_orders_batch([order() for _ in range(3)])
+
+    assert all(isinstance(result, ccxt.NetworkError) for result in results[:2])
+    assert results[2]['id'] == 'x0'
+
+
+def test_create_orders_batch_places_orders_one_by_one_without_create_orders(order_manager, exchange):
+    order_manager._has_create_orders = False
+
+    results = order_manager.create_orders_batch([order(), {**order(), 'amount': 0}])
+
+    assert results[0]['id']
+    assert isinstance(results[1], ValueError)
+    assert [call[0] for call in exchange.calls] == ['create_order']
+
+
+def test_close_all_orders_uses_cancel_all_orders_when_supported(order_manager, exchange):
+    order_manager._has_cancel_all_orders = True
+
+    asyncio.run(order_manager.close_all_orders_async())
+
+    assert order_manager.async_exchange.calls == [('cancel_all_orders',), ('close',)]
+    assert ('fetch_open_orders', None) not in exchange.calls
+
+
+def test_close_all_orders_without_open_orders_makes_no_cancel_requests(order_manager, exchange):
+    asyncio.run(order_manager.close_all_orders_async())
+
+    assert order_manager.async_exchange.calls == []
+
+
+def test_close_all_orders_groups_cancel_orders_by_symbol(order_manager, exchange):
+    order_manager._has_cancel_orders = True
+    exchange.open_orders = [
+        {'id': '1', 'symbol': SYMBOL},
+        {'id': '2', 'symbol': OTHER_SYMBOL},
+        {'id': '3', 'symbol': SYMBOL},
+        {'id': None, 'symbol': SYMBOL},
+    ]
+
+    asyncio.run(order_manager.close_all_orders_async())
+
+    cancels = [call for call in order_manager.async_exchange.calls if call[0] == 'cancel_orders']
+    assert sorted(cancels) == [('cancel_orders', ['1', '3'], SYMBOL), ('cancel_orders', ['2'], OTHER_SYMBOL)]
+
+
+def test_close_all_orders_continues_past_failed_cancellations(order_manager, exchange, caplog):
+    exchange.open_orders = [{'id': '1', 'symbol': SYMBOL}, {'id': '2', 'symbol': SYMBOL}, {'id': '3', 'symbol': OTHER_SYMBOL}]
+    async_exchange = order_manager.async_exchange
+    async_exchange.cancel_order_result = lambda order_id, symbol: (
+        ccxt.OrderNotFound('already filled') if order_id == '2' else {'id': order_id, 'info': {}}
+    )
+
+    asyncio.run(order_manager.close_all_orders_async())
+
+    assert sorted(call[1] for call in async_exchange.calls if call[0] == 'cancel_order') == ['1', '2', '3']
+    assert async_exchange.calls[-1] == ('close',)
+    assert '2 of 3 cancelled' in caplog.text
+
+
+def test_close_all_orders_rechecks_orders_listed_too_long_ago(order_manager, exchange, monkeypatch):
+    order_manager._has_cancel_orders = True
+    exchange.open_orders = [{'id': '1', 'symbol': SYMBOL}, {'id': '2', 'symbol': SYMBOL}]
+    monkeypatch.setattr(type(order_manager), 'OPEN_ORDERS_RECHECK_SECONDS', -1.0)
+    async_exchange = order_manager.async_exchange
+
+    async def fetch_open_orders(symbol=None):
+        return [{'id': '2', 'symbol': SYMBOL}]
+
+    async_exchange.fetch_open_orders = fetch_open_orders
+
+    asyncio.run(order_manager.close_all_orders_async())
+
+    assert [call for call in async_exchange.calls if call[0] == 'cancel_orders'] == [('cancel_orders', ['2'], SYMBOL)]
+
+
+def test_close_all_orders_requires_an_exchange(order_manager, exchange, monkeypatch):
+    monkeypatch.setattr(type(order_manager).__mro__[1], '_exchange', None)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(order_manager.close_all_orders_async())
@@ -0,0 +1,80 @@
+import pytest
+
+
+def transactions(*timestamps: int) -> list:
+    return [{'id': str(i), 'timestamp': ts} for i, ts in enumerate(timestamps)]
+
+
+def collect(wallet_manager, page_size: int, since=None) -> list:
+    return [tx['id'] for page in wallet_manager.iter_transaction_history(since=since, page_size=page_size) for tx in page]
+
+
+def test_pages_resume_at_the_last_timestamp_until_a_short_page(wallet_manager, exchange):
+    exchange.transactions = transactions(1, 2, 3, 4, 5, 6)
+
+    pages = list(wallet_manager.iter_transaction_history(page_size=3))
+
+    # Each request starts at the previous page's last timestamp, whose row is not yielded again
+    assert [[tx['id'] for tx in page] for page in pages] == [['0', '1', '2'], ['3', '4'], ['5']]
+    assert [call[1] for call in exchange.calls] == [None, 3, 5]
+
+
+def test_rows_sharing_the_last_timestamp_are_not_skipped(wallet_manager, exchange):
+    # The first page ends inside the run of timestamp 2
+    exchange.transactions = transactions(1, 2, 2, 2, 3)
+
+    assert collect(wallet_manager, page_size=3) == ['0', '1', '2', '3', '4']
+
+
+def test_rows_repeated_on_the_next_page_are_yielded_once(wallet_manager, exchange):
+    exchange.transactions = transactions(1, 2, 3, 3, 4, 5, 6)
+
+    ids = collect(wallet_manager, page_size=4)
+
+    assert ids == sorted(set(ids), key=int) and len(ids) == 7
+
+
+def test_full_page_within_one_millisecond_moves_on(wallet_manager, exchange, caplog):
+    exchange.transactions = transactions(5, 5, 5, 6)
+
+    ids = collect(wallet_manager, page_size=2)
+
+    # Only page_size rows of one millisecond can be reached; paging continues after it instead of looping
+    assert ids == ['0', '1', '3']
+    assert 'share timestamp 5' in caplog.text
+
+
+def test_exact_multiple_of_page_size_ends_with_an_empty_page(wallet_manager, exchange):
+    exchange.transactions = transactions(1, 2, 3, 4)
+
+    assert collect(wallet_manager, page_size=2) == ['0', '1', '2', '3']
+    assert len([call for call in exchange.calls if call[0] == 'fetch_transactions']) == 4
+
+
+def test_rows_without_id_are_kept(wallet_manager, exchange):
+    exchange.transactions = [{'id': None, 'timestamp': 1}, {'id': 'a', 'timestamp': 2}]
+
+    assert len(collect(wallet_manager, page_size=5)) == 2
+
+
+@pytest.mark.parametrize('page_size', [0, -1])
+def test_non_positive_page_size_is_rejected_up_front(wallet_manager, exchange, page_size):
+    with pytest.raises(ValueError):
+        wallet_manager.iter_transaction_history(page_size=page_size)
+    with pytest.raises(ValueError):
+        wallet_manager.get_transaction_history(page_size=page_size)
+    assert exchange.calls == []
+
+
+def test_get_transaction_history_stops_at_limit(wallet_manager, exchange):
+    exchange.transactions = transactions(*range(10))
+
+    history = wallet_manager.get_transaction_history(limit=5, page_size=3)
+
+    assert [tx['id'] for tx in history] == ['0', '1', '2', '3', '4']
+    assert all(call[2] == 3 for call in exchange.calls)
+
+
+def test_get_transaction_history_with_zero_limit_is_empty(wallet_manager, exchange):
+    assert wallet_manager.get_transaction_history(limit=0) == []
+    assert exchange.calls == []